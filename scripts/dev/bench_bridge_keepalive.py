@@ -0,0 +1,88 @@
+"""Per-call latency of bridge routes: one-shot urllib connections vs the keep-alive pool.
+
+Runs against a local stand-in listener (the addon's ``_BridgeRequestHandler``
+answering ``system.ping``), so no Blender is required:
+
+    python scripts/dev/bench_bridge_keepalive.py --calls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from typing import Callable, List
+from urllib import request
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+
+
+class _LegacyHandler(_BridgeRequestHandler):
+    """Listener behaviour before keep-alive support (connection closed per request)."""
+
+    protocol_version = "HTTP/1.0"
+
+
+def _one_shot_call(base_url: str) -> Callable[[], dict]:
+    def call() -> dict:
+        body = json.dumps({"route": "system.ping", "payload": {}}).encode("utf-8")
+        req = request.Request(
+            f"{base_url}/bridge/route", data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with request.urlopen(req, timeout=5.0) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    return call
+
+
+def _measure(call: Callable[[], dict], calls: int) -> List[float]:
+    samples: List[float] = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        resp = call()
+        samples.append((time.perf_counter() - start) * 1e6)
+        if not resp.get("ok"):
+            raise SystemExit(f"Bridge call failed: {resp}")
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{label:<22} mean={statistics.mean(samples):8.1f}us  p50={statistics.median(samples):8.1f}us  p99={p99:8.1f}us")
+
+
+def _serve(handler_cls) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    legacy = _serve(_LegacyHandler)
+    pooled = _serve(_BridgeRequestHandler)
+    try:
+        before = _measure(_one_shot_call(f"http://127.0.0.1:{legacy.server_address[1]}"), args.calls)
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{pooled.server_address[1]}", timeout=5.0)
+        after = _measure(lambda: handler("system.ping", {}), args.calls)
+    finally:
+        legacy.shutdown()
+        pooled.shutdown()
+
+    print(f"{args.calls} sequential system.ping calls")
+    _report("before (one-shot)", before)
+    _report("after (keep-alive)", after)
+    print(f"pool stats: {handler.pool.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
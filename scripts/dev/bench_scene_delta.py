@@ -0,0 +1,88 @@
+"""Snapshot delta cost: whole-dict comparison vs ``SnapshotDiffer`` (kept records or fingerprints).
+
+For each size, two snapshots are generated, with ``--changed`` of the objects
+moved and a few added/removed. The baseline rebuilds name->object dicts for
+both snapshots and compares whole records with ``!=`` (the previous
+``compute_delta``). ``SnapshotDiffer`` already holds the first snapshot's
+state, as it does in a chain of snapshots; the state it keeps beyond the
+snapshot itself is reported as retained memory (fingerprint mode lets the
+caller drop the previous records). The encoded size of the patches is
+compared with the whole changed records. No Blender is required:
+
+    python scripts/dev/bench_scene_delta.py --sizes 10000,100000,1000000 --changed 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from mcpbla.server.bridge.scene_delta import SnapshotDiffer
+
+
+def _object(i: int, x: float = 0.0) -> Dict[str, Any]:
+    return {
+        "name": f"Object.{i:07d}",
+        "type": "MESH",
+        "location": [x, float(i), 0.0],
+        "rotation_euler": [0.0, 0.0, 0.0],
+        "scale": [1.0, 1.0, 1.0],
+        "material": "Default",
+    }
+
+
+def _whole_dict_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    old_objs = {obj.get("name"): obj for obj in old.get("objects", [])}
+    new_objs = {obj.get("name"): obj for obj in new.get("objects", [])}
+    added = [name for name in new_objs if name not in old_objs]
+    changed = [name for name in new_objs if name in old_objs and old_objs[name] != new_objs[name]]
+    removed = [name for name in old_objs if name not in new_objs]
+    return {"objects_added": added, "objects_removed": removed, "objects_changed": changed}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--changed", type=float, default=0.01, help="fraction of objects moved between snapshots")
+    args = parser.parse_args()
+
+    for count in (int(size) for size in args.sizes.split(",")):
+        step = max(1, int(1 / args.changed)) if args.changed > 0 else count + 1
+        old = {"objects": [_object(i) for i in range(count)]}
+        # Fresh records for every object, as after decoding a new snapshot body.
+        new = {"objects": [_object(i, 1.0 if i % step == 0 else 0.0) for i in range(10, count + 10)]}
+
+        start = time.perf_counter()
+        baseline = _whole_dict_delta(old, new)
+        whole = time.perf_counter() - start
+
+        print(f"{count:>8} objects  whole-dict {whole * 1e3:8.1f} ms")
+        for fingerprints in (False, True):
+            differ = SnapshotDiffer(fingerprints=fingerprints)
+            gc.collect()
+            tracemalloc.start()
+            differ.diff(old)
+            retained = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+            tracemalloc.stop()
+            start = time.perf_counter()
+            delta = differ.diff(new)
+            elapsed = time.perf_counter() - start
+            assert [p["name"] for p in delta["objects_changed"]] == baseline["objects_changed"]
+            label = "fingerprints" if fingerprints else "kept records"
+            print(f"{'':>17}{label:>12} {elapsed * 1e3:8.1f} ms   state {retained:7.1f} MiB")
+
+        by_name = {obj["name"]: obj for obj in new["objects"]}
+        records = len(json.dumps([by_name[p["name"]] for p in delta["objects_changed"]]))
+        patches = len(json.dumps(delta["objects_changed"]))
+        print(f"{'':>17}{len(delta['objects_changed'])} changed: patches {patches / 1024:.1f} KiB vs records {records / 1024:.1f} KiB")
+        del old, new, differ, delta, baseline, by_name
+        gc.collect()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
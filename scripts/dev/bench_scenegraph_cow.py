@@ -0,0 +1,107 @@
+"""Concurrent reads and writes on the copy-on-write ``SceneGraphLiveV3``.
+
+A writer thread applies batches of transform events (one revision each) while
+reader threads take ``view()`` snapshots, look up objects and poll
+``describe(since=...)``. Reported: revisions/s, reads/s, read and write
+latency percentiles, the memory a revision adds on top of the previous one,
+and what a deep copy of the same state (``scene_state`` style) would cost per
+read. No Blender is required:
+
+    python scripts/dev/bench_scenegraph_cow.py --objects 100000 --readers 4 --seconds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import random
+import threading
+import time
+import tracemalloc
+from typing import Dict, List
+
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1e6
+
+
+def _run(sg: SceneGraphLiveV3, names: List[str], readers: int, seconds: float, batch: int) -> Dict[str, List[float]]:
+    stop = threading.Event()
+    write_times: List[float] = []
+    read_times: List[List[float]] = [[] for _ in range(readers)]
+
+    def writer() -> None:
+        rng = random.Random(1)
+        step = 0
+        while not stop.is_set():
+            step += 1
+            events = [("object.transformed", {"name": n, "location": [step, 0.0, 0.0]}) for n in rng.sample(names, batch)]
+            start = time.perf_counter()
+            sg.on_events(events)
+            write_times.append(time.perf_counter() - start)
+
+    def reader(samples: List[float]) -> None:
+        rng = random.Random(len(samples))
+        since = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            view = sg.view()
+            view.objects.get(names[rng.randrange(len(names))])
+            delta = view.describe(since=since)
+            since = delta["revision"]
+            samples.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(s,)) for s in read_times]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return {"write": write_times, "read": [x for s in read_times for x in s]}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--batch", type=int, default=100, help="objects moved per revision")
+    args = parser.parse_args()
+
+    names = [f"Object.{i:06d}" for i in range(args.objects)]
+    snapshot = {"objects": [{"name": n, "type": "MESH", "location": [0.0, 0.0, 0.0]} for n in names]}
+    sg = SceneGraphLiveV3()
+    start = time.perf_counter()
+    sg.apply_snapshot(snapshot)
+    print(f"load {args.objects} objects: {time.perf_counter() - start:.2f}s")
+
+    result = _run(sg, names, args.readers, args.seconds, args.batch)
+    writes, reads = result["write"], result["read"]
+    print(f"revisions/s {len(writes) / args.seconds:10.0f}   write p50 {_percentile(writes, 0.5):8.0f}us  p99 {_percentile(writes, 0.99):8.0f}us")
+    print(f"reads/s     {len(reads) / args.seconds:10.0f}   read  p50 {_percentile(reads, 0.5):8.0f}us  p99 {_percentile(reads, 0.99):8.0f}us")
+
+    gc.collect()
+    tracemalloc.start()
+    held = []
+    for step in range(20):
+        sg.on_events([("object.transformed", {"name": n, "location": [-step, 0.0, 0.0]}) for n in names[step :: args.objects // args.batch]])
+        held.append(sg.view())
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"memory per retained revision ({args.batch} objects moved): {retained / len(held) / 1024:.0f} KiB")
+
+    start = time.perf_counter()
+    copy.deepcopy({"objects": dict(sg.objects.items())})
+    print(f"deep-copy read of the same state (scene_state style): {(time.perf_counter() - start) * 1e3:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
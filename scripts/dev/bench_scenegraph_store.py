@@ -0,0 +1,87 @@
+"""Memory and scan cost of the dict vs columnar object stores of ``SceneGraphLiveV3``.
+
+Builds both stores from the same snapshot records and reports their retained
+memory, the time to materialize every record (``describe``) and the time to
+scan one transform column. The full ``SceneGraphLiveV3`` line adds the
+search index and change log on top. No Blender is required:
+
+    python scripts/dev/bench_scenegraph_store.py --objects 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from mcpbla.server.bridge.object_store import ColumnarMap
+from mcpbla.server.bridge.persistent_map import PersistentMap
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _body(count: int) -> bytes:
+    objects = [
+        {"name": f"Object.{i:06d}", "type": "MESH", "location": [float(i), 0.0, 0.0], "rotation_euler": [0.0, 0.0, 0.0], "scale": [1.0, 1.0, 1.0]}
+        for i in range(count)
+    ]
+    return json.dumps({"objects": objects}).encode()
+
+
+def _retained(build: Callable[[], Any]) -> Tuple[Any, float]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained / (1024 * 1024)
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _scan_dicts(store: PersistentMap) -> float:
+    return sum(obj["location"][0] for obj in store.values())
+
+
+def _scan_column(store: ColumnarMap) -> float:
+    _, column = store.column("location")
+    return sum(column[0::3])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=200000)
+    args = parser.parse_args()
+    body = _body(args.objects)
+
+    for store in (PersistentMap, ColumnarMap):
+        objects, mib = _retained(lambda: store.from_dict({obj["name"]: obj for obj in json.loads(body)["objects"]}))
+        describe = _timed(lambda: list(objects.values()))
+        scan = _timed(lambda: _scan_column(objects) if store is ColumnarMap else _scan_dicts(objects))
+        print(f"{store.__name__:>14}  {args.objects} objects  {mib:8.1f} MiB   describe {describe:6.2f}s   location scan {scan:6.3f}s")
+        del objects
+
+    for mode in ("dict", "columnar"):
+        os.environ["MCP_SCENEGRAPH_STORE"] = mode
+        graph, mib = _retained(lambda: _load(body))
+        print(f"SceneGraphLiveV3[{mode}] incl. search index  {mib:8.1f} MiB")
+        del graph
+    return 0
+
+
+def _load(body: bytes) -> SceneGraphLiveV3:
+    graph = SceneGraphLiveV3()
+    graph.apply_snapshot(json.loads(body))
+    return graph
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
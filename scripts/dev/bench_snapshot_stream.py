@@ -0,0 +1,78 @@
+"""Transient memory of snapshot transfer: one JSON document vs paged NDJSON ingestion.
+
+Both paths end with the same objects stored in ``scenegraph_live`` and
+``SceneGraphLiveV3``; the interesting number is the peak *above* that retained
+state (encoded body, parsed copy, validation buffers). No Blender is required:
+
+    python scripts/dev/bench_snapshot_stream.py --objects 50000 --page-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator
+
+from mcpbla.server.bridge import scenegraph_live
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+from mcpbla.server.bridge.snapshot_stream import encode_records, ingest_stream
+
+
+def _object(i: int) -> Dict[str, Any]:
+    return {
+        "name": f"Object.{i:06d}",
+        "type": "MESH",
+        "location": [float(i), 0.0, 0.0],
+        "rotation_euler": [0.0, 0.0, 0.0],
+        "scale": [1.0, 1.0, 1.0],
+    }
+
+
+def _records(count: int, page_size: int) -> Iterator[Dict[str, Any]]:
+    yield {"type": "header", "session_id": "bench", "metadata": {"scene": "Scene"}}
+    for start in range(0, count, page_size):
+        yield {"type": "page", "objects": [_object(i) for i in range(start, min(count, start + page_size))]}
+    yield {"type": "end", "count": count}
+
+
+def _whole_document(count: int, page_size: int) -> None:
+    body = json.dumps({"session_id": "bench", "objects": [_object(i) for i in range(count)], "metadata": {}}).encode()
+    snapshot = json.loads(body)
+    del body
+    scenegraph_live.store_snapshot(scenegraph_live.SceneSnapshot(snapshot["session_id"], snapshot["objects"], snapshot["metadata"]))
+    SceneGraphLiveV3().apply_snapshot(snapshot)
+
+
+def _streamed(count: int, page_size: int) -> None:
+    ingest_stream(encode_records(_records(count, page_size)), SceneGraphLiveV3())
+
+
+def _measure(fn: Callable[[int, int], None], count: int, page_size: int) -> float:
+    scenegraph_live.clear_registry()
+    gc.collect()
+    tracemalloc.start()
+    fn(count, page_size)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scenegraph_live.clear_registry()
+    return (peak - retained) / (1024 * 1024)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    for count in (args.objects // 10, args.objects):
+        whole = _measure(_whole_document, count, args.page_size)
+        streamed = _measure(_streamed, count, args.page_size)
+        print(f"{count:>8} objects  whole-document transient {whole:8.1f} MiB   streamed transient {streamed:6.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
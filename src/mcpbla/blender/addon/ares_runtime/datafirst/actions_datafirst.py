@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import bpy  # type: ignore
 except Exception:  # pragma: no cover
     bpy = None
 
-from mcpbla.blender.addon.ares_runtime.helpers.object_utils import ensure_mesh_object, set_object_location
+from mcpbla.blender.addon.ares_runtime.helpers.object_utils import (
+    ensure_mesh_object,
+    get_or_create_collection,
+    link_objects_bulk,
+    new_mesh,
+    set_object_location,
+)
 from mcpbla.blender.addon.ares_runtime.helpers.undo_utils import push_undo_step
 from .event_emitter import emit_event
 
 
-def create_cube(name: str, size: float) -> Dict[str, Any]:
-    if bpy is None:
-        return {"ok": False, "error": "bpy unavailable"}
-    push_undo_step("create_cube")
+_CUBE_FACES = [
+    (0, 1, 3, 2),
+    (4, 6, 7, 5),
+    (0, 4, 5, 1),
+    (2, 3, 7, 6),
+    (1, 5, 7, 3),
+    (0, 2, 6, 4),
+]
+
+
+def _cube_geometry(size: float) -> Tuple[List[Tuple[float, float, float]], List[Tuple[int, int, int, int]]]:
     half = size / 2.0
     verts = [
         (-half, -half, -half),
@@ -27,14 +40,14 @@ def create_cube(name: str, size: float) -> Dict[str, Any]:
         (half, half, -half),
         (half, half, half),
     ]
-    faces = [
-        (0, 1, 3, 2),
-        (4, 6, 7, 5),
-        (0, 4, 5, 1),
-        (2, 3, 7, 6),
-        (1, 5, 7, 3),
-        (0, 2, 6, 4),
-    ]
+    return verts, _CUBE_FACES
+
+
+def create_cube(name: str, size: float) -> Dict[str, Any]:
+    if bpy is None:
+        return {"ok": False, "error": "bpy unavailable"}
+    push_undo_step("create_cube")
+    verts, faces = _cube_geometry(size)
     obj = ensure_mesh_object(name, verts, faces)
     if isinstance(obj, dict) and not obj.get("ok", True):
         return obj
@@ -46,6 +59,38 @@ def create_cube(name: str, size: float) -> Dict[str, Any]:
     return result
 
 
+def create_primitives(
+    names: List[str],
+    sizes: List[float],
+    locations: Optional[Sequence[float]] = None,
+    rotations: Optional[Sequence[float]] = None,
+    scales: Optional[Sequence[float]] = None,
+    collection: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Create many cubes at once; cubes of the same size share one mesh (linked duplicates)."""
+    if bpy is None:
+        return {"ok": False, "error": "bpy unavailable"}
+    if len(sizes) != len(names):
+        return {"ok": False, "error": "names and sizes must have the same length"}
+    # foreach_set fails only after every object exists, so check the arrays first.
+    for label, values in (("locations", locations), ("rotations", rotations), ("scales", scales)):
+        if values is not None and len(values) != 3 * len(names):
+            return {"ok": False, "error": f"{label} must hold 3 values per name ({3 * len(names)}), got {len(values)}"}
+    push_undo_step("create_primitives")
+    meshes: Dict[float, Any] = {}
+    new_object = bpy.data.objects.new
+    objects = []
+    for name, size in zip(names, sizes):
+        mesh = meshes.get(size)
+        if mesh is None:
+            verts, faces = _cube_geometry(size)
+            mesh = meshes[size] = new_mesh(f"Cube_{size:g}", verts, faces)
+        objects.append(new_object(name, mesh))
+    link_objects_bulk(objects, get_or_create_collection(collection), locations, rotations, scales)
+    created = [obj.name for obj in objects]
+    return {"ok": True, "data": {"names": created, "count": len(created), "meshes": len(meshes)}}
+
+
 def move_object(name: str, translation: Dict[str, float]) -> Dict[str, Any]:
     if bpy is None:
         return {"ok": False, "error": "bpy unavailable"}
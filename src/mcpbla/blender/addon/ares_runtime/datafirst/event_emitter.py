@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+# The data-first runtime shares the bridge's queued, batched event sender.
+from mcpbla.blender.addon.bridge.event_emitter import emit_event  # noqa: F401
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 try:
     import bpy  # type: ignore
@@ -12,22 +12,33 @@ from mcpbla.blender.addon.ares_runtime.helpers.undo_utils import push_undo_step
 from .event_emitter import emit_event
 
 
-def assign_material(obj_name: str, material_name: str, color: List[float]) -> Dict[str, Any]:
+def assign_material(
+    obj_name: str,
+    material_name: str,
+    color: List[float],
+    recipe: str = "principled",
+    settings: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Assign ``material_name`` to an object, creating it from the ``recipe`` template if needed."""
     if bpy is None:
         return {"ok": False, "error": "bpy unavailable"}
     obj = bpy.data.objects.get(obj_name)
     if obj is None:
         return {"ok": False, "error": f"Object '{obj_name}' not found"}
+    recipe = recipe or "principled"
+    if recipe not in material_utils.RECIPES:
+        return {"ok": False, "error": f"Unknown material recipe '{recipe}'"}
     push_undo_step("assign_material")
-    mat = material_utils.ensure_material(material_name)
-    if isinstance(mat, dict):  # error response
-        return mat
-    principled = material_utils.ensure_principled(mat)
-    material_utils.set_base_color(principled, color)
-    material_utils.ensure_material_output(mat)
-    material_utils.link_principled_to_output(mat, principled)
+    mat = bpy.data.materials.get(material_name)
+    if mat is None:
+        mat = material_utils.material_from_template(material_name, recipe, color, settings)
+        if isinstance(mat, dict):  # error response
+            return mat
+    else:
+        mat.use_nodes = True
+        material_utils.patch_material(mat, recipe, color, settings)
     material_utils.assign_material_to_object(obj, mat)
-    result = {"ok": True, "data": {"object": obj.name, "material": mat.name, "color": color}}
+    result = {"ok": True, "data": {"object": obj.name, "material": mat.name, "color": color, "recipe": recipe}}
     try:
         emit_event("material.updated", {"object": obj.name, "material": mat.name})
     except Exception:
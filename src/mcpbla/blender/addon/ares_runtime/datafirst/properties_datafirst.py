@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover
+    bpy = None
+
+from mcpbla.blender.addon.ares_runtime.helpers.undo_utils import push_undo_step
+
+
+def _foreach_write(coll: Any, names: List[str], attr: str, values: Sequence[Any], width: int) -> List[str]:
+    """Write ``attr`` for ``names`` through ``foreach_get``/``foreach_set`` on the whole collection.
+
+    ``foreach_set`` addresses every item of a collection, so a subset is
+    written by reading the full column, patching the requested slots and
+    writing it back; both copies happen in C. Returns the names not found.
+    """
+    keys = coll.keys()
+    if names == keys:
+        coll.foreach_set(attr, values)
+        return []
+    index = {key: i for i, key in enumerate(keys)}
+    column = [0.0] * (len(keys) * width)
+    coll.foreach_get(attr, column)
+    missing = []
+    for i, name in enumerate(names):
+        j = index.get(name)
+        if j is None:
+            missing.append(name)
+            continue
+        column[j * width : (j + 1) * width] = values[i * width : (i + 1) * width]
+    coll.foreach_set(attr, column)
+    return missing
+
+
+def _loop_write(coll: Any, names: List[str], path: str, values: Sequence[Any], width: int) -> List[str]:
+    owner_path, _, attr = path.rpartition(".")
+    get = coll.get
+    missing = []
+    for i, name in enumerate(names):
+        block = get(name)
+        if block is None:
+            missing.append(name)
+            continue
+        target = block.path_resolve(owner_path) if owner_path else block
+        setattr(target, attr, values[i] if width == 1 else values[i * width : (i + 1) * width])
+    return missing
+
+
+def set_properties_bulk(writes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply columnar property writes: ``{collection, names, path, values}`` with flat ``values``.
+
+    Plain attributes of the datablocks (``location``, ``energy``, ``color``)
+    go through ``foreach_set``; nested paths (``data.energy``, node socket
+    values) and properties ``foreach_set`` rejects fall back to a setattr loop.
+    """
+    if bpy is None:
+        return {"ok": False, "error": "bpy unavailable"}
+    # Check every write before touching anything, so a bad column cannot leave earlier ones applied.
+    planned = []
+    for write in writes:
+        name_list = list(write.get("names") or [])
+        path = write.get("path") or ""
+        values = write.get("values") or []
+        coll = getattr(bpy.data, write.get("collection") or "", None)
+        if coll is None or not hasattr(coll, "foreach_set"):
+            return {"ok": False, "error": f"Unknown datablock collection '{write.get('collection')}'"}
+        if not name_list or not path or len(values) % len(name_list):
+            return {"ok": False, "error": f"Values for '{path}' must hold the same number of entries per name"}
+        planned.append((write.get("collection"), coll, name_list, path, values, len(values) // len(name_list)))
+    push_undo_step("set_properties")
+    summary = []
+    vectorized = False
+    error = None
+    for collection, coll, name_list, path, values, width in planned:
+        mode = "loop"
+        if "." not in path and "[" not in path:
+            try:
+                missing = _foreach_write(coll, name_list, path, values, width)
+                mode = "foreach"
+                vectorized = True
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+        if mode == "loop":
+            try:
+                missing = _loop_write(coll, name_list, path, values, width)
+            except (AttributeError, TypeError, ValueError) as exc:
+                # Some datablocks of this write may already be set; report what was applied so far.
+                error = f"Cannot set '{path}': {exc}"
+                break
+        summary.append({"collection": collection, "path": path, "count": len(name_list) - len(missing), "missing": missing, "mode": mode})
+    if vectorized:
+        # foreach_set bypasses RNA update callbacks; refresh the depsgraph once for the whole call.
+        bpy.context.view_layer.update()
+    if error:
+        return {"ok": False, "error": error, "data": {"writes": summary}}
+    return {"ok": True, "data": {"writes": summary}}
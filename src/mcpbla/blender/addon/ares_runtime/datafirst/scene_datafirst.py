@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional, Set
 
 try:
     import bpy  # type: ignore
@@ -8,7 +8,99 @@ except Exception:  # pragma: no cover
     bpy = None
 
 
-def snapshot(session_id: str | None = None) -> Dict[str, Any]:
+DEFAULT_PAGE_SIZE = 500
+# Removed names remembered for ``since_revision`` queries; older queries get a full snapshot.
+MAX_REMOVED_HISTORY = 10000
+
+
+class _DirtyTracker:
+    """Revision counter and per-object change log fed by ``depsgraph_update_post``.
+
+    ``changed``/``added``/``removed`` map object names to the revision at which
+    that happened. Membership (adds, removes, renames) is only re-diffed when
+    the depsgraph reports a scene or collection update. ``floor`` is the oldest
+    revision a delta can be computed from; frame changes and file loads raise
+    it so the next poll gets a full snapshot.
+    """
+
+    def __init__(self) -> None:
+        self.revision = 0
+        self.floor = 0
+        self.active = False
+        self.known: Set[str] = set()
+        self.changed: Dict[str, int] = {}
+        self.added: Dict[str, int] = {}
+        self.removed: Dict[str, int] = {}
+
+    def reset(self, scene: Any = None) -> None:
+        self.revision += 1
+        self.floor = self.revision
+        self.changed.clear()
+        self.added.clear()
+        self.removed.clear()
+        self.known = set(scene.objects.keys()) if scene is not None else set()
+
+    def on_depsgraph_update(self, scene: Any, depsgraph: Any) -> None:
+        object_type = bpy.types.Object
+        touched = []
+        membership = False
+        for update in depsgraph.updates:
+            block = update.id
+            if isinstance(block, object_type):
+                touched.append(getattr(block, "original", block).name)
+            elif isinstance(block, (bpy.types.Scene, bpy.types.Collection)):
+                membership = True
+        if not touched and not membership:
+            return
+        self.revision += 1
+        rev = self.revision
+        for name in touched:
+            self.changed[name] = rev
+        if membership:
+            current = set(scene.objects.keys())
+            for name in current - self.known:
+                self.added[name] = self.changed[name] = rev
+                self.removed.pop(name, None)
+            for name in self.known - current:
+                self.removed[name] = rev
+                self.changed.pop(name, None)
+                self.added.pop(name, None)
+            self.known = current
+            if len(self.removed) > MAX_REMOVED_HISTORY:
+                oldest = sorted(self.removed.items(), key=lambda item: item[1])[: len(self.removed) - MAX_REMOVED_HISTORY]
+                for name, _ in oldest:
+                    del self.removed[name]
+                self.floor = max(self.floor, oldest[-1][1])
+
+    def on_frame_change(self, scene: Any, *_args: Any) -> None:
+        # Animated transforms change without depsgraph_update_post; fall back to a full snapshot.
+        self.revision += 1
+        self.floor = self.revision
+
+    def stats(self) -> Dict[str, Any]:
+        return {"active": self.active, "revision": self.revision, "floor": self.floor, "dirty": len(self.changed), "removed": len(self.removed)}
+
+
+TRACKER = _DirtyTracker()
+
+
+def _object_record(obj) -> Dict[str, Any]:
+    return {
+        "name": obj.name,
+        "type": obj.type,
+        "location": [float(v) for v in obj.location[:]],
+        "rotation_euler": [float(v) for v in obj.rotation_euler[:]],
+        "scale": [float(v) for v in obj.scale[:]],
+    }
+
+
+def snapshot(session_id: str | None = None, since_revision: Optional[int] = None) -> Dict[str, Any]:
+    """Full scene snapshot, or with ``since_revision`` only what changed after that revision.
+
+    A delta carries ``added``/``changed`` object records and ``removed`` names.
+    When dirty tracking is off or ``since_revision`` predates ``TRACKER.floor``
+    a full snapshot is returned with ``full: true``; both carry ``revision``.
+    """
     if bpy is None:
         return {"ok": False, "error": "bpy unavailable"}
 
@@ -16,26 +108,97 @@ def snapshot(session_id: str | None = None) -> Dict[str, Any]:
     if scene is None:
         return {"ok": False, "error": "No active scene"}
 
-    objects = []
-    for obj in scene.objects:
-        objects.append(
-            {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [float(v) for v in obj.location[:]],
-                "rotation_euler": [float(v) for v in obj.rotation_euler[:]],
-                "scale": [float(v) for v in obj.scale[:]],
-            }
-        )
-
     metadata = {
         "scene": scene.name,
         "frame_current": scene.frame_current,
     }
+    data: Dict[str, Any] = {"session_id": session_id or "default", "revision": TRACKER.revision, "metadata": metadata}
+
+    if since_revision is not None and TRACKER.active and TRACKER.floor <= since_revision <= TRACKER.revision:
+        objects = scene.objects
+        added, changed = [], []
+        removed = [name for name, rev in TRACKER.removed.items() if rev > since_revision]
+        for name, rev in TRACKER.changed.items():
+            if rev <= since_revision:
+                continue
+            obj = objects.get(name)
+            if obj is None:
+                removed.append(name)
+            elif TRACKER.added.get(name, 0) > since_revision:
+                added.append(_object_record(obj))
+            else:
+                changed.append(_object_record(obj))
+        data.update({"since_revision": since_revision, "full": False, "added": added, "changed": changed, "removed": removed})
+        return {"ok": True, "data": data}
+
+    data["objects"] = [_object_record(obj) for obj in scene.objects]
+    if since_revision is not None:
+        data["full"] = True
+    return {"ok": True, "data": data}
 
-    data = {
+
+def iter_snapshot_records(session_id: str | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield a snapshot as NDJSON records: ``header``, ``page`` (``page_size`` objects each), ``end``.
+
+    Only one page of object records is alive at a time, so memory stays flat
+    regardless of scene size.
+    """
+    if bpy is None:
+        yield {"type": "error", "error": "bpy unavailable"}
+        return
+    scene = bpy.context.scene if bpy.context else None
+    if scene is None:
+        yield {"type": "error", "error": "No active scene"}
+        return
+
+    yield {
+        "type": "header",
         "session_id": session_id or "default",
-        "objects": objects,
-        "metadata": metadata,
+        "metadata": {"scene": scene.name, "frame_current": scene.frame_current},
     }
-    return {"ok": True, "data": data}
+    page = []
+    count = 0
+    for obj in scene.objects:
+        page.append(_object_record(obj))
+        if len(page) >= page_size:
+            count += len(page)
+            yield {"type": "page", "objects": page}
+            page = []
+    if page:
+        count += len(page)
+        yield {"type": "page", "objects": page}
+    yield {"type": "end", "count": count}
+
+
+def _on_depsgraph_update(scene: Any, depsgraph: Any) -> None:
+    TRACKER.on_depsgraph_update(scene, depsgraph)
+
+
+def _on_frame_change(scene: Any, *args: Any) -> None:
+    TRACKER.on_frame_change(scene)
+
+
+def _on_load_post(*_args: Any) -> None:
+    TRACKER.reset(bpy.context.scene)
+
+
+_HANDLERS = (("depsgraph_update_post", _on_depsgraph_update), ("frame_change_post", _on_frame_change), ("load_post", _on_load_post))
+
+
+def register_handlers() -> None:
+    persistent = getattr(bpy.app.handlers, "persistent", lambda fn: fn)
+    for attr, fn in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, attr)
+        fn = persistent(fn)
+        if fn not in handlers:
+            handlers.append(fn)
+    TRACKER.reset(bpy.context.scene)
+    TRACKER.active = True
+
+
+def unregister_handlers() -> None:
+    for attr, fn in _HANDLERS:
+        handlers = getattr(bpy.app.handlers, attr)
+        if fn in handlers:
+            handlers.remove(fn)
+    TRACKER.active = False
@@ -1,12 +1,46 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import bpy  # type: ignore
 except Exception:  # pragma: no cover
     bpy = None
 
+# Per-material node lookup, ``{material name: {node.type: node}}``; dropped on depsgraph updates.
+_NODE_INDEX: Dict[str, Dict[str, Any]] = {}
+# Recipe key -> name of the prebuilt template material in ``bpy.data.materials``.
+_TEMPLATES: Dict[str, str] = {}
+_TEMPLATE_PREFIX = ".mcpbla_template_"
+_CACHE_STATS = {"index_hits": 0, "index_builds": 0, "template_builds": 0, "template_copies": 0}
+
+
+def node_index(mat) -> Dict[str, Any]:
+    """``{node.type: node}`` for ``mat``'s node tree, built with one scan and cached.
+
+    The first node of each type wins, except that the active material output
+    is preferred. An entry is rebuilt when the node count no longer matches.
+    """
+    nodes = mat.node_tree.nodes
+    entry = _NODE_INDEX.get(mat.name)
+    if entry is not None and entry["count"] == len(nodes):
+        _CACHE_STATS["index_hits"] += 1
+        return entry["types"]
+    types: Dict[str, Any] = {}
+    for node in nodes:
+        if node.type not in types or (node.type == "OUTPUT_MATERIAL" and getattr(node, "is_active_output", False)):
+            types[node.type] = node
+    _NODE_INDEX[mat.name] = {"count": len(nodes), "types": types}
+    _CACHE_STATS["index_builds"] += 1
+    return types
+
+
+def invalidate_node_index(name: Optional[str] = None) -> None:
+    if name is None:
+        _NODE_INDEX.clear()
+    else:
+        _NODE_INDEX.pop(name, None)
+
 
 def ensure_material(name: str):
     if bpy is None:
@@ -21,21 +55,21 @@ def ensure_material(name: str):
 def ensure_principled(mat):
     if bpy is None:
         return None
-    nodes = mat.node_tree.nodes
-    principled = nodes.get("Principled BSDF")
+    principled = node_index(mat).get("BSDF_PRINCIPLED")
     if principled:
         return principled
-    return nodes.new(type="ShaderNodeBsdfPrincipled")
+    invalidate_node_index(mat.name)
+    return mat.node_tree.nodes.new(type="ShaderNodeBsdfPrincipled")
 
 
 def ensure_material_output(mat):
     if bpy is None:
         return None
-    nodes = mat.node_tree.nodes
-    outputs = [n for n in nodes if n.type == "OUTPUT_MATERIAL"]
-    if outputs:
-        return outputs[0]
-    return nodes.new(type="ShaderNodeOutputMaterial")
+    output = node_index(mat).get("OUTPUT_MATERIAL")
+    if output:
+        return output
+    invalidate_node_index(mat.name)
+    return mat.node_tree.nodes.new(type="ShaderNodeOutputMaterial")
 
 
 def link_principled_to_output(mat, principled):
@@ -76,3 +110,113 @@ def set_base_color(principled, rgb: List[float]):
     b = float(max(0.0, min(1.0, rgb[2] if len(rgb) > 2 else 1.0)))
     principled.inputs["Base Color"].default_value = (r, g, b, 1.0)
     return {"ok": True, "data": {"color": [r, g, b]}}
+
+
+def _build_principled(mat) -> None:
+    principled = ensure_principled(mat)
+    link_principled_to_output(mat, principled)
+
+
+def _patch_principled(mat, color: List[float], settings: Dict[str, Any]) -> None:
+    set_base_color(ensure_principled(mat), color)
+
+
+def _build_noise(mat) -> None:
+    _build_principled(mat)
+    links = mat.node_tree.links
+    nodes = mat.node_tree.nodes
+    noise = nodes.new(type="ShaderNodeTexNoise")
+    ramp = nodes.new(type="ShaderNodeValToRGB")
+    links.new(noise.outputs["Fac"], ramp.inputs["Fac"])
+    links.new(ramp.outputs["Color"], ensure_principled(mat).inputs["Base Color"])
+
+
+def _patch_noise(mat, color: List[float], settings: Dict[str, Any]) -> None:
+    index = node_index(mat)
+    rgb = [float(max(0.0, min(1.0, c))) for c in (list(color) + [1.0, 1.0, 1.0])[:3]]
+    index["VALTORGB"].color_ramp.elements[-1].color = (*rgb, 1.0)
+    if "scale" in settings:
+        index["TEX_NOISE"].inputs["Scale"].default_value = float(settings["scale"])
+
+
+# recipe -> (build the template's node tree once, patch a copy's parameters)
+RECIPES: Dict[str, Tuple[Callable[[Any], None], Callable[[Any, List[float], Dict[str, Any]], None]]] = {
+    "principled": (_build_principled, _patch_principled),
+    "noise": (_build_noise, _patch_noise),
+}
+
+
+def template_material(recipe: str):
+    """The prebuilt material for ``recipe``; built on first use and kept with a fake user."""
+    mat = bpy.data.materials.get(_TEMPLATES.get(recipe, ""))
+    if mat is None:
+        mat = bpy.data.materials.new(_TEMPLATE_PREFIX + recipe)
+        mat.use_nodes = True
+        mat.use_fake_user = True
+        RECIPES[recipe][0](mat)
+        _TEMPLATES[recipe] = mat.name
+        _CACHE_STATS["template_builds"] += 1
+    return mat
+
+
+def material_from_template(name: str, recipe: str, color: List[float], settings: Optional[Dict[str, Any]] = None):
+    """Create material ``name`` by copying the ``recipe`` template and patching its parameters.
+
+    ``mat.copy()`` duplicates the whole node tree in C, so a new material costs
+    one copy plus a few socket writes instead of rebuilding and relinking nodes.
+    """
+    if bpy is None:
+        return {"ok": False, "error": "bpy unavailable"}
+    if recipe not in RECIPES:
+        return {"ok": False, "error": f"Unknown material recipe '{recipe}'"}
+    mat = template_material(recipe).copy()
+    mat.name = name
+    mat.use_fake_user = False
+    _CACHE_STATS["template_copies"] += 1
+    RECIPES[recipe][1](mat, color, settings or {})
+    return mat
+
+
+def patch_material(mat, recipe: str, color: List[float], settings: Optional[Dict[str, Any]] = None) -> None:
+    """Update an existing material's recipe parameters, adding the principled setup if it is missing."""
+    if recipe == "principled" or "VALTORGB" not in node_index(mat):
+        principled = ensure_principled(mat)
+        set_base_color(principled, color)
+        link_principled_to_output(mat, principled)
+    else:
+        RECIPES[recipe][1](mat, color, settings or {})
+
+
+def cache_stats() -> Dict[str, Any]:
+    return {**_CACHE_STATS, "indexed_materials": len(_NODE_INDEX), "templates": sorted(_TEMPLATES)}
+
+
+def _on_depsgraph_update(scene: Any, depsgraph: Any) -> None:
+    material_type = getattr(getattr(bpy, "types", None), "Material", None)
+    for update in depsgraph.updates:
+        block = update.id
+        if material_type is not None and isinstance(block, material_type):
+            _NODE_INDEX.pop(block.name, None)
+        elif getattr(block, "bl_idname", None) == "ShaderNodeTree":
+            # Embedded node trees do not carry their material's name.
+            _NODE_INDEX.clear()
+            return
+
+
+def _on_load_post(*_args: Any) -> None:
+    _NODE_INDEX.clear()
+    _TEMPLATES.clear()
+
+
+def register_handlers() -> None:
+    persistent = getattr(bpy.app.handlers, "persistent", lambda fn: fn)
+    for handlers, fn in ((bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update), (bpy.app.handlers.load_post, _on_load_post)):
+        fn = persistent(fn)
+        if fn not in handlers:
+            handlers.append(fn)
+
+
+def unregister_handlers() -> None:
+    for handlers, fn in ((bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update), (bpy.app.handlers.load_post, _on_load_post)):
+        if fn in handlers:
+            handlers.remove(fn)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 try:
     import bpy  # type: ignore
@@ -8,17 +8,61 @@ except Exception:  # pragma: no cover
     bpy = None
 
 
-def ensure_mesh_object(name: str, verts: Iterable, faces: Iterable) -> Any:
-    if bpy is None:
-        return {"ok": False, "error": "bpy unavailable"}
+def new_mesh(name: str, verts: Iterable, faces: Iterable) -> Any:
     mesh = bpy.data.meshes.new(name)
     mesh.from_pydata(verts, [], faces)
     mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
+    return mesh
+
+
+def ensure_mesh_object(name: str, verts: Iterable, faces: Iterable) -> Any:
+    if bpy is None:
+        return {"ok": False, "error": "bpy unavailable"}
+    obj = bpy.data.objects.new(name, new_mesh(name, verts, faces))
     bpy.context.scene.collection.objects.link(obj)
     return obj
 
 
+def get_or_create_collection(name: Optional[str]) -> Any:
+    """Named collection (created and linked under the scene if missing); the scene collection for None."""
+    scene_collection = bpy.context.scene.collection
+    if not name:
+        return scene_collection
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = bpy.data.collections.new(name)
+        scene_collection.children.link(collection)
+    return collection
+
+
+def link_objects_bulk(
+    objects: List[Any],
+    collection: Any,
+    locations: Optional[Sequence[float]] = None,
+    rotations: Optional[Sequence[float]] = None,
+    scales: Optional[Sequence[float]] = None,
+) -> None:
+    """Set transforms for many new objects with ``foreach_set`` and link them to ``collection``.
+
+    ``foreach_set`` needs a collection holding exactly these objects in order,
+    so they are staged in a throwaway collection first. Transform arrays are
+    flat ``[x0, y0, z0, x1, ...]`` sequences.
+    """
+    staging = bpy.data.collections.new("mcpbla_bulk_staging")
+    try:
+        link = staging.objects.link
+        for obj in objects:
+            link(obj)
+        for attr, values in (("location", locations), ("rotation_euler", rotations), ("scale", scales)):
+            if values is not None:
+                staging.objects.foreach_set(attr, values)
+        link = collection.objects.link
+        for obj in objects:
+            link(obj)
+    finally:
+        bpy.data.collections.remove(staging)
+
+
 def set_object_location(obj, loc3) -> Dict[str, Any]:
     if bpy is None:
         return {"ok": False, "error": "bpy unavailable"}
@@ -1,10 +1,193 @@
 from __future__ import annotations
 
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except Exception:  # pragma: no cover - Windows
+    resource = None
+
+# While > 0, per-action undo pushes are skipped so a transaction can own a single undo step.
+_suppress_depth = 0
+# Open transactions, outermost first (main thread only).
+_STACK: List["UndoTransaction"] = []
+_COUNTERS = {"pushed": 0, "suppressed": 0, "committed": 0, "aborted": 0, "fast": 0}
+
+
+def _bpy() -> Any:
+    try:
+        import bpy  # type: ignore
+
+        return bpy
+    except Exception:
+        return None
+
 
 def push_undo_step(label: str):
+    if _suppress_depth:
+        _COUNTERS["suppressed"] += 1
+        return
     try:
         import bpy  # type: ignore
 
         bpy.ops.ed.undo_push(message=label)
+        _COUNTERS["pushed"] += 1
     except Exception:
         return
+
+
+@contextmanager
+def undo_suppressed() -> Iterator[None]:
+    """Skip ``push_undo_step`` calls made inside the block (main thread only)."""
+    global _suppress_depth
+    _suppress_depth += 1
+    try:
+        yield
+    finally:
+        _suppress_depth -= 1
+
+
+def undo_last_step() -> bool:
+    """Step back one undo step; False when Blender's undo stack is unavailable."""
+    try:
+        import bpy  # type: ignore
+
+        bpy.ops.ed.undo()
+        return True
+    except Exception:
+        return False
+
+
+def _set_global_undo(enabled: Optional[bool]) -> Optional[bool]:
+    """Toggle ``Preferences.edit.use_global_undo``; returns the previous value (None without bpy)."""
+    bpy = _bpy()
+    edit = getattr(getattr(getattr(bpy, "context", None), "preferences", None), "edit", None)
+    if edit is None or enabled is None:
+        return None
+    previous = bool(edit.use_global_undo)
+    edit.use_global_undo = enabled
+    return previous
+
+
+class UndoTransaction:
+    """One logical task spanning many actions, recorded as a single undo step.
+
+    The outermost transaction pushes a checkpoint at ``begin`` (the datafirst
+    convention of pushing before mutating) and suppresses every per-action push
+    until ``commit``. ``abort`` steps Blender back to the checkpoint. With
+    ``fast`` no checkpoint is taken and global undo is switched off for the
+    duration, so throwaway batch jobs skip undo bookkeeping entirely (and
+    cannot be rolled back). Nested transactions join the outermost one; an
+    inner ``abort`` makes the outer ``commit`` roll back.
+    """
+
+    def __init__(self, label: str, fast: bool = False) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.label = label
+        self.fast = fast
+        self.started = time.monotonic()
+        self.state = "new"
+        self.rollback_only = False
+        self._saved_global_undo: Optional[bool] = None
+
+    def begin(self) -> "UndoTransaction":
+        global _suppress_depth
+        if self.state != "new":
+            raise RuntimeError(f"Transaction '{self.label}' already {self.state}")
+        if not _STACK:
+            if self.fast:
+                self._saved_global_undo = _set_global_undo(False)
+                _COUNTERS["fast"] += 1
+            else:
+                push_undo_step(self.label)
+        _STACK.append(self)
+        _suppress_depth += 1
+        self.state = "open"
+        return self
+
+    def _close(self) -> bool:
+        global _suppress_depth
+        if self.state != "open" or not _STACK or _STACK[-1] is not self:
+            raise RuntimeError(f"Transaction '{self.label}' is not the innermost open transaction")
+        _STACK.pop()
+        _suppress_depth -= 1
+        if self.fast and self._saved_global_undo is not None:
+            _set_global_undo(self._saved_global_undo)
+        return not _STACK
+
+    def commit(self) -> Dict[str, Any]:
+        if self.rollback_only:
+            return self.abort()
+        outermost = self._close()
+        self.state = "committed"
+        if outermost:
+            _COUNTERS["committed"] += 1
+        return {"id": self.id, "state": self.state, "nested": not outermost}
+
+    def abort(self) -> Dict[str, Any]:
+        outermost = self._close()
+        self.state = "aborted"
+        rolled_back = False
+        if not outermost:
+            _STACK[0].rollback_only = True
+        else:
+            _COUNTERS["aborted"] += 1
+            if not self.fast:
+                # Record the partial state as its own step, then undo back to the checkpoint.
+                push_undo_step(f"{self.label} (aborted)")
+                rolled_back = undo_last_step()
+        return {"id": self.id, "state": self.state, "nested": not outermost, "rolled_back": rolled_back}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "label": self.label,
+            "fast": self.fast,
+            "state": self.state,
+            "age_s": round(time.monotonic() - self.started, 3),
+        }
+
+
+def begin_transaction(label: str, fast: bool = False) -> UndoTransaction:
+    return UndoTransaction(label, fast=fast).begin()
+
+
+def current_transaction() -> Optional[UndoTransaction]:
+    return _STACK[-1] if _STACK else None
+
+
+@contextmanager
+def transaction(label: str, fast: bool = False) -> Iterator[UndoTransaction]:
+    """``with transaction("task"):`` commits on success and aborts if the block raises."""
+    txn = begin_transaction(label, fast=fast)
+    try:
+        yield txn
+    except BaseException:
+        if txn.state == "open":
+            txn.abort()
+        raise
+    if txn.state == "open":
+        txn.commit()
+
+
+def undo_stats() -> Dict[str, Any]:
+    """Undo bookkeeping for diagnostics.
+
+    Blender does not expose the undo stack's memory use to Python, so this
+    reports its configured limits next to the process peak RSS.
+    """
+    out: Dict[str, Any] = {**_COUNTERS, "open": [txn.snapshot() for txn in _STACK]}
+    bpy = _bpy()
+    edit = getattr(getattr(getattr(bpy, "context", None), "preferences", None), "edit", None)
+    if edit is not None:
+        out["global_undo"] = bool(getattr(edit, "use_global_undo", True))
+        out["undo_steps"] = getattr(edit, "undo_steps", None)
+        out["undo_memory_limit_mb"] = getattr(edit, "undo_memory_limit", None)
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        out["process_peak_rss_mb"] = round(peak / (1024 * 1024 if peak > 1 << 32 else 1024), 1)
+    return out
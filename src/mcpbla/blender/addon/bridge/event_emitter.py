@@ -1,23 +1,225 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
 import uuid
-from typing import Any, Dict
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from ..bridge_client import BridgeClient
+from .ws_channel import broadcast_event
 
 
-def emit_event(event_name: str, data: Dict[str, Any]) -> None:
-    """Send an event to the MCP server bridge endpoint."""
-    message = {
-        "type": "event",
-        "event": event_name,
-        "data": data,
-        "correlation_id": str(uuid.uuid4()),
-    }
+def _env_int(key: str, default: int) -> int:
     try:
-        client = BridgeClient()
-        client.send_event(event_name, data, correlation_id=message["correlation_id"])
-    except Exception:
-        return
+        return int(os.getenv(key) or default)
+    except ValueError:
+        return default
+
+
+_QUEUE_MAX = _env_int("MCP_EVENT_QUEUE_MAX", 1000)
+_BATCH_SIZE = _env_int("MCP_EVENT_BATCH_SIZE", 64)
+_FLUSH_INTERVAL = _env_int("MCP_EVENT_FLUSH_MS", 50) / 1000.0
+
+# State events whose latest payload supersedes earlier ones, with every field identifying their subject.
+# Other events (creations, per-material or per-modifier updates) are never collapsed.
+_DEDUP_FIELDS: Dict[str, tuple] = {"object.transformed": ("name",)}
+
+
+def _dedup_key(event_name: str, data: Dict[str, Any]) -> Optional[tuple]:
+    fields = _DEDUP_FIELDS.get(event_name)
+    if fields is None or not isinstance(data, dict):
+        return None
+    values = tuple(data.get(field) for field in fields)
+    if not all(isinstance(value, str) and value for value in values):
+        return None
+    return (event_name, *values)
+
+
+class EventSender:
+    """Ships addon events to the MCP server from a daemon thread.
+
+    ``enqueue`` never blocks the caller (Blender's main thread): events land in a
+    bounded pending map and a sender thread flushes them once ``batch_size`` are
+    waiting or ``flush_interval`` has passed since the oldest one arrived.
+    Pending state events that the latest one supersedes (``object.transformed``
+    for one object) collapse into it at the end of the queue, so a burst of
+    transforms on one object costs one event; all other events are kept. When the queue is full new events are dropped and
+    counted. Batches go over an open WebSocket channel if there is one, else
+    to ``POST /bridge/events``; servers without that route get per-event POSTs.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] = BridgeClient,
+        max_queue: int = _QUEUE_MAX,
+        batch_size: int = _BATCH_SIZE,
+        flush_interval: float = _FLUSH_INTERVAL,
+        broadcast: Callable[[Dict[str, Any]], bool] = broadcast_event,
+    ) -> None:
+        self.client_factory = client_factory
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.broadcast = broadcast
+        self._pending: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._flush_now = False
+        self._inflight = 0
+        self._seq = 0
+        self._client: Any = None
+        self._batch_endpoint = True
+        self.enqueued = 0
+        self.deduped = 0
+        self.dropped = 0
+        self.sent = 0
+        self.batches = 0
+        self.failed = 0
+
+    def enqueue(self, event_name: str, data: Dict[str, Any]) -> bool:
+        """Queue an event; False if it was dropped because the queue is full."""
+        message = {"type": "event", "event": event_name, "data": data, "correlation_id": str(uuid.uuid4())}
+        key = _dedup_key(event_name, data)
+        with self._cond:
+            if key is not None and key in self._pending:
+                # The newer state goes after everything queued since, so it cannot overtake a delete/create.
+                self._pending[key] = message
+                self._pending.move_to_end(key)
+                self.deduped += 1
+                return True
+            if len(self._pending) >= self.max_queue:
+                self.dropped += 1
+                return False
+            if key is None:
+                self._seq += 1
+                key = ("#", self._seq)
+            self._pending[key] = message
+            self.enqueued += 1
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mcpbla-event-sender", daemon=True)
+                self._thread.start()
+        return True
+
+    def _take(self) -> List[Dict[str, Any]]:
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            batch.append(self._pending.popitem(last=False)[1])
+        return batch
 
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = None
+                while not (self._stopping or self._flush_now or len(self._pending) >= self.batch_size):
+                    if not self._pending:
+                        deadline = None
+                        self._cond.wait()
+                        continue
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._take()
+                if not self._pending:
+                    self._flush_now = False
+                if not batch:
+                    if self._stopping:
+                        return
+                    continue
+                self._inflight += 1
+            try:
+                self._send(batch)
+            finally:
+                with self._cond:
+                    self._inflight -= 1
+                    self._cond.notify_all()
 
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        remaining = [message for message in batch if not self.broadcast(message)]
+        try:
+            if remaining:
+                if self._client is None:
+                    self._client = self.client_factory()
+                if self._batch_endpoint:
+                    try:
+                        self._client.send_events(remaining)
+                    except RuntimeError as exc:
+                        if getattr(exc.__cause__, "code", None) != 404:
+                            raise
+                        self._batch_endpoint = False
+                if not self._batch_endpoint:
+                    for message in remaining:
+                        self._client.send_event(message["event"], message["data"], correlation_id=message["correlation_id"])
+        except Exception:  # noqa: BLE001
+            self.failed += len(remaining)
+            self.sent += len(batch) - len(remaining)
+        else:
+            self.sent += len(batch)
+        self.batches += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything pending now; True once the queue is empty and nothing is in flight."""
+        with self._cond:
+            if self._thread is None:
+                return not self._pending
+            self._flush_now = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._inflight, timeout=timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush pending events and stop the thread; a later ``enqueue`` starts a new one."""
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._stopping = False
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "enqueued": self.enqueued,
+                "deduped": self.deduped,
+                "dropped": self.dropped,
+                "sent": self.sent,
+                "batches": self.batches,
+                "failed": self.failed,
+                "batch_endpoint": self._batch_endpoint,
+            }
+
+
+SENDER = EventSender()
+
+# When set, emit_event appends here instead of sending (batch execution folds these into one event).
+_capture: Optional[List[Dict[str, Any]]] = None
+
+
+@contextmanager
+def capture_events(sink: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Collect ``emit_event`` calls made inside the block into ``sink`` (main thread only)."""
+    global _capture
+    previous, _capture = _capture, sink
+    try:
+        yield sink
+    finally:
+        _capture = previous
+
+
+def emit_event(event_name: str, data: Dict[str, Any]) -> None:
+    """Queue an event for the MCP server; returns immediately."""
+    if _capture is not None:
+        _capture.append({"event": event_name, "data": data})
+        return
+    SENDER.enqueue(event_name, data)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import json
-import uuid
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 try:
     import bpy  # type: ignore
 except Exception:  # pragma: no cover
     bpy = None
 
+from .event_emitter import SENDER
+
 
 class BlenderEventEmitter:
     def __init__(self, bridge_client=None) -> None:
@@ -17,14 +18,15 @@ class BlenderEventEmitter:
     def emit(self, event_name: str, data: Dict[str, Any]) -> None:
         if self.bridge_client is None:
             return
-        message = {
-            "event": event_name,
-            "data": data,
-            "correlation_id": str(uuid.uuid4()),
-            "type": "event",
-        }
-        try:
-            # using bridge_client run_tool to send an event envelope over existing channel
-            self.bridge_client._request("POST", "/bridge/event", message)
-        except Exception:
-            return
+        # Queued for the background sender; Blender's thread never waits on the server.
+        SENDER.enqueue(event_name, data)
+
+
+class CollectingEmitter:
+    """Emitter that buffers events so a batch can report them as one summary event."""
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+
+    def emit(self, event_name: str, data: Dict[str, Any]) -> None:
+        self.events.append({"event": event_name, "data": data})
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import os
 import time
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     import bpy  # type: ignore
 except Exception:  # pragma: no cover
     bpy = None
 
+from mcpbla.blender.addon.ares_runtime.helpers import material_utils
+from mcpbla.blender.addon.ares_runtime.helpers.undo_utils import UndoTransaction, begin_transaction, undo_stats
+from .event_emitter import SENDER, capture_events
+from .events import CollectingEmitter
+from .main_thread import DISPATCHER
+
 _START_TIME = time.monotonic()
 
 try:
@@ -18,6 +24,7 @@ try:
         materials_datafirst,
         geometry_datafirst,
         nodes_datafirst,
+        properties_datafirst,
         scene_datafirst,
         render_datafirst,
     )
@@ -29,100 +36,334 @@ except Exception:  # pragma: no cover
     materials_datafirst = None
     geometry_datafirst = None
     nodes_datafirst = None
+    properties_datafirst = None
     scene_datafirst = None
     render_datafirst = None
     BlenderEventEmitter = None
     BridgeClient = None
 
 
-def handle_route(route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    emitter = BlenderEventEmitter(BridgeClient()) if BlenderEventEmitter and BridgeClient else None
-    if route in {"action.execute.v2", "action.execute"}:
-        result = actions.execute_action(payload) if actions else {"ok": False, "error": "actions not available"}
-        if emitter and result.get("ok"):
-            emitter.emit("action.completed", {"route": route, "result": result, "timestamp": None})
-        return result
-    if route == "create_cube.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = (
-            actions_datafirst.create_cube(params.get("name"), params.get("size"))
-            if actions_datafirst
-            else {"ok": False, "error": "runtime not available"}
-        )
-        if emitter and resp.get("ok"):
-            emitter.emit("object.created", {"name": resp.get("data", {}).get("name")})
-        return resp
-    if route == "move_object.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = (
-            actions_datafirst.move_object(params.get("name"), params.get("translation", {}))
-            if actions_datafirst
-            else {"ok": False, "error": "runtime not available"}
-        )
-        if emitter and resp.get("ok"):
-            emitter.emit("action.completed", {"route": route, "result": resp, "timestamp": None})
-        return resp
-    if route == "assign_material.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = (
-            materials_datafirst.assign_material(params.get("object"), params.get("material"), params.get("color", []))
-            if materials_datafirst
-            else {"ok": False, "error": "runtime not available"}
-        )
-        if emitter and resp.get("ok"):
-            emitter.emit("material.updated", {"object": params.get("object"), "material": params.get("material")})
-        return resp
-    if route == "apply_modifier.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = (
-            geometry_datafirst.apply_modifier(params.get("object"), params.get("type"), params.get("settings", {}))
-            if geometry_datafirst
-            else {"ok": False, "error": "runtime not available"}
+RouteHandler = Callable[[str, Dict[str, Any], Any], Dict[str, Any]]
+
+_ROUTES: Dict[str, RouteHandler] = {}
+# route -> [calls, errors, cumulative seconds]
+_ROUTE_STATS: Dict[str, List[float]] = {}
+
+# One long-lived emitter for every request; events are queued on the shared background sender.
+_EMITTER = BlenderEventEmitter(BridgeClient()) if BlenderEventEmitter and BridgeClient else None
+
+def register_route(*names: str) -> Callable[[RouteHandler], RouteHandler]:
+    """Register ``fn(route, payload, emitter)`` as the handler for each route name.
+
+    The runtime reports what an action changed through ``emit_event``; a route
+    uses ``emitter`` only for events the runtime does not send, so one action
+    never produces the same change twice.
+    """
+
+    def decorator(fn: RouteHandler) -> RouteHandler:
+        for name in names:
+            if name in _ROUTES:
+                raise ValueError(f"Route '{name}' is already registered")
+            _ROUTES[name] = fn
+        return fn
+
+    return decorator
+
+
+def _params(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return payload.get("payload") or payload.get("params") or payload
+
+
+def _runtime_unavailable() -> Dict[str, Any]:
+    return {"ok": False, "error": "runtime not available"}
+
+
+def handle_route(route: str, payload: Dict[str, Any], emitter: Any = None) -> Dict[str, Any]:
+    handler = _ROUTES.get(route)
+    if handler is None:
+        return {"ok": False, "error": {"code": "UNKNOWN_ROUTE", "message": f"Unknown route '{route}'"}}
+    stats = _ROUTE_STATS.get(route)
+    if stats is None:
+        stats = _ROUTE_STATS.setdefault(route, [0, 0, 0.0])
+    start = time.perf_counter()
+    try:
+        resp = handler(route, payload, _EMITTER if emitter is None else emitter)
+    except Exception:
+        stats[1] += 1
+        raise
+    finally:
+        stats[0] += 1
+        stats[2] += time.perf_counter() - start
+    if not resp.get("ok"):
+        stats[1] += 1
+    return resp
+
+
+def route_stats() -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, (calls, errors, total) in sorted(_ROUTE_STATS.items()):
+        out[name] = {
+            "calls": int(calls),
+            "errors": int(errors),
+            "total_ms": round(total * 1000, 3),
+            "avg_ms": round(total / calls * 1000, 3) if calls else 0.0,
+        }
+    return out
+
+
+@register_route("action.execute.v2", "action.execute")
+def _action_execute(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    result = actions.execute_action(payload) if actions else {"ok": False, "error": "actions not available"}
+    if emitter and result.get("ok"):
+        emitter.emit("action.completed", {"route": route, "result": result, "timestamp": None})
+    return result
+
+
+@register_route("create_cube.v2")
+def _create_cube(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    return actions_datafirst.create_cube(params.get("name"), params.get("size")) if actions_datafirst else _runtime_unavailable()
+
+
+@register_route("create_primitives.v2")
+def _create_primitives(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    resp = (
+        actions_datafirst.create_primitives(
+            params.get("names") or [],
+            params.get("sizes") or [],
+            locations=params.get("locations"),
+            rotations=params.get("rotations"),
+            scales=params.get("scales"),
+            collection=params.get("collection"),
         )
-        if emitter and resp.get("ok"):
-            emitter.emit("modifier.applied", {"object": params.get("object"), "modifier": params.get("type")})
-        return resp
-    if route == "node.operation.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = (
-            nodes_datafirst.add_node(params.get("material"), params.get("operation", "ShaderNodeTexNoise"))
-            if nodes_datafirst
-            else {"ok": False, "error": "runtime not available"}
+        if actions_datafirst
+        else _runtime_unavailable()
+    )
+    if emitter and resp.get("ok"):
+        emitter.emit("objects.created", {"names": resp.get("data", {}).get("names", [])})
+    return resp
+
+
+@register_route("move_object.v2")
+def _move_object(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    return (
+        actions_datafirst.move_object(params.get("name"), params.get("translation", {}))
+        if actions_datafirst
+        else _runtime_unavailable()
+    )
+
+
+@register_route("assign_material.v2")
+def _assign_material(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    return (
+        materials_datafirst.assign_material(
+            params.get("object"), params.get("material"), params.get("color", []), params.get("recipe"), params.get("settings")
         )
-        if emitter and resp.get("ok"):
-            emitter.emit("node.created", {"material": params.get("material"), "type": params.get("operation")})
-        return resp
-    if route == "scene.snapshot.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = scene_datafirst.snapshot(params.get("session_id")) if scene_datafirst else {"ok": False, "error": "runtime not available"}
-        if emitter and resp.get("ok"):
-            emitter.emit("scene.snapshot.completed", {"session_id": params.get("session_id")})
-        return resp
-    if route == "render.preview.v2":
-        params = payload.get("payload") or payload.get("params") or payload
-        resp = render_datafirst.render_preview(params or {}) if render_datafirst else {"ok": False, "error": "runtime not available"}
-        if emitter and resp.get("ok"):
-            emitter.emit("render.preview.completed", {"scene": resp.get("data", {}).get("scene")})
-        return resp
-    if route == "system.ping":
-        version = None
-        if bpy:
-            version = getattr(getattr(bpy, "app", None), "version_string", None) or getattr(getattr(bpy, "app", None), "version", None)
-        uptime = time.monotonic() - _START_TIME
-        return {
-            "ok": True,
-            "data": {
-                "blender_version": version,
-                "pid": os.getpid(),
-                "uptime": uptime,
+        if materials_datafirst
+        else _runtime_unavailable()
+    )
+
+
+@register_route("apply_modifier.v2")
+def _apply_modifier(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    return (
+        geometry_datafirst.apply_modifier(params.get("object"), params.get("type"), params.get("settings", {}))
+        if geometry_datafirst
+        else _runtime_unavailable()
+    )
+
+
+@register_route("node.operation.v2")
+def _node_operation(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    return (
+        nodes_datafirst.add_node(params.get("material"), params.get("operation", "ShaderNodeTexNoise"))
+        if nodes_datafirst
+        else _runtime_unavailable()
+    )
+
+
+@register_route("properties.set_bulk.v2")
+def _set_properties_bulk(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    writes = params.get("writes") or [params]
+    resp = properties_datafirst.set_properties_bulk(writes) if properties_datafirst else _runtime_unavailable()
+    # A write failing midway still reports the ones applied before it.
+    if emitter and (resp.get("data") or {}).get("writes"):
+        emitter.emit("properties.updated", {"writes": [{k: w[k] for k in ("collection", "path", "count")} for w in resp["data"]["writes"]]})
+    return resp
+
+
+@register_route("scene.snapshot.v2")
+def _scene_snapshot(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    resp = (
+        scene_datafirst.snapshot(params.get("session_id"), params.get("since_revision"))
+        if scene_datafirst
+        else _runtime_unavailable()
+    )
+    if emitter and resp.get("ok"):
+        emitter.emit("scene.snapshot.completed", {"session_id": params.get("session_id"), "revision": resp["data"].get("revision")})
+    return resp
+
+
+@register_route("render.preview.v2")
+def _render_preview(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    params = _params(payload)
+    resp = render_datafirst.render_preview(params or {}) if render_datafirst else _runtime_unavailable()
+    if emitter and resp.get("ok"):
+        emitter.emit("render.preview.completed", {"scene": resp.get("data", {}).get("scene")})
+    return resp
+
+
+@register_route("system.ping")
+def _system_ping(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    version = None
+    if bpy:
+        version = getattr(getattr(bpy, "app", None), "version_string", None) or getattr(getattr(bpy, "app", None), "version", None)
+    uptime = time.monotonic() - _START_TIME
+    return {
+        "ok": True,
+        "data": {
+            "blender_version": version,
+            "pid": os.getpid(),
+            "uptime": uptime,
+            "dispatcher": DISPATCHER.stats(),
+            "events": SENDER.stats(),
+            "undo": undo_stats(),
+        },
+    }
+
+
+@register_route("bridge.stats")
+def _bridge_stats(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "data": {
+            "routes": route_stats(),
+            "dispatcher": DISPATCHER.stats(),
+            "events": SENDER.stats(),
+            "undo": undo_stats(),
+            "materials": material_utils.cache_stats(),
+            "scene": scene_datafirst.TRACKER.stats() if scene_datafirst else None,
+        },
+    }
+
+
+@register_route("batch.execute")
+def _batch_execute(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    return execute_batch(payload.get("actions", []), bool(payload.get("atomic")), emitter, undo=payload.get("undo", True) is not False)
+
+
+# Transaction opened through ``undo.transaction``; actions arriving until commit/abort join it.
+_REMOTE_TXN: Optional[UndoTransaction] = None
+_REMOTE_TXN_TIMEOUT = float(os.getenv("MCP_UNDO_TXN_TIMEOUT", "300"))
+
+
+@register_route("undo.transaction")
+def _undo_transaction(route: str, payload: Dict[str, Any], emitter: Any) -> Dict[str, Any]:
+    """``{"op": "begin"|"commit"|"abort"|"status", "label", "fast", "id"}``.
+
+    There is one remote transaction per Blender process, owned by the client
+    whose ``begin`` succeeded; a second ``begin`` gets ``TRANSACTION_OPEN``.
+    Actions are not tagged with a client, so while it is open every action
+    joins it: only one client may drive Blender during a transaction. Only the
+    owner can end it, by passing the ``id`` that ``begin`` returned. A remote
+    transaction left open past ``MCP_UNDO_TXN_TIMEOUT`` seconds is committed
+    when the next one begins, so a crashed client cannot keep undo suppressed
+    forever.
+    """
+    global _REMOTE_TXN
+    params = _params(payload)
+    op = params.get("op")
+    txn = _REMOTE_TXN
+    if op == "status":
+        return {"ok": True, "data": {"transaction": txn.snapshot() if txn else None, "undo": undo_stats()}}
+    if op == "begin":
+        if txn is not None:
+            if txn.snapshot()["age_s"] < _REMOTE_TXN_TIMEOUT:
+                return _batch_error("TRANSACTION_OPEN", f"Transaction {txn.id} ('{txn.label}') is still open")
+            txn.commit()
+        _REMOTE_TXN = begin_transaction(str(params.get("label") or "mcpbla transaction"), fast=bool(params.get("fast")))
+        return {"ok": True, "data": _REMOTE_TXN.snapshot()}
+    if op not in ("commit", "abort"):
+        return _batch_error("INVALID_ARG", f"Unknown transaction op '{op}'")
+    if txn is None or params.get("id") != txn.id:
+        return _batch_error("NO_TRANSACTION", f"No open transaction {params.get('id') or ''}".rstrip())
+    _REMOTE_TXN = None
+    result = txn.commit() if op == "commit" else txn.abort()
+    return {"ok": True, "data": result}
+
+
+def _batch_error(code: str, message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": {"code": code, "message": message}}
+
+
+def execute_batch(items: List[Dict[str, Any]], atomic: bool = False, emitter: Any = None, undo: bool = True) -> Dict[str, Any]:
+    """Run a batch as one transaction: one undo step and one ``batch.completed`` event.
+
+    Per-action undo pushes are suppressed and per-action events are collected
+    into the summary event. With ``atomic`` the batch stops at the first failure
+    and Blender is stepped back to the checkpoint taken before the batch; earlier
+    items then report ``BATCH_ROLLED_BACK`` and skipped ones ``BATCH_ABORTED``.
+    ``undo=False`` runs the batch in the undo-less fast mode (no rollback).
+    Each result carries its item's ``correlation_id`` as ``request_id``.
+    """
+    collector = CollectingEmitter()
+    results: List[Dict[str, Any]] = []
+    failed_at: Optional[int] = None
+    txn = begin_transaction(f"batch.execute ({len(items)} actions)", fast=not undo)
+    try:
+        with capture_events(collector.events):
+            for index, item in enumerate(items):
+                resp = handle_route(item.get("route"), item.get("payload", {}), emitter=collector)
+                results.append(resp)
+                if not resp.get("ok") and failed_at is None:
+                    failed_at = index
+                    if atomic:
+                        break
+    except BaseException:
+        txn.abort()
+        raise
+
+    rolled_back = False
+    if atomic and failed_at is not None:
+        outcome = txn.abort()
+        rolled_back = outcome["rolled_back"]
+        if rolled_back:
+            message = f"Batch rolled back after action {failed_at} failed"
+        elif outcome["nested"]:
+            message = f"Action {failed_at} failed; the enclosing transaction will roll back"
+        else:
+            message = "Batch failed; undo unavailable for rollback"
+        if rolled_back:
+            results[:failed_at] = [_batch_error("BATCH_ROLLED_BACK", message)] * failed_at
+        results.extend(_batch_error("BATCH_ABORTED", message) for _ in range(len(items) - failed_at - 1))
+    else:
+        txn.commit()
+
+    succeeded = sum(1 for r in results if r.get("ok"))
+    if emitter is not None:
+        emitter.emit(
+            "batch.completed",
+            {
+                "count": len(items),
+                "succeeded": succeeded,
+                "failed": len(items) - succeeded,
+                "atomic": atomic,
+                "rolled_back": rolled_back,
+                "events": [] if rolled_back else collector.events,
             },
-        }
-    if route == "batch.execute":
-        actions_list = payload.get("actions", [])
-        results = []
-        for item in actions_list:
-            route_name = item.get("route")
-            pl = item.get("payload", {})
-            results.append(handle_route(route_name, pl))
-        return {"ok": all(r.get("ok") for r in results), "data": results}
-    return {"ok": False, "error": {"code": "UNKNOWN_ROUTE", "message": f"Unknown route '{route}'"}}
+        )
+    results = [
+        {**result, "request_id": item["correlation_id"]} if item.get("correlation_id") else result
+        for result, item in zip(results, items)
+    ]
+    resp: Dict[str, Any] = {"ok": failed_at is None, "data": results}
+    if atomic and failed_at is not None:
+        resp["error"] = {"code": "BATCH_ROLLED_BACK" if rolled_back else "BATCH_FAILED", "message": message, "index": failed_at}
+    return resp
@@ -6,28 +6,92 @@ import threading
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, Optional, Tuple
 
+from mcpbla.server.bridge import compression, ws_frames  # type: ignore
+
 from .handlers_v2 import handle_route
+from .event_emitter import SENDER
+from .main_thread import DISPATCHER, dispatch_route
+from .ws_channel import BridgeWebSocketPeer
+
+try:
+    from mcpbla.blender.addon.ares_runtime.datafirst.scene_datafirst import iter_snapshot_records
+except Exception:  # pragma: no cover
+    iter_snapshot_records = None
+
+SNAPSHOT_STREAM_PATH = "/bridge/snapshot/stream"
+
+_KEEPALIVE_TIMEOUT = float(os.getenv("MCP_BRIDGE_KEEPALIVE_SECONDS", "60"))
 
 _SERVER: Optional[ThreadingHTTPServer] = None
 _THREAD: Optional[threading.Thread] = None
 
 
 class _BridgeRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the server's pooled connections open between bridge calls;
+    # idle sockets are dropped after ``timeout`` seconds to free the worker thread.
+    # Headers and body go out in separate writes, so Nagle must be off or every
+    # reused connection waits on the peer's delayed ACK.
+    protocol_version = "HTTP/1.1"
+    timeout = _KEEPALIVE_TIMEOUT
+    disable_nagle_algorithm = True
+    route_handler = staticmethod(handle_route)
+    snapshot_records = staticmethod(iter_snapshot_records) if iter_snapshot_records else None
+
     def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
         body = json.dumps(payload).encode("utf-8")
+        body, encoding = compression.encode_body(body, compression.choose_encoding(self.headers.get("Accept-Encoding")))
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        # RFC 7694: tell the server it may compress large request bodies too.
+        self.send_header("Accept-Encoding", compression.ACCEPT_ENCODING)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
+    def _send_ndjson(self, records) -> None:
+        """Stream records as chunked NDJSON, one chunk per record, without building the body."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for record in records:
+                line = json.dumps(record).encode("utf-8") + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        except Exception as exc:  # noqa: BLE001
+            line = json.dumps({"type": "error", "error": str(exc)}).encode("utf-8") + b"\n"
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.write(b"0\r\n\r\n")
+
     def do_POST(self) -> None:  # noqa: N802
+        # Always drain the body so the next request on a kept-alive socket starts clean.
+        length = int(self.headers.get("Content-Length") or 0)
+        encoding = (self.headers.get("Content-Encoding") or "").strip().lower()
+        if encoding and encoding != "identity" and encoding not in compression.SUPPORTED_ENCODINGS:
+            self.rfile.read(length)
+            self._send_json(415, {"ok": False, "error": {"code": "UNSUPPORTED_ENCODING", "message": encoding}})
+            return
+        try:
+            raw = compression.decode_stream(self.rfile, encoding, length) if length > 0 else b"{}"
+        except Exception:  # noqa: BLE001
+            self.close_connection = True
+            self._send_json(400, {"ok": False, "error": {"code": "BAD_REQUEST", "message": "Invalid compressed body"}})
+            return
+        if self.path == SNAPSHOT_STREAM_PATH and self.snapshot_records is not None:
+            try:
+                params = json.loads(raw.decode("utf-8") or "{}")
+            except Exception:  # noqa: BLE001
+                params = {}
+            records = self.snapshot_records(params.get("session_id"), int(params.get("page_size") or 500))
+            # Each page is read from bpy on the main thread; the UI gets a tick between pages.
+            self._send_ndjson(DISPATCHER.iterate(records))
+            return
         if self.path not in {"/bridge/route", "/bridge/action"}:
             self._send_json(404, {"ok": False, "error": {"code": "NOT_FOUND", "message": "Unknown path"}})
             return
 
-        length = int(self.headers.get("Content-Length") or 0)
-        raw = self.rfile.read(length) if length > 0 else b"{}"
         try:
             payload = json.loads(raw.decode("utf-8") or "{}")
         except Exception:  # noqa: BLE001
@@ -41,7 +105,7 @@ class _BridgeRequestHandler(BaseHTTPRequestHandler):
             self._send_json(400, {"ok": False, "error": {"code": "MISSING_ROUTE", "message": "Route required"}})
             return
 
-        result = handle_route(route, params)
+        result = dispatch_route(self.route_handler, route, params)
         response = {
             "ok": bool(result.get("ok")),
             "data": result.get("data"),
@@ -50,6 +114,22 @@ class _BridgeRequestHandler(BaseHTTPRequestHandler):
         }
         self._send_json(200, response)
 
+    def do_GET(self) -> None:  # noqa: N802
+        key = self.headers.get("Sec-WebSocket-Key")
+        if self.path != ws_frames.WS_PATH or (self.headers.get("Upgrade") or "").lower() != "websocket" or not key:
+            self._send_json(404, {"ok": False, "error": {"code": "NOT_FOUND", "message": "Unknown path"}})
+            return
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", ws_frames.accept_key(key))
+        self.end_headers()
+        self.wfile.flush()
+        # The channel is long-lived: no idle timeout, and the socket is not reused for HTTP afterwards.
+        self.connection.settimeout(None)
+        self.close_connection = True
+        BridgeWebSocketPeer(self.rfile, self.wfile, self.route_handler).serve()
+
     def log_message(self, format: str, *args) -> None:  # noqa: A003
         # Quiet server logs inside Blender UI.
         return
@@ -78,6 +158,7 @@ def start_http_bridge() -> Optional[ThreadingHTTPServer]:
 
     thread = threading.Thread(target=server.serve_forever, name="mcpbla-bridge-http", daemon=True)
     thread.start()
+    DISPATCHER.start()
     _SERVER = server
     _THREAD = thread
     print(f"[MCPBLA] HTTP bridge listening on http://{address[0]}:{address[1]}/bridge/route")
@@ -87,6 +168,8 @@ def start_http_bridge() -> Optional[ThreadingHTTPServer]:
 def stop_http_bridge() -> None:
     """Stop the HTTP listener."""
     global _SERVER, _THREAD
+    DISPATCHER.stop()
+    SENDER.close()
     if _SERVER:
         _SERVER.shutdown()
         _SERVER.server_close()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover
+    bpy = None
+
+_BUDGET = float(os.getenv("MCP_BRIDGE_TICK_BUDGET_MS", "8")) / 1000.0
+_IDLE_INTERVAL = float(os.getenv("MCP_BRIDGE_TICK_INTERVAL_MS", "10")) / 1000.0
+_CALL_TIMEOUT = float(os.getenv("MCP_BRIDGE_DISPATCH_TIMEOUT", "30"))
+
+# Blender clamps very small timer intervals; this keeps a backlog draining every redraw.
+_BUSY_INTERVAL = 0.001
+
+
+class MainThreadDispatcher:
+    """Runs bridge work on Blender's main thread via ``bpy.app.timers``.
+
+    HTTP/WS worker threads ``submit`` callables and get a ``Future`` back. The
+    timer callback drains the queue until ``budget`` seconds have been spent in
+    the tick (always at least one item), then yields back to the UI. When the
+    dispatcher is not running (headless, tests) or the caller already is the
+    main thread, work runs inline.
+    """
+
+    def __init__(
+        self,
+        timers: Any = None,
+        budget: float = _BUDGET,
+        idle_interval: float = _IDLE_INTERVAL,
+        call_timeout: float = _CALL_TIMEOUT,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.timers = timers
+        self.budget = budget
+        self.idle_interval = idle_interval
+        self.call_timeout = call_timeout
+        self.clock = clock
+        self._queue: "queue.SimpleQueue[Tuple[Future, Callable[..., Any], tuple, dict, float]]" = queue.SimpleQueue()
+        self._running = False
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.ticks = 0
+        self.overruns = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.tick_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> bool:
+        timers = self.timers or getattr(getattr(bpy, "app", None), "timers", None)
+        if timers is None:
+            return False
+        with self._lock:
+            if self._running:
+                return True
+            self.timers = timers
+            self._running = True
+        timers.register(self._tick, first_interval=0.0, persistent=True)
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        if self.timers is not None and self.timers.is_registered(self._tick):
+            self.timers.unregister(self._tick)
+        while True:
+            try:
+                future, *_ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("Main-thread dispatcher stopped"))
+
+    def _inline(self) -> bool:
+        return not self._running or threading.current_thread() is threading.main_thread()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        if self._inline():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            return future
+        self._queue.put((future, fn, args, kwargs, self.clock()))
+        return future
+
+    def call(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run ``fn`` on the main thread and wait up to ``timeout`` (default ``call_timeout``).
+
+        A call that times out is cancelled, so the main thread skips it later.
+        """
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.call_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, iterable: Iterable[Any], timeout: Optional[float] = None) -> Iterator[Any]:
+        """Advance a generator one item per main-thread call so long jobs yield to the UI."""
+        iterator = iter(iterable)
+        sentinel = object()
+        while True:
+            item = self.call(next, iterator, sentinel, timeout=timeout)
+            if item is sentinel:
+                return
+            yield item
+
+    def _tick(self) -> Optional[float]:
+        if not self._running:
+            return None
+        start = self.clock()
+        deadline = start + self.budget
+        while True:
+            try:
+                future, fn, args, kwargs, enqueued = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            began = self.clock()
+            wait = began - enqueued
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            self.processed += 1
+            if self.clock() >= deadline:
+                break
+        elapsed = self.clock() - start
+        self.ticks += 1
+        self.tick_max = max(self.tick_max, elapsed)
+        if elapsed > self.budget:
+            self.overruns += 1
+        return _BUSY_INTERVAL if not self._queue.empty() else self.idle_interval
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "queue_depth": self._queue.qsize(),
+            "processed": self.processed,
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "wait_avg_ms": round(self.wait_total / self.processed * 1000, 3) if self.processed else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            "tick_max_ms": round(self.tick_max * 1000, 3),
+            "budget_ms": round(self.budget * 1000, 3),
+        }
+
+
+DISPATCHER = MainThreadDispatcher()
+
+
+def dispatch_route(handler: Callable[[str, Dict[str, Any]], Dict[str, Any]], route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a route handler on the main thread, mapping a stalled main thread to an error response."""
+    try:
+        return DISPATCHER.call(handler, route, payload)
+    except FutureTimeoutError:
+        return {
+            "ok": False,
+            "error": {"code": "MAIN_THREAD_TIMEOUT", "message": f"Blender main thread did not run '{route}' in time"},
+        }
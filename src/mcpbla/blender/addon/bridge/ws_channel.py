@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Set
+
+from mcpbla.server.bridge import ws_frames  # type: ignore
+
+from .main_thread import dispatch_route
+
+_WORKERS = int(os.getenv("MCP_BRIDGE_WS_WORKERS", "4"))
+
+_PEERS: Set["BridgeWebSocketPeer"] = set()
+_PEERS_LOCK = threading.Lock()
+
+
+class BridgeWebSocketPeer:
+    """Addon end of the multiplexed bridge channel (one per server connection)."""
+
+    def __init__(self, rfile, wfile, route_handler: Callable[[str, Dict[str, Any]], Dict[str, Any]]) -> None:
+        self.rfile = rfile
+        self.wfile = wfile
+        self.route_handler = route_handler
+        self._send_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="mcpbla-bridge-ws")
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self._send_frame(ws_frames.OP_TEXT, json.dumps(message).encode("utf-8"))
+
+    def _send_frame(self, opcode: int, data: bytes) -> None:
+        frame = ws_frames.encode_frame(opcode, data, mask=False)
+        with self._send_lock:
+            self.wfile.write(frame)
+            self.wfile.flush()
+
+    def serve(self) -> None:
+        with _PEERS_LOCK:
+            _PEERS.add(self)
+        try:
+            while True:
+                opcode, raw = ws_frames.read_message(self.rfile, on_ping=lambda data: self._send_frame(ws_frames.OP_PONG, data))
+                if opcode != ws_frames.OP_TEXT:
+                    continue
+                try:
+                    message = json.loads(raw.decode("utf-8"))
+                except Exception:  # noqa: BLE001
+                    continue
+                if message.get("type") == "request":
+                    # Requests run concurrently so responses can complete out of order.
+                    self._executor.submit(self._handle_request, message)
+        except (ws_frames.WebSocketClosed, OSError):
+            pass
+        finally:
+            with _PEERS_LOCK:
+                _PEERS.discard(self)
+            self._executor.shutdown(wait=False)
+
+    def _handle_request(self, message: Dict[str, Any]) -> None:
+        route = message.get("route")
+        corr = message.get("correlation_id")
+        try:
+            result = dispatch_route(self.route_handler, route, message.get("payload") or {})
+        except Exception as exc:  # noqa: BLE001
+            result = {"ok": False, "error": {"code": "ROUTE_ERROR", "message": str(exc)}}
+        try:
+            self.send(
+                {
+                    "type": "response",
+                    "correlation_id": corr,
+                    "ok": bool(result.get("ok")),
+                    "data": result.get("data"),
+                    "error": result.get("error"),
+                }
+            )
+        except OSError:
+            return
+
+
+def broadcast_event(message: Dict[str, Any]) -> bool:
+    """Push an event envelope to connected servers; False when no channel is open."""
+    with _PEERS_LOCK:
+        peers = list(_PEERS)
+    sent = False
+    for peer in peers:
+        try:
+            peer.send(message)
+            sent = True
+        except OSError:
+            continue
+    return sent
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from urllib import request, error
 
+from mcpbla.server.bridge import compression  # type: ignore
+
 
 class BridgeClient:
     def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0) -> None:
@@ -12,6 +14,8 @@ class BridgeClient:
         base = base_url or os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000")
         self.base_url = base.rstrip("/")
         self.timeout = timeout
+        # Request codings the MCP server advertised on a previous response (RFC 7694).
+        self.server_accept_encoding: Optional[str] = None
 
     # -----------------------
     # HTTP helper stdlib-only
@@ -20,21 +24,29 @@ class BridgeClient:
         self,
         method: str,
         path: str,
-        payload: Optional[Dict[str, Any]] = None,
+        payload: Optional[Any] = None,
     ) -> Dict[str, Any]:
         url = f"{self.base_url}{path}"
         data = None
-        headers = {"Content-Type": "application/json"}
+        headers = {"Content-Type": "application/json", "Accept-Encoding": compression.ACCEPT_ENCODING}
 
         if method.upper() == "POST":
             data = json.dumps(payload or {}).encode("utf-8")
+            # Large uploads (scene snapshots) are compressed once the server said it can decode them.
+            data, encoding = compression.encode_body(data, compression.choose_encoding(self.server_accept_encoding))
+            if encoding:
+                headers["Content-Encoding"] = encoding
 
         req = request.Request(url, data=data, headers=headers, method=method.upper())
         try:
             with request.urlopen(req, timeout=self.timeout) as resp:
-                body = resp.read().decode("utf-8")
+                self.server_accept_encoding = resp.headers.get("Accept-Encoding") or self.server_accept_encoding
+                body = compression.decode_stream(resp, resp.headers.get("Content-Encoding")).decode("utf-8")
                 return json.loads(body) if body else {}
         except error.HTTPError as e:  # pragma: no cover (runtime in Blender)
+            if e.code == 415 and "Content-Encoding" in headers:
+                self.server_accept_encoding = None
+                return self._request(method, path, payload)
             raise RuntimeError(f"HTTP error {e.code} for {url}: {e.reason}") from e
         except error.URLError as e:  # pragma: no cover (runtime in Blender)
             raise RuntimeError(f"Connection error for {url}: {e.reason}") from e
@@ -68,6 +80,25 @@ class BridgeClient:
         """Send a data-first snapshot to the MCP server."""
         return self._request("POST", "/blender/scene_snapshot", snapshot)
 
+    def send_snapshot_stream(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Upload snapshot records (``header``/``page``/``end``) as chunked NDJSON.
+
+        Pages are serialized as they are sent, so the full snapshot is never
+        held in memory on either side.
+        """
+        url = f"{self.base_url}/blender/scene_snapshot/stream"
+        lines = (json.dumps(record).encode("utf-8") + b"\n" for record in records)
+        headers = {"Content-Type": "application/x-ndjson", "Transfer-Encoding": "chunked"}
+        req = request.Request(url, data=lines, headers=headers, method="POST")
+        try:
+            with request.urlopen(req, timeout=self.timeout) as resp:
+                body = resp.read().decode("utf-8")
+                return json.loads(body) if body else {}
+        except error.HTTPError as e:  # pragma: no cover (runtime in Blender)
+            raise RuntimeError(f"HTTP error {e.code} for {url}: {e.reason}") from e
+        except error.URLError as e:  # pragma: no cover (runtime in Blender)
+            raise RuntimeError(f"Connection error for {url}: {e.reason}") from e
+
     def run_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         payload = {"arguments": arguments or {}}
         return self._request("POST", f"/tools/{tool_name}/invoke", payload)
@@ -85,3 +116,7 @@ class BridgeClient:
         if correlation_id:
             message["correlation_id"] = correlation_id
         return self._request("POST", "/bridge/event", message)
+
+    def send_events(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """POST several event envelopes in one request (``/bridge/events`` takes a JSON array)."""
+        return self._request("POST", "/bridge/events", messages)
@@ -18,6 +18,8 @@ if bpy:
     from .bridge_client import BridgeClient
     from .ui.panel_diagnostics import CLASSES as DIAG_CLASSES, register as register_diag, unregister as unregister_diag
     from .bridge.http_server import start_http_bridge, stop_http_bridge
+    from mcpbla.blender.addon.ares_runtime.datafirst import scene_datafirst
+    from mcpbla.blender.addon.ares_runtime.helpers import material_utils
 
     def get_or_create_cube(name: str = "Cube"):
         """Return an existing cube by name or create one at the origin."""
@@ -223,6 +225,8 @@ if bpy:
         for cls in _CLASSES:
             bpy.utils.register_class(cls)
         register_diag()
+        material_utils.register_handlers()
+        scene_datafirst.register_handlers()
         try:
             start_http_bridge()
         except Exception as exc:  # noqa: BLE001
@@ -230,6 +234,8 @@ if bpy:
 
     def unregister():
         unregister_diag()
+        material_utils.unregister_handlers()
+        scene_datafirst.unregister_handlers()
         try:
             stop_http_bridge()
         except Exception:
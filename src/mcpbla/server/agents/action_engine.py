@@ -32,18 +32,31 @@ class ActionEngine:
         self.engine = ActionEngineV2()
         self.pool = get_bridge_pool_v2()
 
+    @staticmethod
+    def _from_bridge(resp: Any) -> ActionResult:
+        if not isinstance(resp, dict):
+            return ActionResult(ok=False, error="Invalid response from bridge")
+        ok = bool(resp.get("ok", False))
+        data = resp.get("data")
+        err = resp.get("error")
+        return ActionResult(ok=ok, data=data if isinstance(data, dict) else None, error=err)
+
+    @staticmethod
+    def _from_contract(result: Any) -> ActionResult:
+        return ActionResult(ok=result.ok, data=result.data if isinstance(result.data, dict) else None, error=result.error)
+
     def execute(self, action: str, params: Dict[str, Any]) -> ActionResult:
         request = ActionRequest(action=action, params=params or {})
         # Prefer bridge pool routing when a handler is configured (BLENDER_BRIDGE_URL or manual setup).
         if self.pool.has_handler():
-            resp = self.pool.route("action.execute", request.to_payload())
-            if not isinstance(resp, dict):
-                return ActionResult(ok=False, error="Invalid response from bridge")
-            ok = bool(resp.get("ok", False))
-            data = resp.get("data")
-            err = resp.get("error")
-            return ActionResult(ok=ok, data=data if isinstance(data, dict) else None, error=err)
+            return self._from_bridge(self.pool.route("action.execute", request.to_payload()))
 
         # Fallback: local v2 engine validation/runtime (stub mode).
-        result = self.engine.execute(request.action, request.params)
-        return ActionResult(ok=result.ok, data=result.data if isinstance(result.data, dict) else None, error=result.error)
+        return self._from_contract(self.engine.execute(request.action, request.params))
+
+    async def execute_async(self, action: str, params: Dict[str, Any]) -> ActionResult:
+        """Same as ``execute`` but awaits the bridge instead of blocking the event loop."""
+        request = ActionRequest(action=action, params=params or {})
+        if self.pool.has_handler():
+            return self._from_bridge(await self.pool.route_async("action.execute", request.to_payload()))
+        return self._from_contract(await self.engine.execute_async(request.action, request.params))
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from mcpbla.server.tools.tool_response import BRIDGE_UNREACHABLE, err
+
+logger = logging.getLogger(__name__)
+
+# Routes that only read Blender state; anything else is treated as scene-mutating.
+READ_ROUTES = {"system.ping", "bridge.stats", "scene.snapshot.v2", "render.preview.v2"}
+# Failures that say something about the endpoint rather than the request.
+_TRANSPORT_CODES = {"BRIDGE_UNREACHABLE", "BRIDGE_TIMEOUT"}
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RETRY_AFTER = 5.0
+
+
+def _session_of(payload: Dict[str, Any]) -> Optional[str]:
+    """Find a ``session_id`` in a route payload, an ActionMessage dict or a batch."""
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("session_id"):
+        return str(payload["session_id"])
+    inner = payload.get("payload")
+    if isinstance(inner, dict) and inner.get("session_id"):
+        return str(inner["session_id"])
+    for action in payload.get("actions") or []:
+        session = _session_of(action) if isinstance(action, dict) else None
+        if session:
+            return session
+    return None
+
+
+def _error_code(resp: Any) -> Optional[str]:
+    if not isinstance(resp, dict) or resp.get("ok"):
+        return None
+    error = resp.get("error")
+    if isinstance(error, dict) and error.get("code"):
+        return error["code"]
+    return resp.get("code")
+
+
+class BridgeEndpoint:
+    """One Blender bridge listener plus its load and health bookkeeping."""
+
+    def __init__(self, url: str, handler: Callable[[str, dict], Dict[str, Any]]) -> None:
+        self.url = url
+        self.handler = handler
+        self.outstanding = 0
+        self.served = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.draining = False
+        self.last_error: Optional[Dict[str, Any]] = None
+
+    def available(self, now: float) -> bool:
+        return not self.draining and now >= self.down_until
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": now >= self.down_until,
+            "draining": self.draining,
+            "outstanding": self.outstanding,
+            "served": self.served,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+class MultiEndpointHandler:
+    """Bridge handler spreading routes over several Blender instances.
+
+    Read-only routes go to the healthy endpoint with the fewest outstanding
+    requests and fail over once to another endpoint on transport errors.
+    Scene-mutating routes are pinned by ``session_id`` (requests without one
+    share a default session), so a session's scene always lives in one Blender;
+    reads for a pinned session follow the pin. An endpoint that fails
+    ``failure_threshold`` times in a row is skipped for ``retry_after`` seconds.
+    ``drain`` stops new work on an endpoint and waits for in-flight requests.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[Tuple[str, Callable[[str, dict], Dict[str, Any]]]],
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        retry_after: float = DEFAULT_RETRY_AFTER,
+    ) -> None:
+        self.endpoints: List[BridgeEndpoint] = [BridgeEndpoint(url, handler) for url, handler in endpoints]
+        self.failure_threshold = max(1, failure_threshold)
+        self.retry_after = retry_after
+        self.sessions: Dict[str, BridgeEndpoint] = {}
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_urls(
+        cls, urls: Iterable[str], factory: Callable[[str], Callable[[str, dict], Dict[str, Any]]]
+    ) -> "MultiEndpointHandler":
+        return cls((url, factory(url)) for url in urls)
+
+    # -- endpoint management -------------------------------------------------
+
+    def add(self, url: str, handler: Callable[[str, dict], Dict[str, Any]]) -> BridgeEndpoint:
+        endpoint = BridgeEndpoint(url, handler)
+        with self._cond:
+            self.endpoints.append(endpoint)
+        return endpoint
+
+    def _find(self, url: str) -> Optional[BridgeEndpoint]:
+        return next((ep for ep in self.endpoints if ep.url == url), None)
+
+    def drain(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Stop routing new sessions and reads to ``url`` and wait for in-flight calls.
+
+        Sessions already pinned to the endpoint keep using it until ``remove``.
+        Returns False if requests are still outstanding after ``timeout``.
+        """
+        with self._cond:
+            endpoint = self._find(url)
+            if endpoint is None:
+                return True
+            endpoint.draining = True
+            return self._cond.wait_for(lambda: endpoint.outstanding == 0, timeout=timeout)
+
+    def remove(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Drain ``url``, then drop it and unpin its sessions."""
+        drained = self.drain(url, timeout=timeout)
+        with self._cond:
+            endpoint = self._find(url)
+            if endpoint is None:
+                return drained
+            self.endpoints.remove(endpoint)
+            for session, pinned in list(self.sessions.items()):
+                if pinned is endpoint:
+                    del self.sessions[session]
+        close = getattr(endpoint.handler, "close", None)
+        if callable(close):
+            close()
+        return drained
+
+    def close(self) -> None:
+        for endpoint in list(self.endpoints):
+            close = getattr(endpoint.handler, "close", None)
+            if callable(close):
+                close()
+
+    async def aclose(self) -> None:
+        for endpoint in list(self.endpoints):
+            aclose = getattr(endpoint.handler, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    # -- selection -----------------------------------------------------------
+
+    def _least_outstanding(self, exclude: Optional[BridgeEndpoint], now: float) -> Optional[BridgeEndpoint]:
+        candidates = [ep for ep in self.endpoints if ep is not exclude and ep.available(now)]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda ep: (ep.outstanding, ep.served))
+
+    def _select(self, route: str, payload: Dict[str, Any], exclude: Optional[BridgeEndpoint] = None):
+        """Pick and reserve an endpoint; returns ``(endpoint, sticky)``."""
+        now = time.monotonic()
+        session = _session_of(payload)
+        mutating = route not in READ_ROUTES
+        with self._cond:
+            pinned = self.sessions.get(session or "")
+            sticky = mutating or (session is not None and pinned is not None)
+            if pinned is not None and sticky:
+                if pinned in self.endpoints and now >= pinned.down_until:
+                    endpoint = pinned
+                else:
+                    endpoint = self._least_outstanding(exclude, now)
+                    if endpoint is not None:
+                        logger.warning("Bridge session %r moved from %s to %s", session, pinned.url, endpoint.url)
+                        self.sessions[session or ""] = endpoint
+            else:
+                endpoint = self._least_outstanding(exclude, now)
+                if endpoint is not None and mutating:
+                    self.sessions[session or ""] = endpoint
+            if endpoint is not None:
+                endpoint.outstanding += 1
+        return endpoint, sticky
+
+    def _finish(self, endpoint: BridgeEndpoint, resp: Dict[str, Any]) -> bool:
+        """Release ``endpoint`` and update its health; True if the failure was transport-level."""
+        code = _error_code(resp)
+        failed = code in _TRANSPORT_CODES
+        with self._cond:
+            endpoint.outstanding -= 1
+            endpoint.served += 1
+            if failed:
+                endpoint.consecutive_failures += 1
+                endpoint.last_error = resp.get("error") if isinstance(resp.get("error"), dict) else {"code": code}
+                if endpoint.consecutive_failures >= self.failure_threshold:
+                    endpoint.down_until = time.monotonic() + self.retry_after
+            else:
+                endpoint.consecutive_failures = 0
+                endpoint.down_until = 0.0
+            self._cond.notify_all()
+        return failed
+
+    @staticmethod
+    def _unavailable() -> Dict[str, Any]:
+        return err(BRIDGE_UNREACHABLE, "No healthy bridge endpoint", {"attempts": 0})
+
+    # -- handler protocol ----------------------------------------------------
+
+    def __call__(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        endpoint, sticky = self._select(route, payload)
+        if endpoint is None:
+            return self._unavailable()
+        resp = self._invoke(endpoint, route, payload)
+        if self._finish(endpoint, resp) and not sticky:
+            retry, _ = self._select(route, payload, exclude=endpoint)
+            if retry is not None:
+                resp = self._invoke(retry, route, payload)
+                self._finish(retry, resp)
+        return resp
+
+    @staticmethod
+    def _invoke(endpoint: BridgeEndpoint, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return endpoint.handler(route, payload)
+        except OSError as exc:
+            return err(BRIDGE_UNREACHABLE, str(exc), {"exception": str(exc), "endpoint": endpoint.url})
+
+    async def acall(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        endpoint, sticky = self._select(route, payload)
+        if endpoint is None:
+            return self._unavailable()
+        resp = await self._ainvoke(endpoint, route, payload)
+        if self._finish(endpoint, resp) and not sticky:
+            retry, _ = self._select(route, payload, exclude=endpoint)
+            if retry is not None:
+                resp = await self._ainvoke(retry, route, payload)
+                self._finish(retry, resp)
+        return resp
+
+    @staticmethod
+    async def _ainvoke(endpoint: BridgeEndpoint, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        acall = getattr(endpoint.handler, "acall", None)
+        try:
+            if acall is not None:
+                return await acall(route, payload)
+            return await asyncio.to_thread(endpoint.handler, route, payload)
+        except OSError as exc:
+            return err(BRIDGE_UNREACHABLE, str(exc), {"exception": str(exc), "endpoint": endpoint.url})
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._cond:
+            endpoints = [ep.snapshot(now) for ep in self.endpoints]
+            sessions = {session or "<default>": ep.url for session, ep in self.sessions.items()}
+        return {"endpoints": endpoints, "sessions": sessions}
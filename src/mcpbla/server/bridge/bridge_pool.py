@@ -10,6 +10,8 @@ class BridgePool:
 
     def __init__(self, router: Optional[Callable[[str, dict], Any]] = None) -> None:
         self._router = router
+        self.breaker = lifecycle.CircuitBreaker.from_env()
+        self.breaker.probe = self._ping
 
     def set_router(self, router: Callable[[str, dict], Any]) -> None:
         self._router = router
@@ -18,6 +20,9 @@ class BridgePool:
     def has_handler(self) -> bool:
         return self._router is not None
 
+    def _ping(self) -> Any:
+        return self._router("system.ping", {"route": "system.ping", "payload": {}}) if self._router else None
+
     def route(self, route: str, payload: dict) -> Any:
         if not self._router:
             lifecycle.set_configured(False)
@@ -26,22 +31,29 @@ class BridgePool:
                 "ok": False,
                 "error": {"code": "BRIDGE_NOT_CONFIGURED", "message": "Bridge handler not configured"},
             }
+        if not self.breaker.allow():
+            return self.breaker.fast_fail()
         try:
             resp = self._router(route, payload)
             if isinstance(resp, dict) and resp.get("ok"):
                 lifecycle.record_success()
+                self.breaker.record(None)
             else:
                 err = resp.get("error") if isinstance(resp, dict) else None
                 if isinstance(err, dict):
                     lifecycle.record_error(err.get("code", "BRIDGE_ERROR"), err.get("message", "Bridge error"))
+                    self.breaker.record(err.get("code"))
                 else:
                     lifecycle.record_error("BRIDGE_ERROR", "Bridge handler returned invalid response")
+                    self.breaker.record("BRIDGE_ERROR")
             return resp
         except (TimeoutError, OSError, ConnectionError) as exc:
             lifecycle.record_error("BRIDGE_UNREACHABLE", str(exc))
+            self.breaker.record("BRIDGE_UNREACHABLE")
             return {"ok": False, "error": {"code": "BRIDGE_UNREACHABLE", "message": str(exc)}}
         except Exception as exc:  # noqa: BLE001
             lifecycle.record_error("BRIDGE_ERROR", str(exc))
+            self.breaker.record("BRIDGE_ERROR")
             return {"ok": False, "error": {"code": "BRIDGE_ERROR", "message": str(exc)}}
 
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from mcpbla.server.bridge.messages import ActionBatch, ActionMessage
+
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MIN_WINDOW = 0.0005
+DEFAULT_MAX_WINDOW = 0.02
+DEFAULT_RTT_FRACTION = 0.5
+
+_COALESCE_KEY: ContextVar[Optional[str]] = ContextVar("mcpbla_coalesce_key", default=None)
+
+
+@contextmanager
+def coalesce_as(key: str) -> Iterator[None]:
+    """Let actions sent inside the block share batches with other calls made under ``key``.
+
+    A batch is one undo step in Blender, so only calls of one caller (an MCP
+    session, an orchestrator run) may be merged; actions sent outside any key
+    keep their own round trip. The key follows the context into tasks and
+    ``asyncio.to_thread`` calls.
+    """
+    token = _COALESCE_KEY.set(key)
+    try:
+        yield
+    finally:
+        _COALESCE_KEY.reset(token)
+
+
+def current_coalesce_key() -> Optional[str]:
+    return _COALESCE_KEY.get()
+
+
+class BatchCoalescer:
+    """Coalesces concurrent ``send_action`` calls into ``batch.execute`` round trips.
+
+    Messages are queued per coalescing key (see ``coalesce_as``). The first
+    message of an empty queue opens a collection window; the batch is flushed
+    when the window elapses or ``max_batch`` messages are queued, and each
+    caller's future receives the batch item carrying its ``request_id``. The window
+    tracks a fraction of the observed batch round-trip time (EWMA), clamped to
+    ``[min_window, max_window]``, so coalescing never adds more than a slice of
+    the latency it saves.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[ActionBatch], Dict[str, Any]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        min_window: float = DEFAULT_MIN_WINDOW,
+        max_window: float = DEFAULT_MAX_WINDOW,
+        rtt_fraction: float = DEFAULT_RTT_FRACTION,
+        max_workers: int = 4,
+    ) -> None:
+        self._send_batch = send_batch
+        self.max_batch = max(1, max_batch)
+        self.min_window = min_window
+        self.max_window = max(min_window, max_window)
+        self.rtt_fraction = rtt_fraction
+        self._pending: Dict[str, List[Tuple[ActionMessage, Future]]] = {}
+        self._generation: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcpbla-coalesce")
+        self._rtt: Optional[float] = None
+        self.batches = 0
+        self.items = 0
+
+    @property
+    def window(self) -> float:
+        if self._rtt is None:
+            return self.min_window
+        return min(self.max_window, max(self.min_window, self._rtt * self.rtt_fraction))
+
+    def submit(self, message: ActionMessage, key: str) -> Future:
+        future: Future = Future()
+        ready: Optional[List[Tuple[ActionMessage, Future]]] = None
+        with self._lock:
+            pending = self._pending.setdefault(key, [])
+            pending.append((message, future))
+            if len(pending) >= self.max_batch:
+                ready = self._take(key)
+            elif len(pending) == 1:
+                timer = threading.Timer(self.window, self._flush_window, args=(key, self._generation.get(key, 0)))
+                timer.daemon = True
+                timer.start()
+        if ready:
+            self._executor.submit(self._flush, ready)
+        return future
+
+    def _take(self, key: str) -> List[Tuple[ActionMessage, Future]]:
+        items = self._pending.pop(key, [])
+        self._generation[key] = self._generation.get(key, 0) + 1
+        return items
+
+    def _flush_window(self, key: str, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation.get(key, 0) or not self._pending.get(key):
+                return
+            items = self._take(key)
+        self._flush(items)
+
+    def _flush(self, items: List[Tuple[ActionMessage, Future]]) -> None:
+        start = time.perf_counter()
+        try:
+            resp = self._send_batch(ActionBatch(actions=[msg for msg, _ in items]))
+        except Exception as exc:  # noqa: BLE001
+            resp = {"ok": False, "error": {"code": "BRIDGE_ERROR", "message": str(exc)}}
+        rtt = time.perf_counter() - start
+        with self._lock:
+            self._rtt = rtt if self._rtt is None else 0.8 * self._rtt + 0.2 * rtt
+            self.batches += 1
+            self.items += len(items)
+        results = resp.get("data") if isinstance(resp, dict) else None
+        per_item = isinstance(results, list) and len(results) == len(items)
+        by_id = {r.get("request_id"): r for r in results if isinstance(r, dict)} if per_item else {}
+        for index, (msg, future) in enumerate(items):
+            item = by_id.get(msg.correlation_id, results[index]) if per_item else resp
+            if isinstance(item, dict) and per_item:
+                item = {**item, "request_id": msg.correlation_id}
+            future.set_result(item)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "pending": sum(len(items) for items in self._pending.values()),
+                "window_ms": round(self.window * 1000, 3),
+                "rtt_ms": round(self._rtt * 1000, 3) if self._rtt is not None else None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            batches = [self._take(key) for key in list(self._pending)]
+        for items in batches:
+            if items:
+                self._flush(items)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,202 @@
+"""Content-Encoding helpers shared by the server bridge and the Blender addon.
+
+Stdlib only (``zlib``), so the addon can import it inside Blender's bundled Python.
+Bodies are compressed only above ``min_bytes``; small bridge calls stay plain JSON.
+Request codings are negotiated the RFC 7694 way: a peer that can decode
+compressed requests says so with an ``Accept-Encoding`` header on its responses.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+ACCEPT_ENCODING = ", ".join(SUPPORTED_ENCODINGS)
+
+DEFAULT_MIN_BYTES = 16 * 1024
+DEFAULT_LEVEL = 1
+DEFAULT_MAX_DECODED_BYTES = 512 * 1024 * 1024
+_CHUNK = 64 * 1024
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key) or default)
+    except ValueError:
+        return default
+
+
+def get_compress_min_bytes() -> int:
+    return _env_int("BRIDGE_COMPRESS_MIN_BYTES", DEFAULT_MIN_BYTES)
+
+
+def get_compress_level() -> int:
+    return max(0, min(9, _env_int("BRIDGE_COMPRESS_LEVEL", DEFAULT_LEVEL)))
+
+
+def _wbits(encoding: str) -> int:
+    return 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS
+
+
+def parse_accept_encoding(header: Optional[str]) -> List[str]:
+    """Supported codings from an ``Accept-Encoding`` header, most preferred first."""
+    if not header:
+        return []
+    ranked: List[Tuple[float, int, str]] = []
+    for index, item in enumerate(header.split(",")):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if name == "x-gzip":
+            name = "gzip"
+        if name not in SUPPORTED_ENCODINGS:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            ranked.append((-q, index, name))
+    return [name for _, _, name in sorted(ranked)]
+
+
+def choose_encoding(accept_header: Optional[str]) -> Optional[str]:
+    preferred = parse_accept_encoding(accept_header)
+    return preferred[0] if preferred else None
+
+
+def encode_body(
+    body: bytes, encoding: Optional[str], min_bytes: Optional[int] = None, level: Optional[int] = None
+) -> Tuple[bytes, Optional[str]]:
+    """Return ``(body, content_encoding)``, compressing only at or above ``min_bytes``."""
+    threshold = get_compress_min_bytes() if min_bytes is None else min_bytes
+    if encoding not in SUPPORTED_ENCODINGS or len(body) < threshold:
+        return body, None
+    compressor = zlib.compressobj(get_compress_level() if level is None else level, zlib.DEFLATED, _wbits(encoding))
+    return compressor.compress(body) + compressor.flush(), encoding
+
+
+class StreamDecoder:
+    """Incremental decoder with a cap on the decoded size (guards against zip bombs)."""
+
+    def __init__(self, encoding: str, max_size: Optional[int] = None) -> None:
+        if encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(f"Unsupported Content-Encoding '{encoding}'")
+        self.encoding = encoding
+        self.max_size = max_size if max_size is not None else _env_int("BRIDGE_DECOMPRESS_MAX_BYTES", DEFAULT_MAX_DECODED_BYTES)
+        self.size = 0
+        self._raw_deflate = False
+        self._obj = zlib.decompressobj(_wbits(encoding))
+
+    def feed(self, chunk: bytes) -> bytes:
+        if not chunk:
+            return b""
+        try:
+            out = self._obj.decompress(chunk, self.max_size - self.size + 1)
+        except zlib.error:
+            # Some peers send raw deflate without the zlib wrapper; retry once in raw mode.
+            if self.encoding != "deflate" or self.size or self._raw_deflate:
+                raise
+            self._raw_deflate = True
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            out = self._obj.decompress(chunk, self.max_size + 1)
+        self.size += len(out)
+        if self.size > self.max_size or self._obj.unconsumed_tail:
+            raise ValueError("Decoded body exceeds size limit")
+        return out
+
+    def flush(self) -> bytes:
+        out = self._obj.flush()
+        self.size += len(out)
+        if self.size > self.max_size:
+            raise ValueError("Decoded body exceeds size limit")
+        return out
+
+
+def decode_stream(stream: BinaryIO, encoding: Optional[str], length: Optional[int] = None) -> bytes:
+    """Read ``length`` bytes (or to EOF) from ``stream``, decoding chunk by chunk."""
+    if not encoding or encoding == "identity":
+        return stream.read(length) if length is not None else stream.read()
+    decoder = StreamDecoder(encoding.lower())
+    parts = []
+    remaining = length
+    while remaining is None or remaining > 0:
+        chunk = stream.read(_CHUNK if remaining is None else min(_CHUNK, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        parts.append(decoder.feed(chunk))
+    parts.append(decoder.flush())
+    return b"".join(parts)
+
+
+def decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    if not encoding or encoding == "identity":
+        return body
+    decoder = StreamDecoder(encoding.lower())
+    return decoder.feed(body) + decoder.flush()
+
+
+class DecompressRequestMiddleware:
+    """ASGI middleware decoding gzip/deflate request bodies as they stream in.
+
+    Responses advertise the accepted request codings (RFC 7694) so clients such
+    as the addon's ``BridgeClient`` know they may compress large uploads.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_accept(message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (b"accept-encoding", ACCEPT_ENCODING.encode())]}
+            await send(message)
+
+        headers: Dict[bytes, bytes] = dict(scope.get("headers") or [])
+        encoding = headers.get(b"content-encoding", b"").decode("latin-1").strip().lower()
+        if not encoding or encoding == "identity":
+            await self.app(scope, receive, send_with_accept)
+            return
+        if encoding not in SUPPORTED_ENCODINGS:
+            await _plain_response(send_with_accept, 415, b"Unsupported Content-Encoding")
+            return
+
+        decoder = StreamDecoder(encoding)
+        stripped = [(k, v) for k, v in scope["headers"] if k not in (b"content-encoding", b"content-length")]
+        scope = {**scope, "headers": stripped}
+
+        async def decoding_receive():
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            body = decoder.feed(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += decoder.flush()
+            return {**message, "body": body}
+
+        try:
+            await self.app(scope, decoding_receive, send_with_accept)
+        except (ValueError, zlib.error) as exc:
+            await _plain_response(send_with_accept, 400, f"Invalid compressed body: {exc}".encode())
+
+
+async def _plain_response(send, status: int, body: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain"), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
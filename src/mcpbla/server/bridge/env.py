@@ -48,3 +48,22 @@ def resolve_bridge_url() -> str | None:
         return legacy.strip()
 
     return None
+
+
+def resolve_bridge_urls() -> list[str]:
+    """Split a comma-separated ``BRIDGE_URL`` into one URL per Blender instance."""
+    raw = resolve_bridge_url()
+    if not raw:
+        return []
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+def resolve_bridge_transport() -> str:
+    """Return the bridge transport: ``http`` (default) or ``ws`` for the multiplexed channel."""
+    raw = (os.getenv("BRIDGE_TRANSPORT") or "http").strip().lower()
+    return "ws" if raw in {"ws", "websocket"} else "http"
+
+
+def resolve_bridge_coalesce() -> bool:
+    """Whether concurrent bridge actions should be micro-batched (``BRIDGE_COALESCE``)."""
+    return _as_bool(os.getenv("BRIDGE_COALESCE"))
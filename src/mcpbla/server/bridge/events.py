@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from mcpbla.server.bridge.messages import EventMessage
 
@@ -23,23 +23,60 @@ class BridgeEventEmitter:
 class EventBus:
     def __init__(self) -> None:
         self._subscribers: Dict[str, List[Any]] = {}
+        self._batch_subscribers: Dict[str, List[Any]] = {}
 
     def subscribe(self, event_name: str, handler) -> None:
         self._subscribers.setdefault(event_name, []).append(handler)
 
+    def subscribe_many(self, event_name: str, handler) -> None:
+        """Subscribe ``handler(events)`` taking a list of ``(event_name, data)`` pairs.
+
+        ``emit_many`` hands such handlers a whole batch in one call; ``emit``
+        calls them with a single-item list.
+        """
+        self._batch_subscribers.setdefault(event_name, []).append(handler)
+
     def emit(self, event_name: str, data: Dict[str, Any]) -> None:
         handlers: List[Any] = []
         handlers.extend(self._subscribers.get(event_name, []))
         handlers.extend(self._subscribers.get("*", []))
         for h in handlers:
             h(event_name, data)
+        batch_handlers: List[Any] = []
+        batch_handlers.extend(self._batch_subscribers.get(event_name, []))
+        batch_handlers.extend(self._batch_subscribers.get("*", []))
+        for h in batch_handlers:
+            h([(event_name, data)])
+
+    def emit_many(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Publish a batch; batch subscribers get one call with their matching events, in order."""
+        batch = list(events)
+        for event_name, data in batch:
+            for h in self._subscribers.get(event_name, []) + self._subscribers.get("*", []):
+                h(event_name, data)
+        for event_name, handlers in self._batch_subscribers.items():
+            selected = batch if event_name == "*" else [event for event in batch if event[0] == event_name]
+            if selected:
+                for h in handlers:
+                    h(selected)
+        return len(batch)
 
 
 EVENT_BUS = EventBus()
 
 
-def _log_listener(event_name: str, data: Dict[str, Any]) -> None:
-    print(f"[EVENT] {event_name} {data}")
+def _log_listener(events: List[Tuple[str, Dict[str, Any]]]) -> None:
+    if len(events) == 1:
+        event_name, data = events[0]
+        if event_name.startswith("scene.snapshot.") and ("snapshot" in data or "delta" in data):
+            # Snapshot bodies and deltas can hold whole scenes; log their identity only.
+            data = {key: data.get(key) for key in ("session_id", "revision")}
+        print(f"[EVENT] {event_name} {data}")
+        return
+    counts: Dict[str, int] = {}
+    for event_name, _ in events:
+        counts[event_name] = counts.get(event_name, 0) + 1
+    print(f"[EVENT] batch of {len(events)}: " + ", ".join(f"{name} x{count}" for name, count in counts.items()))
 
 
-EVENT_BUS.subscribe("*", _log_listener)
+EVENT_BUS.subscribe_many("*", _log_listener)
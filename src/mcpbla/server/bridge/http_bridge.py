@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
+import select
 import socket
+import threading
+import time
 import uuid
-from typing import Any, Callable, Dict, Optional
-from urllib import error, request
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 
-from mcpbla.server.bridge.env import resolve_bridge_enabled, resolve_bridge_url
+import httpx
+
+from mcpbla.server.bridge.env import _as_bool, resolve_bridge_enabled, resolve_bridge_url
+from mcpbla.server.bridge import compression
+from mcpbla.server.bridge.balancer import MultiEndpointHandler
+from mcpbla.server.bridge.latency import HEDGE_ROUTES, RouteLatencyTracker
+from mcpbla.server.bridge.snapshot_stream import NDJSON_CONTENT_TYPE, SNAPSHOT_STREAM_PATH
 from mcpbla.server.tools.tool_response import BRIDGE_BAD_RESPONSE, BRIDGE_TIMEOUT, BRIDGE_UNREACHABLE, err
 
+# Read-only routes, safe to send twice. Others are replayed only when the request never left.
+REPLAYABLE_ROUTES = HEDGE_ROUTES
+
 DEFAULT_TIMEOUT = 5.0
 DEFAULT_PING_TIMEOUT = 1.0
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_IDLE_SECONDS = 30.0
 
 
 def _float_from_env(keys: list[str], default: float) -> float:
@@ -40,81 +58,459 @@ def get_bridge_ping_timeout_seconds() -> float:
     )
 
 
+def get_bridge_pool_size() -> int:
+    return max(1, int(_float_from_env(["BRIDGE_POOL_SIZE"], DEFAULT_POOL_SIZE)))
+
+
+def get_bridge_pool_idle_seconds() -> float:
+    return _float_from_env(["BRIDGE_POOL_IDLE_SECONDS"], DEFAULT_POOL_IDLE_SECONDS)
+
+
+# Errors raised when sending on a kept-alive socket the peer closed between two requests.
+_STALE_ERRORS = (
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+def _dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle connection was closed by the peer (its socket reads EOF)."""
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class HttpConnectionPool:
+    """Bounded pool of persistent HTTP/1.1 connections to one bridge listener."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_POOL_IDLE_SECONDS,
+    ) -> None:
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self._idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        # Request codings the listener advertised on its last response (RFC 7694).
+        self.peer_accept_encoding: Optional[str] = None
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        conn_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.created += 1
+        return conn_cls(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)``, evicting connections idle for too long
+        or already closed by the listener."""
+        now = time.monotonic()
+        with self._lock:
+            while self._idle and now - self._idle[0][1] > self.idle_timeout:
+                conn, _ = self._idle.popleft()
+                conn.close()
+                self.evicted += 1
+            while self._idle:
+                conn, _ = self._idle.pop()
+                if _dropped(conn):
+                    conn.close()
+                    self.evicted += 1
+                    continue
+                self.reused += 1
+                return conn, True
+        return self._new_connection(), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool = True) -> None:
+        if not reusable or conn.sock is None:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: Dict[str, str], timeout: float | None = None
+    ) -> Tuple[int, str, bytes]:
+        """Send one request and return ``(status, reason, body)``.
+
+        If sending fails on a reused connection that turns out to be stale, the
+        request is sent again on a fresh socket. Once the request has been sent
+        it is never replayed here: a timeout or reset while waiting for the
+        response is raised, since Blender may already have run it. ``timeout``
+        overrides the pool timeout for this request only. Compressed responses
+        are decoded while they are read.
+        """
+        conn, reused = self.acquire()
+        while True:
+            conn.timeout = timeout if timeout is not None else self.timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request(method, f"{self.prefix}{path}", body=body, headers=headers)
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                conn, reused = self._new_connection(), False
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                resp = conn.getresponse()
+                data = compression.decode_stream(resp, resp.getheader("Content-Encoding"))
+            except BaseException:
+                conn.close()
+                raise
+            self.peer_accept_encoding = resp.getheader("Accept-Encoding") or self.peer_accept_encoding
+            self.release(conn, reusable=not resp.will_close)
+            return resp.status, resp.reason, data
+
+    def stream(
+        self, method: str, path: str, body: bytes, headers: Dict[str, str], timeout: float | None = None
+    ) -> Iterator[bytes]:
+        """Send one request and yield the response body as it arrives (chunked NDJSON etc.).
+
+        Streams always use a fresh connection; it is returned to the pool only if
+        the body was read to the end.
+        """
+        conn = self._new_connection()
+        conn.timeout = timeout if timeout is not None else self.timeout
+        finished = False
+        try:
+            conn.request(method, f"{self.prefix}{path}", body=body, headers=headers)
+            resp = conn.getresponse()
+            if resp.status >= 400:
+                raise OSError(f"HTTP Error {resp.status}: {resp.reason}")
+            while True:
+                chunk = resp.read1(64 * 1024)
+                if not chunk:
+                    break
+                yield chunk
+            finished = not resp.will_close
+        finally:
+            self.release(conn, reusable=finished)
+
+    def close(self) -> None:
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            idle = len(self._idle)
+        return {"idle": idle, "created": self.created, "reused": self.reused, "evicted": self.evicted}
+
+
 class HttpBridgeHandler:
     """HTTP bridge handler that forwards bridge routes to a Blender addon listener."""
 
-    def __init__(self, base_url: str, timeout: float | None = None, max_attempts: int = 2) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float | None = None,
+        max_attempts: int = 2,
+        pool_size: int | None = None,
+        idle_timeout: float | None = None,
+        latency: RouteLatencyTracker | None = None,
+        hedge: bool | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout if timeout is not None else get_bridge_timeout_seconds()
         self.max_attempts = max(1, max_attempts)
+        self.latency = latency or RouteLatencyTracker.from_env(self.timeout)
+        self.hedge = hedge if hedge is not None else _as_bool(os.getenv("BRIDGE_HEDGE"))
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.pool = HttpConnectionPool(
+            self.base_url,
+            timeout=self.timeout,
+            max_size=pool_size if pool_size is not None else get_bridge_pool_size(),
+            idle_timeout=idle_timeout if idle_timeout is not None else get_bridge_pool_idle_seconds(),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_keeper: Optional[asyncio.Task] = None
 
-    def __call__(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self.base_url}/bridge/route"
+    def close(self) -> None:
+        self.pool.close()
+        self._retire_async_client()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+
+    def _hedge_delay(self, route: str) -> Optional[float]:
+        if not self.hedge or route not in HEDGE_ROUTES:
+            return None
+        return self.latency.hedge_delay(route)
+
+    def _post(self, data: bytes, headers: Dict[str, str], timeout: float) -> Tuple[int, str, bytes]:
+        return self.pool.request("POST", "/bridge/route", data, headers, timeout=timeout)
+
+    def _request(self, route: str, data: bytes, headers: Dict[str, str], timeout: float) -> Tuple[int, str, bytes]:
+        """POST once, or hedge: if no reply arrives within the route's p95, send a
+        duplicate on another connection and take whichever succeeds first."""
+        delay = self._hedge_delay(route)
+        start = time.perf_counter()
+        try:
+            if delay is None or delay >= timeout:
+                result = self._post(data, headers, timeout)
+            else:
+                result = self._hedged_post(data, headers, timeout, delay)
+        except socket.timeout:
+            self.latency.record(route, timeout)
+            raise
+        self.latency.record(route, time.perf_counter() - start)
+        return result
+
+    def _hedged_post(self, data: bytes, headers: Dict[str, str], timeout: float, delay: float) -> Tuple[int, str, bytes]:
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=self.pool.max_size * 2, thread_name_prefix="mcpbla-hedge")
+        primary = self._hedge_executor.submit(self._post, data, headers, timeout)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        self.hedged += 1
+        backup = self._hedge_executor.submit(self._post, data, headers, timeout - delay)
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        self.hedge_wins += 1
+                    return future.result()
+        return primary.result()
+
+    def iter_snapshot_stream(self, session_id: str | None = None, page_size: int = 500) -> Iterator[bytes]:
+        """Yield raw NDJSON chunks of a paged scene snapshot from the addon listener."""
+        body = json.dumps({"session_id": session_id, "page_size": page_size}).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": NDJSON_CONTENT_TYPE}
+        return self.pool.stream("POST", SNAPSHOT_STREAM_PATH, body, headers, timeout=self.latency.timeout_for("scene.snapshot.v2"))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool": self.pool.stats(),
+            "latency": self.latency.snapshot(),
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    def _encode(self, route: str, payload: Dict[str, Any]) -> Tuple[str, bytes]:
         req_id = str(uuid.uuid4())
         body = {
             "route": route,
             "payload": payload,
             "request_id": req_id,
         }
-        data = json.dumps(body).encode("utf-8")
-        req = request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        return req_id, json.dumps(body).encode("utf-8")
+
+    def _compress(self, data: bytes, headers: Dict[str, str]) -> bytes:
+        """Compress a large request body once the listener has advertised support for it."""
+        data, encoding = compression.encode_body(data, compression.choose_encoding(self.pool.peer_accept_encoding))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return data
+
+    @staticmethod
+    def _decode(status: int, reason: str, raw: bytes, req_id: str, attempt: int) -> Dict[str, Any]:
+        if status >= 400:
+            return err(
+                BRIDGE_BAD_RESPONSE,
+                f"{status}: {reason}",
+                {"exception": f"HTTP Error {status}: {reason}", "attempts": attempt},
+            )
+        text = raw.decode("utf-8")
+        if not text:
+            return err(
+                BRIDGE_BAD_RESPONSE,
+                "No response body",
+                {"attempts": attempt},
+            )
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError as decode_exc:
+            return err(
+                BRIDGE_BAD_RESPONSE,
+                "Invalid JSON response",
+                {"exception": str(decode_exc), "attempts": attempt},
+            )
+        if "request_id" not in parsed:
+            parsed["request_id"] = req_id
+        return parsed
+
+    def __call__(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        req_id, data = self._encode(route, payload)
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "Accept-Encoding": compression.ACCEPT_ENCODING,
+        }
+        data = self._compress(data, headers)
+        timeout = self.latency.timeout_for(route)
+        # A mutating route is retried only if the request cannot have reached Blender.
+        attempts = self.max_attempts if route in REPLAYABLE_ROUTES else 1
         attempt = 0
         while attempt < self.max_attempts:
             attempt += 1
             try:
-                with request.urlopen(req, timeout=self.timeout) as resp:
-                    text = resp.read().decode("utf-8")
-                    if not text:
-                        return err(
-                            BRIDGE_BAD_RESPONSE,
-                            "No response body",
-                            {"attempts": attempt},
-                        )
-                    try:
-                        parsed = json.loads(text)
-                    except json.JSONDecodeError as decode_exc:
-                        return err(
-                            BRIDGE_BAD_RESPONSE,
-                            "Invalid JSON response",
-                            {"exception": str(decode_exc), "attempts": attempt},
-                        )
-                    if "request_id" not in parsed:
-                        parsed["request_id"] = req_id
-                    return parsed
-            except error.HTTPError as exc:
+                status, reason, raw = self._request(route, data, headers, timeout)
+            except socket.timeout as exc:
+                if attempt < attempts:
+                    continue
+                return err(BRIDGE_TIMEOUT, "Bridge timeout", {"exception": str(exc), "attempts": attempt})
+            except OSError as exc:
+                if attempt < attempts or (attempt < self.max_attempts and isinstance(exc, (ConnectionRefusedError, socket.gaierror))):
+                    continue
                 return err(
-                    BRIDGE_BAD_RESPONSE,
-                    f"{exc.code}: {exc.reason}",
+                    BRIDGE_UNREACHABLE,
+                    str(exc),
                     {"exception": str(exc), "attempts": attempt},
                 )
-            except error.URLError as exc:
-                reason = getattr(exc, "reason", exc)
-                is_timeout = isinstance(reason, (TimeoutError, socket.timeout))
-                code = BRIDGE_TIMEOUT if is_timeout else BRIDGE_UNREACHABLE
-                if attempt < self.max_attempts and code in {BRIDGE_TIMEOUT, BRIDGE_UNREACHABLE}:
+            except Exception as exc:  # noqa: BLE001
+                if attempt < attempts:
                     continue
                 return err(
-                    code,
-                    str(reason),
-                    {"exception": str(reason), "attempts": attempt},
+                    BRIDGE_UNREACHABLE,
+                    "Bridge error",
+                    {"exception": str(exc), "attempts": attempt},
                 )
-            except socket.timeout as exc:
-                if attempt < self.max_attempts:
+            return self._decode(status, reason, raw, req_id, attempt)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # httpx connections belong to the loop that opened them; keep one client per loop.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._retire_async_client()
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.pool.max_size,
+                    keepalive_expiry=self.pool.idle_timeout,
+                ),
+            )
+            self._async_client, self._async_loop = client, loop
+            self._async_keeper = loop.create_task(self._keep_async_client(client))
+        return self._async_client
+
+    @staticmethod
+    async def _keep_async_client(client: httpx.AsyncClient) -> None:
+        """Close ``client`` on its own loop once cancelled.
+
+        Its sockets can only be closed by that loop. The task is cancelled when
+        the handler moves to another loop or is closed, and by ``asyncio.run``
+        when the loop shuts down.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await client.aclose()
+
+    def _retire_async_client(self) -> None:
+        keeper, loop = self._async_keeper, self._async_loop
+        self._async_client = self._async_loop = self._async_keeper = None
+        if keeper is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(keeper.cancel)
+
+    async def acall(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Non-blocking variant of ``__call__`` for use on the server's event loop."""
+        req_id, data = self._encode(route, payload)
+        headers = {"Content-Type": "application/json"}
+        data = self._compress(data, headers)
+        timeout = self.latency.timeout_for(route)
+        attempts = self.max_attempts if route in REPLAYABLE_ROUTES else 1
+        attempt = 0
+        while attempt < self.max_attempts:
+            attempt += 1
+            try:
+                resp = await self._arequest(route, data, headers, timeout)
+            except httpx.TimeoutException as exc:
+                if attempt < attempts or (attempt < self.max_attempts and isinstance(exc, (httpx.ConnectTimeout, httpx.PoolTimeout))):
                     continue
                 return err(BRIDGE_TIMEOUT, "Bridge timeout", {"exception": str(exc), "attempts": attempt})
-            except Exception as exc:  # noqa: BLE001
-                if attempt < self.max_attempts:
+            except httpx.TransportError as exc:
+                if attempt < attempts or (attempt < self.max_attempts and isinstance(exc, httpx.ConnectError)):
                     continue
                 return err(
                     BRIDGE_UNREACHABLE,
-                    "Bridge error",
+                    str(exc),
                     {"exception": str(exc), "attempts": attempt},
                 )
+            return self._decode(resp.status_code, resp.reason_phrase, resp.content, req_id, attempt)
+
+    async def _apost(self, data: bytes, headers: Dict[str, str], timeout: float) -> httpx.Response:
+        # httpx advertises Accept-Encoding and decodes compressed responses itself.
+        client = self._get_async_client()
+        resp = await client.post("/bridge/route", content=data, headers=headers, timeout=timeout)
+        self.pool.peer_accept_encoding = resp.headers.get("Accept-Encoding") or self.pool.peer_accept_encoding
+        return resp
+
+    async def _arequest(self, route: str, data: bytes, headers: Dict[str, str], timeout: float) -> httpx.Response:
+        delay = self._hedge_delay(route)
+        start = time.perf_counter()
+        try:
+            if delay is None or delay >= timeout:
+                resp = await self._apost(data, headers, timeout)
+            else:
+                resp = await self._ahedged_post(data, headers, timeout, delay)
+        except httpx.TimeoutException:
+            self.latency.record(route, timeout)
+            raise
+        self.latency.record(route, time.perf_counter() - start)
+        return resp
+
+    async def _ahedged_post(self, data: bytes, headers: Dict[str, str], timeout: float, delay: float) -> httpx.Response:
+        primary = asyncio.ensure_future(self._apost(data, headers, timeout))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        self.hedged += 1
+        backup = asyncio.ensure_future(self._apost(data, headers, timeout - delay))
+        pending = {primary, backup}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aclose(self) -> None:
+        keeper = self._async_keeper
+        if keeper is None or self._async_loop is not asyncio.get_running_loop():
+            self._retire_async_client()
+            return
+        self._async_client = self._async_loop = self._async_keeper = None
+        keeper.cancel()
+        await asyncio.gather(keeper, return_exceptions=True)
 
 
 def _resolve_bridge_url_from_env(force_enabled: bool = False) -> Optional[str]:
@@ -133,10 +529,21 @@ def _resolve_bridge_url_from_env(force_enabled: bool = False) -> Optional[str]:
     return None
 
 
-def get_http_handler_from_env(force_enabled: bool = False) -> Optional[Callable[[str, dict], Dict[str, Any]]]:
-    """Return an HTTP handler if bridge env configuration is available."""
+def _resolve_bridge_urls_from_env(force_enabled: bool = False) -> list[str]:
     base = _resolve_bridge_url_from_env(force_enabled=force_enabled)
-    if not base:
+    return [part.strip() for part in base.split(",") if part.strip()] if base else []
+
+
+def get_http_handler_from_env(force_enabled: bool = False) -> Optional[Callable[[str, dict], Dict[str, Any]]]:
+    """Return an HTTP handler if bridge env configuration is available.
+
+    A comma-separated ``BRIDGE_URL`` yields a ``MultiEndpointHandler`` over one
+    ``HttpBridgeHandler`` per Blender instance.
+    """
+    urls = _resolve_bridge_urls_from_env(force_enabled=force_enabled)
+    if not urls:
         return None
     timeout = get_bridge_timeout_seconds()
-    return HttpBridgeHandler(base, timeout=timeout)
+    if len(urls) > 1:
+        return MultiEndpointHandler.from_urls(urls, lambda url: HttpBridgeHandler(url, timeout=timeout))
+    return HttpBridgeHandler(urls[0], timeout=timeout)
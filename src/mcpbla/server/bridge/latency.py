@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+from mcpbla.server.bridge.env import _as_bool
+
+# Log-linear bucketing: each power of two is split into 16 linear sub-buckets (~6% precision).
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_MAGNITUDE = 37  # 2**37 µs ≈ 38 h; anything larger lands in the top bucket
+
+# Idempotent read routes that may be hedged with a duplicate request.
+HEDGE_ROUTES = {"system.ping", "scene.snapshot.v2"}
+
+DEFAULT_TIMEOUT_FACTOR = 3.0
+DEFAULT_TIMEOUT_FLOOR = 0.5
+DEFAULT_TIMEOUT_CEILING = 60.0
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_ROTATE_EVERY = 1000
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_BUCKETS:
+        return max(0, micros)
+    magnitude = min(micros.bit_length() - 1, _MAX_MAGNITUDE)
+    shift = magnitude - _SUB_BITS
+    sub = min((micros >> shift) - _SUB_BUCKETS, _SUB_BUCKETS - 1)
+    return _SUB_BUCKETS + shift * _SUB_BUCKETS + sub
+
+
+def _bucket_upper(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index + 1
+    shift, sub = divmod(index - _SUB_BUCKETS, _SUB_BUCKETS)
+    return (_SUB_BUCKETS + sub + 1) << shift
+
+
+_BUCKET_COUNT = _bucket_index(1 << _MAX_MAGNITUDE) + _SUB_BUCKETS
+
+
+class LatencyHistogram:
+    """HDR-style histogram of durations with bounded relative error and O(1) record."""
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[_bucket_index(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        merged = LatencyHistogram()
+        merged.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.max = max(self.max, other.max)
+        return merged
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the ``q``-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_upper(index) / 1_000_000, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class RouteLatencyTracker:
+    """Per-route latency histograms driving adaptive deadlines and hedge delays.
+
+    Each route keeps a current and a previous histogram, rotated every
+    ``rotate_every`` samples, so percentiles follow recent behaviour. Until a
+    route has ``min_samples`` observations it uses ``default_timeout``; after
+    that its deadline is ``p99 * factor`` clamped to ``[floor, ceiling]``.
+    Timed-out calls are recorded at their deadline so a route that is slower
+    than its budget grows the budget instead of timing out forever.
+    """
+
+    def __init__(
+        self,
+        default_timeout: float,
+        factor: float = DEFAULT_TIMEOUT_FACTOR,
+        floor: float = DEFAULT_TIMEOUT_FLOOR,
+        ceiling: float = DEFAULT_TIMEOUT_CEILING,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        rotate_every: int = DEFAULT_ROTATE_EVERY,
+        adaptive: bool = True,
+    ) -> None:
+        self.default_timeout = default_timeout
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.min_samples = max(1, min_samples)
+        self.rotate_every = max(1, rotate_every)
+        self.adaptive = adaptive
+        self._current: Dict[str, LatencyHistogram] = {}
+        self._previous: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_timeout: float) -> "RouteLatencyTracker":
+        def _number(key: str, default: float) -> float:
+            try:
+                return float(os.getenv(key) or default)
+            except ValueError:
+                return default
+
+        raw_adaptive = os.getenv("BRIDGE_ADAPTIVE_TIMEOUT")
+        return cls(
+            default_timeout,
+            factor=_number("BRIDGE_TIMEOUT_P99_FACTOR", DEFAULT_TIMEOUT_FACTOR),
+            floor=_number("BRIDGE_TIMEOUT_FLOOR_SECONDS", DEFAULT_TIMEOUT_FLOOR),
+            ceiling=_number("BRIDGE_TIMEOUT_CEILING_SECONDS", DEFAULT_TIMEOUT_CEILING),
+            adaptive=True if raw_adaptive is None else _as_bool(raw_adaptive),
+        )
+
+    def record(self, route: str, seconds: float) -> None:
+        with self._lock:
+            hist = self._current.setdefault(route, LatencyHistogram())
+            hist.record(seconds)
+            if hist.count >= self.rotate_every:
+                self._previous[route] = hist
+                self._current[route] = LatencyHistogram()
+
+    def histogram(self, route: str) -> Optional[LatencyHistogram]:
+        with self._lock:
+            current = self._current.get(route)
+            previous = self._previous.get(route)
+        if current is None:
+            return previous
+        return current.merge(previous) if previous is not None else current
+
+    def timeout_for(self, route: str) -> float:
+        if not self.adaptive:
+            return self.default_timeout
+        hist = self.histogram(route)
+        if hist is None or hist.count < self.min_samples:
+            return self.default_timeout
+        return min(self.ceiling, max(self.floor, hist.percentile(99) * self.factor))
+
+    def hedge_delay(self, route: str) -> Optional[float]:
+        """p95 latency of ``route`` once enough samples exist; None otherwise."""
+        hist = self.histogram(route)
+        if hist is None or hist.count < self.min_samples:
+            return None
+        return hist.percentile(95)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            routes = set(self._current) | set(self._previous)
+        out: Dict[str, Dict[str, float]] = {}
+        for route in sorted(routes):
+            hist = self.histogram(route)
+            if hist is not None:
+                out[route] = {**hist.snapshot(), "timeout_ms": round(self.timeout_for(route) * 1000, 3)}
+        return out
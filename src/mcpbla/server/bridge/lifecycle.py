@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Callable, Deque, Dict, Optional
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Only transport-level failures trip the breaker; route errors prove the bridge is alive.
+_TRIP_CODES = {"BRIDGE_UNREACHABLE", "BRIDGE_TIMEOUT"}
 
 
 @dataclass
@@ -48,3 +58,145 @@ def record_error(code: str, message: str) -> None:
 
 def get_state() -> Dict[str, object]:
     return _STATE.snapshot()
+
+
+def _env_number(key: str, default: float) -> float:
+    raw = os.getenv(key)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker guarding bridge calls.
+
+    The circuit opens after ``failure_threshold`` consecutive transport failures,
+    or when the failure rate over the last ``window`` calls (at least
+    ``min_calls``) reaches ``error_rate``. While open, callers fast-fail with
+    ``BRIDGE_UNREACHABLE``; after ``cooldown`` seconds a single background
+    ``probe`` (``system.ping``) runs in the half-open state and closes the
+    circuit on success. Without a probe, half-open admits one trial call instead.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        cooldown: float = 5.0,
+        probe: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.error_rate = error_rate
+        self.min_calls = max(1, min_calls)
+        self.cooldown = cooldown
+        self.probe = probe
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.fast_failed = 0
+        self.trips = 0
+        self._outcomes: Deque[bool] = deque(maxlen=max(1, window))
+        self._trial_taken = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=int(_env_number("BRIDGE_BREAKER_FAILURES", 5)),
+            error_rate=_env_number("BRIDGE_BREAKER_ERROR_RATE", 0.5),
+            window=int(_env_number("BRIDGE_BREAKER_WINDOW", 20)),
+            cooldown=_env_number("BRIDGE_BREAKER_COOLDOWN_SECONDS", 5.0),
+        )
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return True
+            if self.state == CIRCUIT_HALF_OPEN and self.probe is None and not self._trial_taken:
+                self._trial_taken = True
+                return True
+            self.fast_failed += 1
+            return False
+
+    def fast_fail(self) -> Dict[str, Any]:
+        return {
+            "ok": False,
+            "error": {"code": "BRIDGE_UNREACHABLE", "message": "Bridge circuit open", "circuit": self.state},
+        }
+
+    def record(self, code: Optional[str]) -> None:
+        """Record a call outcome; ``code`` is the error code, or None on success."""
+        failed = code in _TRIP_CODES
+        with self._lock:
+            if self.state == CIRCUIT_OPEN:
+                return
+            if self.state == CIRCUIT_HALF_OPEN:
+                if self.probe is None and self._trial_taken:
+                    self._settle(not failed)
+                return
+            self._outcomes.append(failed)
+            self.consecutive_failures = self.consecutive_failures + 1 if failed else 0
+            failures = sum(self._outcomes)
+            rate_tripped = len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.error_rate
+            if failed and (self.consecutive_failures >= self.failure_threshold or rate_tripped):
+                self._open()
+
+    def _open(self) -> None:
+        self.state = CIRCUIT_OPEN
+        self.opened_at = time.time()
+        self.trips += 1
+        self._timer = threading.Timer(self.cooldown, self._half_open)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _settle(self, healthy: bool) -> None:
+        if healthy:
+            self.state = CIRCUIT_CLOSED
+            self.opened_at = None
+            self.consecutive_failures = 0
+            self._outcomes.clear()
+        else:
+            self._open()
+
+    def _half_open(self) -> None:
+        with self._lock:
+            if self.state != CIRCUIT_OPEN:
+                return
+            self.state = CIRCUIT_HALF_OPEN
+            self._trial_taken = False
+            probe = self.probe
+        if probe is None:
+            return
+        try:
+            resp = probe()
+            healthy = isinstance(resp, dict) and bool(resp.get("ok"))
+        except Exception:  # noqa: BLE001
+            healthy = False
+        with self._lock:
+            if self.state == CIRCUIT_HALF_OPEN:
+                self._settle(healthy)
+        if healthy:
+            record_success()
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._settle(True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "error_rate": round(sum(self._outcomes) / len(self._outcomes), 3) if self._outcomes else 0.0,
+                "opened_at": self.opened_at,
+                "trips": self.trips,
+                "fast_failed": self.fast_failed,
+            }
@@ -47,9 +47,10 @@ class ErrorMessage:
 class ActionBatch:
     actions: List[ActionMessage]
     atomic: bool = False
+    undo: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"atomic": self.atomic, "actions": [a.to_dict() for a in self.actions]}
+        return {"atomic": self.atomic, "undo": self.undo, "actions": [a.to_dict() for a in self.actions]}
 
 
 @dataclass
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mcpbla.server.bridge.persistent_map import PersistentMap
+
+# Transform fields kept as contiguous float columns, three values per row.
+VECTOR_FIELDS = ("location", "rotation_euler", "scale")
+_WIDTH = 3
+_NAME = 1 << len(VECTOR_FIELDS)
+_TYPE = _NAME << 1
+_FIXED = {"name", "type", *VECTOR_FIELDS}
+_VECTOR_BITS = tuple((1 << bit, field) for bit, field in enumerate(VECTOR_FIELDS))
+
+DEFAULT_COLUMNAR_MIN_OBJECTS = 50000
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.getenv(key) or default)
+    except ValueError:
+        return default
+
+
+def object_store_mode() -> str:
+    """``MCP_SCENEGRAPH_STORE``: ``dict``, ``columnar`` or ``auto`` (default, columnar for large scenes)."""
+    mode = (os.getenv("MCP_SCENEGRAPH_STORE") or "auto").strip().lower()
+    return mode if mode in ("dict", "columnar") else "auto"
+
+
+def get_columnar_min_objects() -> int:
+    return _env_int("MCP_SCENEGRAPH_COLUMNAR_MIN", DEFAULT_COLUMNAR_MIN_OBJECTS)
+
+
+def _vector(value: Any) -> Optional[Tuple[float, float, float]]:
+    if isinstance(value, (list, tuple)) and len(value) == _WIDTH:
+        try:
+            return float(value[0]), float(value[1]), float(value[2])
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class ObjectRow:
+    """Read-only view of one stored object; fields are read from the columns on access."""
+
+    __slots__ = ("_chunk", "_slot")
+
+    def __init__(self, chunk: "ObjectChunk", slot: int) -> None:
+        self._chunk = chunk
+        self._slot = slot
+
+    @property
+    def name(self) -> str:
+        return self._chunk.names[self._slot]
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._chunk.types[self._slot]
+
+    def vector(self, field: str) -> Optional[Tuple[float, ...]]:
+        chunk, slot = self._chunk, self._slot
+        if not chunk.present[slot] & (1 << VECTOR_FIELDS.index(field)):
+            return None
+        base = slot * _WIDTH
+        return tuple(chunk.columns[field][base : base + _WIDTH])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._chunk.record(self._slot)
+
+
+class ObjectChunk:
+    """Up to ``persistent_map.CHUNK`` objects stored column-wise.
+
+    Names and types are interned strings in parallel lists, transforms live in
+    one ``array('d')`` per field and any other fields in a per-row ``extras``
+    dict. ``present`` is a per-row bit mask of the fields the record carried,
+    so a record round-trips unchanged. It offers the dict operations
+    ``PersistentMap`` needs; values are materialized as fresh dicts on access.
+    Freed slots are reused; iteration follows ``slots`` (insertion order).
+    """
+
+    __slots__ = ("slots", "names", "types", "columns", "present", "extras", "free")
+
+    def __init__(self, pairs: Iterable[Tuple[str, Dict[str, Any]]] = ()) -> None:
+        self.slots: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.types: List[Optional[str]] = []
+        self.columns: Dict[str, array] = {field: array("d") for field in VECTOR_FIELDS}
+        self.present = bytearray()
+        self.extras: List[Optional[Dict[str, Any]]] = []
+        self.free: List[int] = []
+        for key, value in pairs:
+            self[key] = value
+
+    def copy(self) -> "ObjectChunk":
+        clone = ObjectChunk.__new__(ObjectChunk)
+        clone.slots = dict(self.slots)
+        clone.names = list(self.names)
+        clone.types = list(self.types)
+        clone.columns = {field: column[:] for field, column in self.columns.items()}
+        clone.present = bytearray(self.present)
+        clone.extras = list(self.extras)
+        clone.free = list(self.free)
+        return clone
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.slots)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self.slots)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.slots
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self.record(self.slots[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self.slots.get(key)
+        return default if slot is None else self.record(slot)
+
+    def row(self, key: str) -> Optional[ObjectRow]:
+        slot = self.slots.get(key)
+        return None if slot is None else ObjectRow(self, slot)
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        return (self.record(slot) for slot in self.slots.values())
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return ((key, self.record(slot)) for key, slot in self.slots.items())
+
+    def record(self, slot: int) -> Dict[str, Any]:
+        mask = self.present[slot]
+        out: Dict[str, Any] = {}
+        if mask & _NAME:
+            out["name"] = self.names[slot]
+        if mask & _TYPE:
+            out["type"] = self.types[slot]
+        base = slot * _WIDTH
+        columns = self.columns
+        for bit, field in _VECTOR_BITS:
+            if mask & bit:
+                column = columns[field]
+                out[field] = [column[base], column[base + 1], column[base + 2]]
+        extra = self.extras[slot]
+        if extra:
+            out.update(extra)
+        return out
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.free.pop() if self.free else self._grow()
+            self.slots[key] = slot
+        self.names[slot] = sys.intern(key)
+        mask = 0
+        extra: Dict[str, Any] = {}
+        if "name" in value:
+            if value["name"] == key:
+                mask |= _NAME
+            else:
+                extra["name"] = value["name"]
+        kind = value.get("type")
+        if "type" in value and (kind is None or isinstance(kind, str)):
+            mask |= _TYPE
+            kind = sys.intern(kind) if kind is not None else None
+        elif "type" in value:
+            extra["type"] = kind
+        self.types[slot] = kind if mask & _TYPE else None
+        base = slot * _WIDTH
+        for bit, field in _VECTOR_BITS:
+            if field not in value:
+                continue
+            vector = _vector(value[field])
+            if vector is None:
+                extra[field] = value[field]
+                continue
+            column = self.columns[field]
+            column[base], column[base + 1], column[base + 2] = vector
+            mask |= bit
+        for field, item in value.items():
+            if field not in _FIXED:
+                extra[field] = item
+        self.present[slot] = mask
+        self.extras[slot] = extra or None
+
+    def _grow(self) -> int:
+        slot = len(self.names)
+        self.names.append("")
+        self.types.append(None)
+        for column in self.columns.values():
+            column.extend((0.0, 0.0, 0.0))
+        self.present.append(0)
+        self.extras.append(None)
+        return slot
+
+    def pop(self, key: str, *default: Any) -> Any:
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        out = self.record(slot)
+        self.present[slot] = 0
+        self.extras[slot] = None
+        self.free.append(slot)
+        return out
+
+
+class ColumnarMap(PersistentMap):
+    """``PersistentMap`` of object records backed by ``ObjectChunk`` columns.
+
+    Lookups and iteration hand out dicts built on demand; ``row`` returns a
+    ``__slots__`` view and ``column`` a flat ``array('d')`` for scans that do
+    not need records at all.
+    """
+
+    __slots__ = ()
+    _chunk_type = ObjectChunk
+
+    def row(self, key: str) -> Optional[ObjectRow]:
+        index = self._index
+        chunk = index[hash(key) & (len(index) - 1)].get(key)
+        return None if chunk is None else self._chunks[chunk].row(key)
+
+    def column(self, field: str) -> Tuple[List[str], array]:
+        """Names in iteration order and ``field`` for each of them (3 floats per name, NaN when absent)."""
+        bit = 1 << VECTOR_FIELDS.index(field)
+        names: List[str] = []
+        out = array("d")
+        nan = (float("nan"),) * _WIDTH
+        for chunk in self._chunks:
+            column, present = chunk.columns[field], chunk.present
+            slots = list(chunk.slots.values())
+            if slots == list(range(len(present))) and all(mask & bit for mask in present):
+                # Rows in slot order and all carrying the field: copy the column in one go.
+                names.extend(chunk.slots)
+                out.extend(column)
+                continue
+            for key, slot in chunk.slots.items():
+                names.append(key)
+                base = slot * _WIDTH
+                out.extend(column[base : base + _WIDTH] if present[slot] & bit else nan)
+        return names, out
+
+
+def object_map_type(count: int) -> type:
+    """The object store for a scene of ``count`` objects under the configured mode."""
+    mode = object_store_mode()
+    if mode == "columnar" or (mode == "auto" and count >= get_columnar_min_objects()):
+        return ColumnarMap
+    return PersistentMap
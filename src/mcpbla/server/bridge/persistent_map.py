@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Entries per chunk; a write copies one chunk plus the (short) chunk and bucket tuples.
+CHUNK = 64
+_MISSING = object()
+
+
+class PersistentMap(Mapping):
+    """Immutable, insertion-ordered map whose revisions share structure.
+
+    Values live in chunks of up to ``CHUNK`` entries (small dicts, appended to
+    at the end) and a hashed index of buckets maps each key to its chunk. A new
+    revision is built with an ``evolver()``: it copies only the chunks and
+    buckets it writes, every other dict is shared with the previous revision,
+    so readers holding an older map keep a consistent view without copying.
+    Values are shared too and must be treated as immutable (replace, do not
+    mutate).
+    """
+
+    __slots__ = ("_chunks", "_index", "_len")
+    # Chunk container; any type with the dict operations used here and ``copy()`` will do.
+    _chunk_type: Any = dict
+
+    def __init__(self, chunks: Tuple[Dict[Any, Any], ...] = (), index: Tuple[Dict[Any, int], ...] = ({},), length: int = 0) -> None:
+        self._chunks = chunks
+        self._index = index
+        self._len = length
+
+    @classmethod
+    def from_dict(cls, items: Dict[Any, Any]) -> "PersistentMap":
+        """Build a map from ``items`` (order kept) in one pass."""
+        pairs = list(items.items())
+        chunks = tuple(cls._chunk_type(pairs[i : i + CHUNK]) for i in range(0, len(pairs), CHUNK))
+        return cls(chunks, _build_index(chunks), len(pairs))
+
+    def __getitem__(self, key: Any) -> Any:
+        index = self._index
+        chunk = index[hash(key) & (len(index) - 1)].get(key)
+        if chunk is None:
+            raise KeyError(key)
+        return self._chunks[chunk][key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        index = self._index
+        chunk = index[hash(key) & (len(index) - 1)].get(key)
+        return default if chunk is None else self._chunks[chunk][key]
+
+    def __contains__(self, key: Any) -> bool:
+        index = self._index
+        return key in index[hash(key) & (len(index) - 1)]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __reversed__(self) -> Iterator[Any]:
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def values(self) -> "_Values":
+        return _Values(self)
+
+    def items(self) -> "_Items":
+        return _Items(self)
+
+    def evolver(self) -> "MapEvolver":
+        return MapEvolver(self)
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
+
+
+class _Values(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._mapping._chunks:
+            yield from chunk.values()
+
+
+class _Items(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        for chunk in self._mapping._chunks:
+            yield from chunk.items()
+
+
+def _build_index(chunks: Tuple[Dict[Any, Any], ...]) -> Tuple[Dict[Any, int], ...]:
+    """Buckets sized for about ``CHUNK`` keys each (a power of two, so the bucket is a mask of the hash)."""
+    count = sum(len(chunk) for chunk in chunks)
+    size = 1
+    while size * CHUNK < count:
+        size *= 2
+    buckets: List[Dict[Any, int]] = [{} for _ in range(size)]
+    mask = size - 1
+    for number, chunk in enumerate(chunks):
+        for key in chunk:
+            buckets[hash(key) & mask][key] = number
+    return tuple(buckets)
+
+
+class MapEvolver:
+    """Mutable builder for the next revision of a ``PersistentMap``.
+
+    Chunks and buckets are copied on their first write; ``persistent()``
+    freezes the result (the evolver can keep going from there). Removals leave
+    chunks partly empty, so sparse maps are repacked and an overfull index is
+    rebuilt on ``persistent()``; both are O(n) and amortized over the writes
+    that caused them.
+    """
+
+    def __init__(self, base: PersistentMap) -> None:
+        self._chunks: List[Dict[Any, Any]] = list(base._chunks)
+        self._index: List[Dict[Any, int]] = list(base._index)
+        self._len = base._len
+        self._own_chunks: set = set()
+        self._own_buckets: set = set()
+        self._base = base
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _bucket(self, key: Any, write: bool) -> Dict[Any, int]:
+        number = hash(key) & (len(self._index) - 1)
+        if write and number not in self._own_buckets:
+            self._index[number] = dict(self._index[number])
+            self._own_buckets.add(number)
+        return self._index[number]
+
+    def _chunk(self, number: int) -> Dict[Any, Any]:
+        if number not in self._own_chunks:
+            self._chunks[number] = self._chunks[number].copy()
+            self._own_chunks.add(number)
+        return self._chunks[number]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        number = self._bucket(key, False).get(key)
+        return default if number is None else self._chunks[number][key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._bucket(key, False)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._dirty = True
+        number = self._bucket(key, False).get(key)
+        if number is None:
+            if not self._chunks or len(self._chunks[-1]) >= CHUNK:
+                self._chunks.append(type(self._base)._chunk_type())
+                self._own_chunks.add(len(self._chunks) - 1)
+            number = len(self._chunks) - 1
+            self._bucket(key, True)[key] = number
+            self._len += 1
+        self._chunk(number)[key] = value
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        number = self._bucket(key, False).get(key)
+        if number is None:
+            return default
+        self._dirty = True
+        del self._bucket(key, True)[key]
+        self._len -= 1
+        return self._chunk(number).pop(key)
+
+    def discard(self, key: Any) -> None:
+        self.pop(key)
+
+    def move_to_end(self, key: Any, value: Any) -> None:
+        """Set ``key`` to ``value`` as the newest entry (iteration order follows writes)."""
+        self.pop(key)
+        self[key] = value
+
+    def persistent(self) -> PersistentMap:
+        if not self._dirty:
+            return self._base
+        chunks = self._chunks
+        cls = type(self._base)
+        if len(chunks) > 4 and len(chunks) * CHUNK > 2 * self._len + 4 * CHUNK:
+            pairs = [item for chunk in chunks for item in chunk.items()]
+            chunks = [cls._chunk_type(pairs[i : i + CHUNK]) for i in range(0, len(pairs), CHUNK)]
+            index: Tuple[Dict[Any, int], ...] = _build_index(tuple(chunks))
+        elif self._len > 2 * CHUNK * len(self._index):
+            index = _build_index(tuple(chunks))
+        else:
+            index = tuple(self._index)
+        self._base = cls(tuple(chunks), index, self._len)
+        self.__init__(self._base)
+        return self._base
+
+
+EMPTY = PersistentMap()
+
+
+def persistent(items: Optional[Dict[Any, Any]] = None) -> PersistentMap:
+    return PersistentMap.from_dict(items) if items else EMPTY
@@ -1,17 +1,81 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, Optional
 
 from mcpbla.server.bridge import lifecycle
+from mcpbla.server.bridge.coalescer import BatchCoalescer, current_coalesce_key
 from mcpbla.server.bridge.messages import ActionBatch, ActionMessage
 from mcpbla.server.bridge.router_v2 import RouterV2
 
 
+# Routes that must keep their own round trip instead of riding in a coalesced batch.
+_UNBATCHED_ROUTES = {"batch.execute", "system.ping", "bridge.stats", "undo.transaction"}
+
+
+def _not_configured() -> Dict[str, Any]:
+    lifecycle.set_configured(False)
+    lifecycle.record_error("BRIDGE_NOT_CONFIGURED", "Bridge handler not configured")
+    return {
+        "ok": False,
+        "error": {"code": "BRIDGE_NOT_CONFIGURED", "message": "Bridge handler not configured"},
+    }
+
+
+def _record_response(resp: Any) -> Any:
+    if isinstance(resp, dict) and resp.get("ok"):
+        lifecycle.record_success()
+    else:
+        err = resp.get("error") if isinstance(resp, dict) else None
+        code = resp.get("code") if isinstance(resp, dict) else None
+        if isinstance(err, dict):
+            lifecycle.record_error(err.get("code", code or "BRIDGE_ERROR"), err.get("message", "Bridge error"))
+        else:
+            lifecycle.record_error(code or "BRIDGE_ERROR", str(err) if err else "Bridge handler returned invalid response")
+    return resp
+
+
+def _error_code(resp: Any) -> Optional[str]:
+    if isinstance(resp, dict) and resp.get("ok"):
+        return None
+    err = resp.get("error") if isinstance(resp, dict) else None
+    if isinstance(err, dict) and err.get("code"):
+        return err["code"]
+    return resp.get("code") if isinstance(resp, dict) else None
+
+
+def _record_exception(exc: Exception) -> Dict[str, Any]:
+    code = "BRIDGE_UNREACHABLE" if isinstance(exc, (TimeoutError, OSError, ConnectionError)) else "BRIDGE_ERROR"
+    lifecycle.record_error(code, str(exc))
+    return {"ok": False, "error": {"code": code, "message": str(exc)}}
+
+
 class BridgePoolV2:
     """Bridge pool v2 supporting batching and correlation-aware routing."""
 
     def __init__(self, router: Optional[RouterV2] = None) -> None:
         self.router = router or RouterV2()
+        self.coalescer: Optional[BatchCoalescer] = None
+        self.breaker = lifecycle.CircuitBreaker.from_env()
+        self.breaker.probe = self._ping
+
+    def enable_coalescing(self, **options: Any) -> BatchCoalescer:
+        """Opt in to micro-batching of concurrent ``send_action`` calls (see ``BatchCoalescer``)."""
+        if self.coalescer is not None:
+            self.coalescer.close()
+        self.coalescer = BatchCoalescer(self.send_batch, **options)
+        return self.coalescer
+
+    def disable_coalescing(self) -> None:
+        if self.coalescer is not None:
+            self.coalescer.close()
+        self.coalescer = None
+
+    def _coalesce_key(self, message: ActionMessage) -> Optional[str]:
+        """The caller's coalescing key, or None when the message must go alone."""
+        if self.coalescer is None or self.router.handler is None or message.route in _UNBATCHED_ROUTES:
+            return None
+        return current_coalesce_key()
 
     def set_handler(self, handler) -> None:
         self.router.handler = handler
@@ -20,88 +84,55 @@ class BridgePoolV2:
     def has_handler(self) -> bool:
         return self.router.handler is not None
 
+    def _ping(self) -> Dict[str, Any]:
+        handler = self.router.handler
+        if handler is None:
+            return _not_configured()
+        return handler("system.ping", ActionMessage(route="system.ping", payload={}).to_dict())
+
     def route(self, route: str, payload: dict) -> Dict[str, Any]:
         """Direct routing helper that mirrors send_action but accepts raw route/payload."""
         if not self.router.handler:
-            lifecycle.set_configured(False)
-            lifecycle.record_error("BRIDGE_NOT_CONFIGURED", "Bridge handler not configured")
-            return {
-                "ok": False,
-                "error": {"code": "BRIDGE_NOT_CONFIGURED", "message": "Bridge handler not configured"},
-            }
+            return _not_configured()
+        if not self.breaker.allow():
+            return self.breaker.fast_fail()
         try:
-            resp = self.router.route(route, payload)
-            if isinstance(resp, dict) and resp.get("ok"):
-                lifecycle.record_success()
-            else:
-                err = resp.get("error") if isinstance(resp, dict) else None
-                code = resp.get("code") if isinstance(resp, dict) else None
-                if isinstance(err, dict):
-                    lifecycle.record_error(err.get("code", code or "BRIDGE_ERROR"), err.get("message", "Bridge error"))
-                else:
-                    lifecycle.record_error(code or "BRIDGE_ERROR", str(err) if err else "Bridge handler returned invalid response")
-            return resp
-        except (TimeoutError, OSError, ConnectionError) as exc:
-            lifecycle.record_error("BRIDGE_UNREACHABLE", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_UNREACHABLE", "message": str(exc)}}
+            resp = _record_response(self.router.route(route, payload))
         except Exception as exc:  # noqa: BLE001
-            lifecycle.record_error("BRIDGE_ERROR", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_ERROR", "message": str(exc)}}
+            resp = _record_exception(exc)
+        self.breaker.record(_error_code(resp))
+        return resp
 
-    def send_action(self, message: ActionMessage) -> Dict[str, Any]:
+    async def route_async(self, route: str, payload: dict) -> Dict[str, Any]:
+        """Awaitable ``route`` that never blocks the running event loop."""
         if not self.router.handler:
-            lifecycle.set_configured(False)
-            lifecycle.record_error("BRIDGE_NOT_CONFIGURED", "Bridge handler not configured")
-            return {
-                "ok": False,
-                "error": {"code": "BRIDGE_NOT_CONFIGURED", "message": "Bridge handler not configured"},
-            }
+            return _not_configured()
+        if not self.breaker.allow():
+            return self.breaker.fast_fail()
         try:
-            resp = self.router.route(message.route, message.to_dict())
-            if isinstance(resp, dict) and resp.get("ok"):
-                lifecycle.record_success()
-            else:
-                err = resp.get("error") if isinstance(resp, dict) else None
-                code = resp.get("code") if isinstance(resp, dict) else None
-                if isinstance(err, dict):
-                    lifecycle.record_error(err.get("code", code or "BRIDGE_ERROR"), err.get("message", "Bridge error"))
-                else:
-                    lifecycle.record_error(code or "BRIDGE_ERROR", str(err) if err else "Bridge handler returned invalid response")
-            return resp
-        except (TimeoutError, OSError, ConnectionError) as exc:
-            lifecycle.record_error("BRIDGE_UNREACHABLE", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_UNREACHABLE", "message": str(exc)}}
+            resp = _record_response(await self.router.route_async(route, payload))
         except Exception as exc:  # noqa: BLE001
-            lifecycle.record_error("BRIDGE_ERROR", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_ERROR", "message": str(exc)}}
+            resp = _record_exception(exc)
+        self.breaker.record(_error_code(resp))
+        return resp
+
+    def send_action(self, message: ActionMessage) -> Dict[str, Any]:
+        key = self._coalesce_key(message)
+        if key is not None:
+            return self.coalescer.submit(message, key).result()
+        return self.route(message.route, message.to_dict())
+
+    async def send_action_async(self, message: ActionMessage) -> Dict[str, Any]:
+        key = self._coalesce_key(message)
+        if key is not None:
+            return await asyncio.wrap_future(self.coalescer.submit(message, key))
+        return await self.route_async(message.route, message.to_dict())
 
     def send_batch(self, batch: ActionBatch) -> Dict[str, Any]:
-        payload = batch.to_dict()
-        if not self.router.handler:
-            lifecycle.set_configured(False)
-            lifecycle.record_error("BRIDGE_NOT_CONFIGURED", "Bridge handler not configured")
-            return {
-                "ok": False,
-                "error": {"code": "BRIDGE_NOT_CONFIGURED", "message": "Bridge handler not configured"},
-            }
-        try:
-            resp = self.router.route("batch.execute", payload)
-            if isinstance(resp, dict) and resp.get("ok"):
-                lifecycle.record_success()
-            else:
-                err = resp.get("error") if isinstance(resp, dict) else None
-                code = resp.get("code") if isinstance(resp, dict) else None
-                if isinstance(err, dict):
-                    lifecycle.record_error(err.get("code", code or "BRIDGE_ERROR"), err.get("message", "Bridge error"))
-                else:
-                    lifecycle.record_error(code or "BRIDGE_ERROR", str(err) if err else "Bridge handler returned invalid response")
-            return resp
-        except (TimeoutError, OSError, ConnectionError) as exc:
-            lifecycle.record_error("BRIDGE_UNREACHABLE", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_UNREACHABLE", "message": str(exc)}}
-        except Exception as exc:  # noqa: BLE001
-            lifecycle.record_error("BRIDGE_ERROR", str(exc))
-            return {"ok": False, "error": {"code": "BRIDGE_ERROR", "message": str(exc)}}
+        return self.route("batch.execute", batch.to_dict())
+
+    async def send_batch_async(self, batch: ActionBatch) -> Dict[str, Any]:
+        return await self.route_async("batch.execute", batch.to_dict())
 
     def receive_event(self, payload: dict) -> None:
         self.router.receive(payload)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from typing import Any, Callable, Dict, Optional
 
 
@@ -29,6 +31,31 @@ class RouterV2:
         if last_exc:
             raise last_exc
 
+    async def route_async(self, route: str, payload: dict) -> Any:
+        """Async ``route``: awaits handlers exposing ``acall`` (or coroutine handlers),
+        and runs plain sync handlers in a worker thread so the event loop stays free."""
+        if payload.get("type") == "event" and self.event_handler:
+            return self.event_handler(payload)
+        if not self.handler:
+            raise RuntimeError("RouterV2 handler not configured")
+        attempts = 0
+        while True:
+            try:
+                return await self._call_async(route, payload)
+            except Exception:  # noqa: BLE001
+                attempts += 1
+                if attempts > self.max_retries:
+                    raise
+
+    async def _call_async(self, route: str, payload: dict) -> Any:
+        handler = self.handler
+        acall = getattr(handler, "acall", None)
+        if acall is not None:
+            return await acall(route, payload)
+        if inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, "__call__", None)):
+            return await handler(route, payload)
+        return await asyncio.to_thread(handler, route, payload)
+
     def set_event_handler(self, handler: Callable[[dict], Any]) -> None:
         self.event_handler = handler
 
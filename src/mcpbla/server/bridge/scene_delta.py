@@ -1,23 +1,140 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
+_MISSING = object()
 
-def compute_delta(old_snapshot: Dict[str, Any], new_snapshot: Dict[str, Any]) -> Dict[str, Any]:
-    old_objs = {obj.get("name"): obj for obj in old_snapshot.get("objects", [])} if old_snapshot else {}
-    new_objs = {obj.get("name"): obj for obj in new_snapshot.get("objects", [])} if new_snapshot else {}
+Fingerprint = Tuple[Tuple[str, ...], Tuple[bytes, ...]]
 
-    changed: List[str] = []
-    added: List[str] = []
-    removed: List[str] = []
 
-    for name in new_objs:
-        if name not in old_objs:
-            added.append(name)
-        elif old_objs[name] != new_objs[name]:
-            changed.append(name)
-    for name in old_objs:
-        if name not in new_objs:
-            removed.append(name)
+def _field_digest(value: Any) -> bytes:
+    try:
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        # Keys that cannot be sorted or serialized; repr still tells different values apart.
+        text = repr(value)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
-    return {"objects_added": added, "objects_removed": removed, "objects_changed": changed}
+
+def fingerprint(obj: Dict[str, Any]) -> Fingerprint:
+    """Field names and per-field value digests of ``obj``; equal records give equal fingerprints.
+
+    Each field is serialized canonically (lists and tuples alike, nested dict
+    keys sorted) and digested with 128-bit BLAKE2b, so unlike ``hash`` (where
+    ``hash(-1) == hash(-2)``) a changed value is not mistaken for an unchanged
+    one. Values that only compare equal across types (``1`` and ``1.0``)
+    digest differently and show up as a (harmless) change.
+    """
+    return tuple(obj), tuple([_field_digest(v) for v in obj.values()])
+
+
+def field_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """``{"name", "set": {field: value}, "unset": [field]}`` turning ``old`` into ``new``; None when equal."""
+    changed = {k: v for k, v in new.items() if old.get(k, _MISSING) != v}
+    dropped = [k for k in old if k not in new]
+    return _patch(new.get("name"), changed, dropped)
+
+
+def _fingerprint_patch(old: Fingerprint, new: Fingerprint, obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """``field_patch`` from the previous fingerprint alone (the old record is not needed)."""
+    old_digests = dict(zip(*old))
+    changed = {k: obj[k] for k, d in zip(*new) if old_digests.get(k) != d}
+    dropped = [k for k in old[0] if k not in obj]
+    return _patch(obj.get("name"), changed, dropped)
+
+
+def _patch(name: Any, changed: Dict[str, Any], dropped: List[str]) -> Optional[Dict[str, Any]]:
+    if not changed and not dropped:
+        return None
+    patch: Dict[str, Any] = {"name": name, "set": changed}
+    if dropped:
+        patch["unset"] = dropped
+    return patch
+
+
+def is_patch(item: Any) -> bool:
+    return isinstance(item, dict) and "set" in item and item.keys() <= {"name", "set", "unset"}
+
+
+def apply_patch(obj: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """A new record: ``obj`` with the patch's ``set`` fields written and ``unset`` fields dropped."""
+    out = {**obj, **patch.get("set", {})}
+    for field in patch.get("unset", ()):
+        out.pop(field, None)
+    return out
+
+
+class SnapshotDiffer:
+    """Field-level deltas between consecutive snapshots.
+
+    Deltas list ``objects_added`` records, ``objects_removed`` names and
+    ``objects_changed`` patches (see ``field_patch``), which
+    ``SceneGraphLiveV3.apply_delta`` applies to the stored records.
+
+    By default the differ keeps the previous snapshot's records (which the
+    caller usually holds anyway) and skips an unchanged object with one
+    identity-or-``==`` check, done in C. With ``fingerprints=True`` it keeps
+    only a fingerprint per object (field names, shared between objects of the
+    same layout, plus one digest per field) and skips an unchanged object with
+    one tuple compare; changed fields are found from the per-field digests.
+    Digesting every new record costs far more CPU than ``==`` in CPython, so
+    that mode is for scenes whose previous records are no longer held. Snapshot objects are treated as immutable once diffed.
+    """
+
+    def __init__(self, fingerprints: bool = False) -> None:
+        self.fingerprints = fingerprints
+        self.objects: Dict[str, Any] = {}
+        self._layouts: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def reset(self) -> None:
+        self.objects = {}
+        self._layouts = {}
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def diff(self, snapshot: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        objects = {obj.get("name"): obj for obj in (snapshot or {}).get("objects") or () if obj.get("name") is not None}
+        previous = self.objects
+        added: List[Dict[str, Any]] = []
+        changed: List[Dict[str, Any]] = []
+        if self.fingerprints:
+            layouts = self._layouts
+            state: Dict[str, Any] = {}
+            for name, obj in objects.items():
+                keys, digests = fingerprint(obj)
+                current = state[name] = (layouts.setdefault(keys, keys), digests)
+                old = previous.get(name)
+                if old is None:
+                    added.append(obj)
+                elif old != current:
+                    patch = _fingerprint_patch(old, current, obj)
+                    if patch is not None:
+                        changed.append(patch)
+        else:
+            state = objects
+            for name, obj in objects.items():
+                old = previous.get(name)
+                if old is None:
+                    added.append(obj)
+                elif old is not obj and old != obj:
+                    patch = field_patch(old, obj)
+                    if patch is not None:
+                        changed.append(patch)
+        removed = [name for name in previous if name not in objects]
+        self.objects = state
+        return {"objects_added": added, "objects_removed": removed, "objects_changed": changed}
+
+
+def compute_delta(old_snapshot: Optional[Dict[str, Any]], new_snapshot: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Delta from ``old_snapshot`` to ``new_snapshot`` in the ``SnapshotDiffer`` format.
+
+    Nothing is kept between calls; a caller diffing a chain of snapshots
+    should hold its own ``SnapshotDiffer`` (as ``scenegraph_live.SessionHistory``
+    does per session) so the previous snapshot is not indexed again.
+    """
+    differ = SnapshotDiffer()
+    differ.diff(old_snapshot)
+    return differ.diff(new_snapshot)
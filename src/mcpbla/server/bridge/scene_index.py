@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Entry fields whose values are searchable: names, types, materials and modifier types.
+TOKEN_FIELDS = ("name", "type", "material", "materials", "modifier", "modifiers", "node", "object")
+_SPLIT = re.compile(r"[^0-9a-z]+")
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+# Prefix expansions larger than this are checked per candidate instead of being enumerated.
+_EXPANSION_CAP = 256
+
+EntryKey = Tuple[str, str]
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased value plus its alphanumeric words: ``"Cube.001"`` -> ``{"cube.001", "cube", "001"}``."""
+    text = text.lower().strip()
+    if not text:
+        return frozenset()
+    tokens = {word for word in _SPLIT.split(text) if word}
+    tokens.add(text)
+    return frozenset(tokens)
+
+
+def _signature(item: Dict[str, Any]) -> Tuple[Any, ...]:
+    """The indexed field values; an entry whose signature is unchanged is not re-tokenized."""
+    values = [item.get(field) for field in TOKEN_FIELDS]
+    return tuple(repr(v) if isinstance(v, list) else v for v in values)
+
+
+def entry_tokens(item: Dict[str, Any]) -> Set[str]:
+    tokens: Set[str] = set()
+    for field in TOKEN_FIELDS:
+        value = item.get(field)
+        values: Iterable[Any] = value if isinstance(value, list) else (value,)
+        for v in values:
+            if isinstance(v, dict):
+                v = v.get("name") or v.get("type")
+            if isinstance(v, str):
+                tokens |= tokenize(v)
+    return tokens
+
+
+def _is_word(token: str) -> bool:
+    return _SPLIT.search(token) is None
+
+
+def _edits1(word: str) -> Set[str]:
+    """All strings one delete, transpose, replace or insert away from ``word``."""
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    deletes = [a + b[1:] for a, b in splits if b]
+    transposes = [a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1]
+    replaces = [a + c + b[1:] for a, b in splits if b for c in _ALPHABET]
+    inserts = [a + c + b for a, b in splits for c in _ALPHABET]
+    return set(deletes + transposes + replaces + inserts)
+
+
+class SceneTokenIndex:
+    """Inverted token index over scenegraph entries, maintained incrementally.
+
+    Entries are keyed by ``(kind, key)``. ``postings`` maps a token to the
+    entries carrying it. Sorted vocabularies make a prefix query a bisect plus
+    a short scan: ``words`` holds alphanumeric tokens and ``phrases`` holds
+    whole values such as ``"crate.0042"``, so thousands of similar names do
+    not bloat the expansion of a word prefix. The writer merges new tokens
+    into the vocabularies with ``sync_vocabulary`` (insorted when few,
+    re-sorted after bulk loads) and swaps in new lists, so lock-free searches
+    only ever read; dropped tokens are skipped until the next rebuild. Fuzzy matching probes the
+    tokens one edit away from the query, so its cost depends on the query
+    length rather than on the number of entries.
+    """
+
+    def __init__(self) -> None:
+        # token -> entries in insertion order (a dict so results are stable and can stop early)
+        self.postings: Dict[str, Dict[EntryKey, None]] = {}
+        self.words: List[str] = []
+        self.phrases: List[str] = []
+        self._pending: List[str] = []
+        self._dropped = 0
+        self._entry_tokens: Dict[EntryKey, Set[str]] = {}
+        self._signatures: Dict[EntryKey, Tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entry_tokens)
+
+    def add(self, kind: str, key: str, item: Dict[str, Any]) -> None:
+        entry = (kind, key)
+        signature = _signature(item)
+        if self._signatures.get(entry) == signature:
+            return
+        self._signatures[entry] = signature
+        tokens = entry_tokens(item)
+        old = self._entry_tokens.get(entry)
+        if old == tokens:
+            return
+        if old:
+            for token in old - tokens:
+                self._unpost(token, entry)
+        for token in tokens - (old or set()):
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                self._pending.append(token)
+            posting[entry] = None
+        self._entry_tokens[entry] = tokens
+
+    def remove(self, kind: str, key: str) -> None:
+        entry = (kind, key)
+        self._signatures.pop(entry, None)
+        for token in self._entry_tokens.pop(entry, ()):
+            self._unpost(token, entry)
+
+    def replace(self, kind: str, items: Dict[str, Dict[str, Any]]) -> None:
+        """Sync all entries of ``kind`` with ``items``; unchanged entries cost one signature check."""
+        stale = [key for k, key in self._entry_tokens if k == kind and key not in items]
+        for key in stale:
+            self.remove(kind, key)
+        for key, item in items.items():
+            self.add(kind, key, item)
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.words = []
+        self.phrases = []
+        self._pending.clear()
+        self._dropped = 0
+        self._entry_tokens.clear()
+        self._signatures.clear()
+
+    def _unpost(self, token: str, entry: EntryKey) -> None:
+        posting = self.postings.get(token)
+        if posting is None:
+            return
+        posting.pop(entry, None)
+        if not posting:
+            del self.postings[token]
+            self._dropped += 1
+
+    def sync_vocabulary(self) -> None:
+        """Merge tokens added since the last call into ``words``/``phrases``; call with the writer lock held.
+
+        New lists are built and assigned rather than edited in place, so a
+        concurrent ``search`` keeps bisecting a sorted list.
+        """
+        if not self._pending and self._dropped <= (len(self.words) + len(self.phrases)) // 4:
+            return
+        pending, self._pending = self._pending, []
+        if len(pending) > 64 or self._dropped > (len(self.words) + len(self.phrases)) // 4:
+            tokens = list(self.postings)
+            self._dropped = 0
+            self.words = sorted(t for t in tokens if _is_word(t))
+            self.phrases = sorted(t for t in tokens if not _is_word(t))
+            return
+        words, phrases = list(self.words), list(self.phrases)
+        for token in pending:
+            vocabulary = words if _is_word(token) else phrases
+            i = bisect_left(vocabulary, token)
+            if token in self.postings and (i == len(vocabulary) or vocabulary[i] != token):
+                vocabulary.insert(i, token)
+        self.words, self.phrases = words, phrases
+
+    def _prefixed(self, prefix: str, vocabulary: List[str]) -> Iterator[str]:
+        postings = self.postings
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            if vocabulary[i] in postings:
+                yield vocabulary[i]
+            i += 1
+
+    def _fuzzy(self, token: str) -> List[str]:
+        if len(token) < 3:
+            return []
+        return sorted(t for t in _edits1(token) if t in self.postings)
+
+    def search(self, query: str, limit: Optional[int] = 50, fuzzy: bool = True) -> List[EntryKey]:
+        """Entries matching every query word, ranked exact, then prefix, then one-edit fuzzy.
+
+        Read-only: prefix matches come from the vocabularies as of the last
+        ``sync_vocabulary``.
+        """
+        text = query.lower().strip()
+        words = [word for word in _SPLIT.split(text) if word]
+        if not words:
+            return []
+        if words == [text]:
+            return self._search_word(text, limit, fuzzy)
+        return self._search_words(text, words, limit, fuzzy)
+
+    def _collect(self, tokens: Iterable[str], results: List[EntryKey], seen: Set[EntryKey], limit: Optional[int]) -> bool:
+        """Append the entries of ``tokens`` to ``results``; True once ``limit`` is reached."""
+        for token in tokens:
+            for entry in self.postings[token]:
+                if entry in seen:
+                    continue
+                seen.add(entry)
+                results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    return True
+        return False
+
+    def _search_word(self, word: str, limit: Optional[int], fuzzy: bool) -> List[EntryKey]:
+        results: List[EntryKey] = []
+        seen: Set[EntryKey] = set()
+        exact = [word] if word in self.postings else []
+        if self._collect(exact, results, seen, limit):
+            return results
+        if self._collect((t for t in self._prefixed(word, self.words) if t != word), results, seen, limit):
+            return results
+        if fuzzy and not results:
+            self._collect(self._fuzzy(word), results, seen, limit)
+        return results
+
+    def _search_words(self, text: str, words: List[str], limit: Optional[int], fuzzy: bool) -> List[EntryKey]:
+        """Multi-word query (``"crate 0042"``, ``"crate.0042"``): every word must match a token of the entry.
+
+        Whole values starting with the query rank first. Further candidates
+        come from the most selective word; the other words are checked against
+        each candidate's own tokens, so the posting list of a common word such
+        as a type name is never materialized.
+        """
+        results: List[EntryKey] = []
+        seen: Set[EntryKey] = set()
+        if self._collect(self._prefixed(text, self.phrases), results, seen, limit):
+            return results
+        matchers = []
+        for word in words:
+            expansion = []
+            for token in self._prefixed(word, self.words):
+                expansion.append(token)
+                if len(expansion) > _EXPANSION_CAP:
+                    break
+            fuzzy_words = None
+            if not expansion and fuzzy:
+                expansion = fuzzy_words = self._fuzzy(word)
+            if not expansion:
+                return results
+            capped = len(expansion) > _EXPANSION_CAP
+            size = float("inf") if capped else sum(len(self.postings[t]) for t in expansion)
+            matchers.append((size, word, fuzzy_words))
+        matchers.sort(key=lambda m: m[0])
+        _, pivot, pivot_fuzzy = matchers[0]
+        checks = [(word, set(fuzzy_words) if fuzzy_words else None) for _, word, fuzzy_words in matchers[1:]]
+        entry_tokens = self._entry_tokens
+        candidates = pivot_fuzzy if pivot_fuzzy else self._prefixed(pivot, self.words)
+        for token in candidates:
+            for entry in self.postings[token]:
+                if entry in seen:
+                    continue
+                tokens = entry_tokens[entry]
+                if all(
+                    tokens & fuzzy_words if fuzzy_words is not None else any(t.startswith(word) for t in tokens)
+                    for word, fuzzy_words in checks
+                ):
+                    seen.add(entry)
+                    results.append(entry)
+                    if limit is not None and len(results) >= limit:
+                        return results
+        return results
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
-
-SCENEGRAPH = SceneGraphLiveV3()
+# One live scenegraph per process: tools, orchestrators, snapshot ingest and the
+# bus subscription all share the instance defined next to the class.
+from mcpbla.server.bridge.scenegraph_live_v3 import SCENEGRAPH
 
+__all__ = ["SCENEGRAPH"]
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import deque
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from mcpbla.server.bridge.events import EVENT_BUS
+from mcpbla.server.bridge.scene_delta import SnapshotDiffer, apply_patch, field_patch
+
+DEFAULT_HISTORY_DELTAS = 32
+DEFAULT_HISTORY_OBJECTS = 200000
 
 
 @dataclass
@@ -13,15 +22,149 @@ class SceneSnapshot:
     metadata: Dict[str, Any]
 
 
+def _env_int(key: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(key) or default))
+    except ValueError:
+        return default
+
+
+def get_history_deltas() -> int:
+    """``MCP_SNAPSHOT_HISTORY``: deltas kept per session for ``get_snapshot_at``."""
+    return _env_int("MCP_SNAPSHOT_HISTORY", DEFAULT_HISTORY_DELTAS)
+
+
+def get_history_objects() -> int:
+    """``MCP_SNAPSHOT_HISTORY_OBJECTS``: object entries (added, removed, changed) kept across a session's deltas."""
+    return _env_int("MCP_SNAPSHOT_HISTORY_OBJECTS", DEFAULT_HISTORY_OBJECTS)
+
+
+class SessionHistory:
+    """Revisions of one session's snapshots: the latest state plus a bounded ring of reverse deltas.
+
+    Every stored snapshot is a new revision, diffed against the previous one
+    with a ``SnapshotDiffer``. The forward delta is returned (and emitted); the
+    ring keeps its reverse (removed records, added names, patches back to the
+    old field values), so an older revision is rebuilt by walking back from the
+    latest state, which the differ holds anyway. The ring drops its oldest
+    entries past ``max_deltas`` deltas or ``max_objects`` object entries, so
+    history memory is capped whatever the number of uploads.
+    """
+
+    def __init__(self, max_deltas: int, max_objects: int) -> None:
+        self.max_deltas = max_deltas
+        self.max_objects = max_objects
+        self.differ = SnapshotDiffer()
+        self.revision = 0
+        self.metadata: Dict[str, Any] = {}
+        # (revision, reverse delta from revision + 1 back to it, metadata at revision)
+        self.deltas: Deque[Tuple[int, Dict[str, Any], Dict[str, Any]]] = deque()
+        self._entries = 0
+
+    def record(self, snapshot: SceneSnapshot) -> Dict[str, Any]:
+        """Diff ``snapshot`` against the previous revision, keep the reverse delta and return the delta."""
+        previous = self.differ.objects
+        delta = self.differ.diff({"objects": snapshot.objects})
+        self.revision += 1
+        if self.revision > 1:
+            current = self.differ.objects
+            reverse = {
+                "objects_added": [previous[name] for name in delta["objects_removed"]],
+                "objects_removed": [obj["name"] for obj in delta["objects_added"]],
+                "objects_changed": [field_patch(current[p["name"]], previous[p["name"]]) for p in delta["objects_changed"]],
+            }
+            self.deltas.append((self.revision - 1, reverse, self.metadata))
+            self._entries += _size(reverse)
+            while self.deltas and (len(self.deltas) > self.max_deltas or self._entries > self.max_objects):
+                self._entries -= _size(self.deltas.popleft()[1])
+        self.metadata = snapshot.metadata
+        return delta
+
+    def oldest(self) -> int:
+        return self.deltas[0][0] if self.deltas else self.revision
+
+    def state_at(self, revision: int) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """Objects and metadata as of ``revision``; None when it left the ring or is not reached yet."""
+        if not self.oldest() <= revision <= self.revision or revision < 1:
+            return None
+        objects = dict(self.differ.objects)
+        metadata = self.metadata
+        for rev, reverse, meta in reversed(self.deltas):
+            if rev < revision:
+                break
+            _apply(objects, reverse)
+            metadata = meta
+        return list(objects.values()), metadata
+
+
+def _size(delta: Dict[str, Any]) -> int:
+    return len(delta["objects_added"]) + len(delta["objects_removed"]) + len(delta["objects_changed"])
+
+
+def _apply(objects: Dict[str, Dict[str, Any]], delta: Dict[str, Any]) -> None:
+    for name in delta["objects_removed"]:
+        objects.pop(name, None)
+    for obj in delta["objects_added"]:
+        objects[obj["name"]] = obj
+    for patch in delta["objects_changed"]:
+        if patch["name"] in objects:
+            objects[patch["name"]] = apply_patch(objects[patch["name"]], patch)
+
+
 _REGISTRY: Dict[str, SceneSnapshot] = {}
+_HISTORY: Dict[str, SessionHistory] = {}
 _LAST_SESSION_ID: Optional[str] = None
+_LOCK = threading.Lock()
+
 
+def store_snapshot(snapshot: SceneSnapshot) -> Dict[str, Any]:
+    """Store or replace the latest snapshot for a session and record it as a new revision.
 
-def store_snapshot(snapshot: SceneSnapshot) -> None:
-    """Store or replace the latest snapshot for a session."""
-    _REGISTRY[snapshot.session_id] = snapshot
+    Returns ``{"revision", "delta", "previous_session_id"}``: the session's new
+    revision, the delta from its previous snapshot and the session stored
+    before this one.
+    """
     global _LAST_SESSION_ID
-    _LAST_SESSION_ID = snapshot.session_id
+    with _LOCK:
+        history = _HISTORY.get(snapshot.session_id)
+        if history is None:
+            history = _HISTORY[snapshot.session_id] = SessionHistory(get_history_deltas(), get_history_objects())
+        delta = history.record(snapshot)
+        _REGISTRY[snapshot.session_id] = snapshot
+        previous, _LAST_SESSION_ID = _LAST_SESSION_ID, snapshot.session_id
+    return {"revision": history.revision, "delta": delta, "previous_session_id": previous}
+
+
+def ingest_snapshot(snapshot: SceneSnapshot, bus: Any = EVENT_BUS, full: bool = False) -> Dict[str, Any]:
+    """Store ``snapshot`` and publish what changed on ``bus``.
+
+    Emits ``scene.snapshot.delta`` with the delta from the session's previous
+    snapshot. The first snapshot of a session, one from a different session
+    than the last stored (the live scenegraph follows a single scene) or any
+    with ``full`` set is emitted whole as ``scene.snapshot.completed`` instead.
+    Every snapshot that becomes a delta base must come through here, so
+    subscribers always hold the state a delta applies to. Returns the revision
+    and the delta counts.
+    """
+    stored = store_snapshot(snapshot)
+    revision, delta = stored["revision"], stored["delta"]
+    if full or revision == 1 or stored["previous_session_id"] != snapshot.session_id:
+        body = {"session_id": snapshot.session_id, "objects": snapshot.objects, "metadata": snapshot.metadata}
+        bus.emit("scene.snapshot.completed", {"session_id": snapshot.session_id, "revision": revision, "snapshot": body})
+        full = True
+    else:
+        bus.emit(
+            "scene.snapshot.delta",
+            {"session_id": snapshot.session_id, "revision": revision, "delta": delta, "metadata": snapshot.metadata},
+        )
+        full = False
+    return {
+        "revision": revision,
+        "full": full,
+        "added": len(delta["objects_added"]),
+        "removed": len(delta["objects_removed"]),
+        "changed": len(delta["objects_changed"]),
+    }
 
 
 def get_snapshot(session_id: str) -> Optional[SceneSnapshot]:
@@ -29,6 +172,24 @@ def get_snapshot(session_id: str) -> Optional[SceneSnapshot]:
     return _REGISTRY.get(session_id)
 
 
+def get_snapshot_at(session_id: str, revision: int) -> Optional[SceneSnapshot]:
+    """The session's snapshot as of ``revision``, rebuilt from its history; None outside the kept range."""
+    with _LOCK:
+        history = _HISTORY.get(session_id)
+        state = history.state_at(revision) if history is not None else None
+    if state is None:
+        return None
+    objects, metadata = state
+    return SceneSnapshot(session_id=session_id, objects=objects, metadata=metadata)
+
+
+def get_history_range(session_id: str) -> Optional[Tuple[int, int]]:
+    """``(oldest, latest)`` revisions ``get_snapshot_at`` can serve for a session."""
+    with _LOCK:
+        history = _HISTORY.get(session_id)
+        return (history.oldest(), history.revision) if history is not None else None
+
+
 def get_last_snapshot() -> Optional[SceneSnapshot]:
     """Retrieve the most recently stored snapshot regardless of session."""
     if _LAST_SESSION_ID:
@@ -39,6 +200,7 @@ def get_last_snapshot() -> Optional[SceneSnapshot]:
 def clear_registry() -> None:
     """Utility for tests to reset state."""
     _REGISTRY.clear()
+    _HISTORY.clear()
     global _LAST_SESSION_ID
     _LAST_SESSION_ID = None
 
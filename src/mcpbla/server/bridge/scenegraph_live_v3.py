@@ -1,89 +1,440 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from mcpbla.server.bridge.scene_delta import compute_delta
+from mcpbla.server.bridge.object_store import ColumnarMap, object_map_type
+from mcpbla.server.bridge.persistent_map import EMPTY, MapEvolver, PersistentMap
+from mcpbla.server.bridge.scene_delta import apply_patch, compute_delta, is_patch
+from mcpbla.server.bridge.scene_index import TOKEN_FIELDS, SceneTokenIndex
+
+KINDS = ("objects", "materials", "modifiers", "nodes")
+# Removed entries remembered for ``describe(since=...)``; older revisions get a full description.
+MAX_TOMBSTONES = 10000
+# Events that mutate entries directly (snapshot events go through apply_snapshot/apply_delta).
+_ENTRY_EVENTS = {"object.created", "objects.created", "object.transformed", "material.updated", "modifier.added", "node.added"}
+# Optimistic index searches before ``find`` waits for the writer instead.
+_SEARCH_RETRIES = 3
+
+EntryKey = Tuple[str, str]
+
+
+class SceneGraphRoot:
+    """One immutable revision of the scenegraph.
+
+    Entries are ``PersistentMap``s shared with neighbouring revisions, and
+    ``changes`` maps ``(kind, key)`` to ``(revision, removed, created)`` in
+    revision order (an entry moves to the end when touched), so
+    ``describe(since=rev)`` walks back only over what changed after ``rev``.
+    Records are never mutated once published; writers replace them.
+    """
+
+    __slots__ = ("revision", "objects", "materials", "modifiers", "nodes", "last_snapshot", "snapshot_revision", "changes", "floor", "tombstones")
+
+    def __init__(
+        self,
+        revision: int = 0,
+        objects: PersistentMap = EMPTY,
+        materials: PersistentMap = EMPTY,
+        modifiers: PersistentMap = EMPTY,
+        nodes: PersistentMap = EMPTY,
+        last_snapshot: Optional[Dict[str, Any]] = None,
+        snapshot_revision: int = 0,
+        changes: PersistentMap = EMPTY,
+        floor: int = 0,
+        tombstones: int = 0,
+    ) -> None:
+        self.revision = revision
+        self.objects = objects
+        self.materials = materials
+        self.modifiers = modifiers
+        self.nodes = nodes
+        self.last_snapshot = last_snapshot
+        self.snapshot_revision = snapshot_revision
+        self.changes = changes
+        self.floor = floor
+        self.tombstones = tombstones
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.objects.get(key) or self.materials.get(key) or self.modifiers.get(key) or self.nodes.get(key)
+
+    def describe(self, since: Optional[int] = None) -> Dict[str, Any]:
+        """The whole scenegraph, or with ``since`` only the entries added, changed or removed after it.
+
+        A delta lists entries per kind under ``added``/``changed`` and keys
+        under ``removed``; ``last_snapshot`` is only included when a snapshot
+        arrived after ``since``. A ``since`` older than the tombstone history
+        (or newer than ``revision``) yields the full description with
+        ``full: true``.
+        """
+        if since is None or not self.floor <= since <= self.revision:
+            out = {
+                "revision": self.revision,
+                "objects": list(self.objects.values()),
+                "materials": list(self.materials.values()),
+                "modifiers": list(self.modifiers.values()),
+                "nodes": list(self.nodes.values()),
+                "last_snapshot": self.last_snapshot,
+            }
+            if since is not None:
+                out["full"] = True
+            return out
+        added: Dict[str, List[Any]] = {kind: [] for kind in KINDS}
+        changed: Dict[str, List[Any]] = {kind: [] for kind in KINDS}
+        removed: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        changes = self.changes
+        for entry in reversed(changes):
+            rev, gone, created = changes[entry]
+            if rev <= since:
+                break
+            kind, key = entry
+            if gone:
+                removed[kind].append(key)
+            elif created > since:
+                added[kind].append(getattr(self, kind)[key])
+            else:
+                changed[kind].append(getattr(self, kind)[key])
+        for section in (added, changed, removed):
+            for items in section.values():
+                items.reverse()
+        out = {"revision": self.revision, "since": since, "full": False, "added": added, "changed": changed, "removed": removed}
+        if self.snapshot_revision > since:
+            out["last_snapshot"] = self.last_snapshot
+        return out
+
+
+class _Revision:
+    """The writes that make up the next root; evolvers are opened for the kinds it touches."""
+
+    def __init__(self, root: SceneGraphRoot, index: SceneTokenIndex) -> None:
+        self.root = root
+        self.index = index
+        self.revision = root.revision + 1
+        self.entries: Dict[str, MapEvolver] = {}
+        self.changes = root.changes.evolver()
+        self.tombstones = root.tombstones
+        self.floor = root.floor
+        self.last_snapshot = root.last_snapshot
+        self.snapshot_revision = root.snapshot_revision
+
+    def kind(self, kind: str) -> MapEvolver:
+        entries = self.entries.get(kind)
+        if entries is None:
+            entries = self.entries[kind] = getattr(self.root, kind).evolver()
+        return entries
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        entries = self.entries.get(kind)
+        return entries.get(key) if entries is not None else getattr(self.root, kind).get(key)
+
+    def put(self, kind: str, key: str, item: Dict[str, Any], reindex: bool = True) -> None:
+        """Store ``item``; pass ``reindex=False`` when only unindexed fields (locations) changed."""
+        entries = self.kind(kind)
+        existed = key in entries
+        entries[key] = item
+        if reindex:
+            self.index.add(kind, key, item)
+        self.mark(kind, key, existed=existed)
+
+    def drop(self, kind: str, key: str) -> None:
+        self.kind(kind).discard(key)
+        self.index.remove(kind, key)
+        self.mark(kind, key, removed=True)
+
+    def mark(self, kind: str, key: str, removed: bool = False, existed: bool = False) -> None:
+        """Log ``(kind, key)`` as written (or removed) at this revision.
+
+        ``existed`` says the entry was already present; entries loaded by the
+        first snapshot are not logged, so without a log record that is the
+        only way to tell a change from an addition.
+        """
+        entry = (kind, key)
+        previous = self.changes.get(entry)
+        if previous is not None and previous[1]:
+            self.tombstones -= 1
+        if removed:
+            self.tombstones += 1
+            created = 0
+        elif previous is not None and not previous[1]:
+            created = previous[2]
+        else:
+            created = 0 if existed else self.revision
+        self.changes.move_to_end(entry, (self.revision, removed, created))
+
+    def install(self, snapshot: Dict[str, Any], entries: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Replace each kind present in ``entries``, marking only what differs from the current root.
+
+        Kinds the snapshot does not carry (an object-only upload has no
+        materials, modifiers or nodes) keep the entries built from events.
+        Objects go to the store ``object_map_type`` picks for the scene size.
+        With the columnar store the kept ``last_snapshot`` drops its object
+        list, which would otherwise pin every incoming record in memory.
+        """
+        object_store = object_map_type(len(entries.get("objects", {})))
+        # Loading into an empty graph: log nothing and raise the floor, so older revisions get a full description.
+        first = not any(len(getattr(self.root, kind)) for kind in KINDS)
+        if first:
+            self.changes = EMPTY.evolver()
+            self.tombstones = 0
+            self.floor = self.revision
+        for kind in KINDS:
+            if kind not in entries:
+                continue
+            old, new = getattr(self.root, kind), entries[kind]
+            for key in old:
+                if key not in new:
+                    self.mark(kind, key, removed=True)
+            for key, item in () if first else new.items():
+                prev = old.get(key)
+                if prev is None or (prev is not item and prev != item):
+                    self.mark(kind, key, existed=prev is not None)
+            store = object_store if kind == "objects" else PersistentMap
+            self.entries[kind] = store.from_dict(new).evolver()
+            self.index.replace(kind, new)
+        if object_store is ColumnarMap and "objects" in snapshot:
+            snapshot = {**snapshot, "objects": None, "objects_count": len(entries.get("objects", {}))}
+        self.last_snapshot = snapshot
+        self.snapshot_revision = self.revision
+
+    def commit(self) -> SceneGraphRoot:
+        root = self.root
+        changes = self.changes.persistent()
+        floor, tombstones = self.floor, self.tombstones
+        if tombstones > MAX_TOMBSTONES:
+            # Forget the oldest half of the removals; ``describe`` falls back to full below the new floor.
+            trimmed = changes.evolver()
+            for entry, (rev, removed, _) in changes.items():
+                if tombstones <= MAX_TOMBSTONES // 2:
+                    break
+                if removed:
+                    trimmed.discard(entry)
+                    tombstones -= 1
+                    floor = max(floor, rev)
+            changes = trimmed.persistent()
+        kinds = {kind: self.entries[kind].persistent() if kind in self.entries else getattr(root, kind) for kind in KINDS}
+        # Vocabulary upkeep is the writer's job; searches never write the shared index.
+        self.index.sync_vocabulary()
+        return SceneGraphRoot(
+            self.revision,
+            last_snapshot=self.last_snapshot,
+            snapshot_revision=self.snapshot_revision,
+            changes=changes,
+            floor=floor,
+            tombstones=tombstones,
+            **kinds,
+        )
 
 
 class SceneGraphLiveV3:
+    """Live scene state fed by snapshots, deltas and bridge events.
+
+    State is published as immutable ``SceneGraphRoot`` revisions. Writers
+    (bus handlers, snapshot ingest) serialize on a lock, build the next root
+    from the current one with structural sharing and swap it in with a single
+    reference assignment; readers take ``view()`` (or go through ``describe``
+    and ``get``) without locking and keep a consistent revision for as long as
+    they hold it. Every mutation path bumps ``revision``.
+    """
+
     def __init__(self) -> None:
-        self.objects: Dict[str, Dict[str, Any]] = {}
-        self.materials: Dict[str, Dict[str, Any]] = {}
-        self.modifiers: Dict[str, Dict[str, Any]] = {}
-        self.nodes: Dict[str, Dict[str, Any]] = {}
-        self.last_snapshot: Optional[Dict[str, Any]] = None
+        self._root = SceneGraphRoot()
+        self._lock = threading.Lock()
+        self.index = SceneTokenIndex()
+
+    def view(self) -> SceneGraphRoot:
+        """The current revision; O(1), never blocks and never changes underneath the caller."""
+        return self._root
+
+    @property
+    def revision(self) -> int:
+        return self._root.revision
+
+    @property
+    def objects(self) -> PersistentMap:
+        return self._root.objects
+
+    @property
+    def materials(self) -> PersistentMap:
+        return self._root.materials
+
+    @property
+    def modifiers(self) -> PersistentMap:
+        return self._root.modifiers
+
+    @property
+    def nodes(self) -> PersistentMap:
+        return self._root.nodes
+
+    @property
+    def last_snapshot(self) -> Optional[Dict[str, Any]]:
+        return self._root.last_snapshot
+
+    @property
+    def store(self) -> str:
+        """``columnar`` or ``dict``: how objects are held (see ``object_store.object_map_type``)."""
+        return "columnar" if isinstance(self._root.objects, ColumnarMap) else "dict"
+
+    @contextmanager
+    def _write(self) -> Iterator[_Revision]:
+        with self._lock:
+            revision = _Revision(self._root, self.index)
+            try:
+                yield revision
+            except BaseException:
+                # The root was not published; bring the index back in line with it.
+                for kind in KINDS:
+                    self.index.replace(kind, dict(getattr(self._root, kind).items()))
+                self.index.sync_vocabulary()
+                raise
+            self._root = revision.commit()
 
     def apply_snapshot(self, snapshot: Dict[str, Any]) -> None:
-        self.objects = {obj["name"]: obj for obj in snapshot.get("objects", []) if "name" in obj}
-        self.materials = {mat.get("name", f"mat_{i}"): mat for i, mat in enumerate(snapshot.get("materials", []))}
-        self.modifiers = {mod.get("id", f"mod_{i}"): mod for i, mod in enumerate(snapshot.get("modifiers", []))}
-        self.nodes = {node.get("id", f"node_{i}"): node for i, node in enumerate(snapshot.get("nodes", []))}
-        self.last_snapshot = snapshot
+        entries = {"objects": {obj["name"]: obj for obj in snapshot.get("objects", []) if "name" in obj}}
+        if "materials" in snapshot:
+            entries["materials"] = {mat.get("name", f"mat_{i}"): mat for i, mat in enumerate(snapshot["materials"])}
+        if "modifiers" in snapshot:
+            entries["modifiers"] = {mod.get("id", f"mod_{i}"): mod for i, mod in enumerate(snapshot["modifiers"])}
+        if "nodes" in snapshot:
+            entries["nodes"] = {node.get("id", f"node_{i}"): node for i, node in enumerate(snapshot["nodes"])}
+        with self._write() as rev:
+            rev.install(snapshot, entries)
+
+    def apply_indexed_snapshot(self, snapshot: Dict[str, Any], objects: Dict[str, Dict[str, Any]]) -> None:
+        """Install a snapshot whose objects were already indexed by name (streamed ingest)."""
+        with self._write() as rev:
+            rev.install(snapshot, {"objects": objects})
 
     def apply_delta(self, delta: Dict[str, Any]) -> None:
-        for obj in delta.get("objects_added", []):
-            if isinstance(obj, dict) and "name" in obj:
-                self.objects[obj["name"]] = obj
-        for name in delta.get("objects_removed", []):
-            if name in self.objects:
-                self.objects.pop(name, None)
-        for obj in delta.get("objects_changed", []):
-            if isinstance(obj, dict) and "name" in obj:
-                self.objects[obj["name"]] = obj
+        """Apply a ``compute_delta`` delta; ``objects_changed`` holds field patches or whole records.
+
+        A patch rewrites only the fields it names on the stored record (a patch
+        for an unknown object is skipped) and leaves the search index alone
+        unless an indexed field changed.
+        """
+        with self._write() as rev:
+            for obj in delta.get("objects_added", []):
+                if isinstance(obj, dict) and "name" in obj:
+                    rev.put("objects", obj["name"], obj)
+            for name in delta.get("objects_removed", []):
+                if rev.get("objects", name) is not None:
+                    rev.drop("objects", name)
+            for obj in delta.get("objects_changed", []):
+                if is_patch(obj):
+                    current = rev.get("objects", obj.get("name"))
+                    if current is not None:
+                        fields = {*obj["set"], *obj.get("unset", ())}
+                        rev.put("objects", obj["name"], apply_patch(current, obj), reindex=not fields.isdisjoint(TOKEN_FIELDS))
+                elif isinstance(obj, dict) and "name" in obj:
+                    rev.put("objects", obj["name"], obj)
 
     def on_event(self, event_name: str, payload: Dict[str, Any]) -> None:
+        if event_name in _ENTRY_EVENTS:
+            with self._write() as rev:
+                self._apply_event(rev, event_name, payload)
+        elif event_name == "scene.snapshot.delta":
+            delta = payload.get("delta", {})
+            self.apply_delta(delta)
+        elif event_name == "scene.snapshot.completed":
+            snap = payload.get("snapshot")
+            if snap:
+                self.apply_snapshot(snap)
+        elif event_name == "batch.completed" and not payload.get("rolled_back"):
+            # The addon folds a batch's per-action events into its summary event.
+            self.on_events(
+                [(item["event"], item.get("data") or {}) for item in payload.get("events") or [] if isinstance(item, dict) and item.get("event")]
+            )
+
+    @staticmethod
+    def _apply_event(rev: _Revision, event_name: str, payload: Dict[str, Any]) -> None:
         if event_name == "object.created":
             name = payload.get("name")
             if name:
-                self.objects[name] = {**self.objects.get(name, {}), "name": name, "event": "created"}
+                rev.put("objects", name, {**(rev.get("objects", name) or {}), "name": name, "event": "created"})
+        elif event_name == "objects.created":
+            for name in payload.get("names") or []:
+                rev.put("objects", name, {**(rev.get("objects", name) or {}), "name": name, "event": "created"})
         elif event_name == "object.transformed":
             name = payload.get("name")
-            if name and name in self.objects:
-                self.objects[name].update({"location": payload.get("location")})
+            obj = rev.get("objects", name) if name else None
+            if obj is not None:
+                rev.put("objects", name, {**obj, "location": payload.get("location")}, reindex=False)
         elif event_name == "material.updated":
             name = payload.get("material") or payload.get("name")
             if name:
-                self.materials[name] = {**self.materials.get(name, {}), "name": name, "event": "updated"}
+                rev.put("materials", name, {**(rev.get("materials", name) or {}), "name": name, "event": "updated"})
         elif event_name == "modifier.added":
             obj = payload.get("object")
             mod = payload.get("modifier")
             if obj and mod:
                 key = f"{obj}:{mod}"
-                self.modifiers[key] = {"object": obj, "modifier": mod}
+                rev.put("modifiers", key, {"object": obj, "modifier": mod})
         elif event_name == "node.added":
             mat = payload.get("material")
             node_type = payload.get("type")
             node_name = payload.get("node")
             key = node_name or f"{mat}:{node_type}"
-            self.nodes[key] = {"material": mat, "type": node_type, "node": node_name}
-        elif event_name == "scene.snapshot.delta":
-            delta = payload.get("delta", {})
-            self.apply_delta(delta)
-        elif event_name == "scene.snapshot.completed":
-            snap = payload.get("snapshot")
-            if snap:
-                self.apply_snapshot(snap)
+            rev.put("nodes", key, {"material": mat, "type": node_type, "node": node_name})
 
-    def describe(self) -> Dict[str, Any]:
-        return {
-            "objects": list(self.objects.values()),
-            "materials": list(self.materials.values()),
-            "modifiers": list(self.modifiers.values()),
-            "nodes": list(self.nodes.values()),
-            "last_snapshot": self.last_snapshot,
-        }
-
-    def find(self, query: str) -> List[Dict[str, Any]]:
-        results: List[Dict[str, Any]] = []
-        for collection in (self.objects, self.materials, self.modifiers, self.nodes):
-            for item in collection.values():
-                if query.lower() in str(item).lower():
-                    results.append(item)
-        return results
+    def on_events(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Apply a batch of bus events in one pass.
+
+        Runs of ``object.transformed`` events are folded into the last location
+        per object and written once; other events go through ``on_event`` in
+        order, so the result matches applying the batch event by event.
+        """
+        locations: Dict[str, Any] = {}
+        for event_name, payload in events:
+            if event_name == "object.transformed":
+                name = payload.get("name")
+                if name:
+                    locations[name] = payload.get("location")
+                continue
+            if locations:
+                self._apply_locations(locations)
+                locations = {}
+            self.on_event(event_name, payload)
+        if locations:
+            self._apply_locations(locations)
+
+    def _apply_locations(self, locations: Dict[str, Any]) -> None:
+        with self._write() as rev:
+            for name, location in locations.items():
+                obj = rev.get("objects", name)
+                if obj is not None:
+                    rev.put("objects", name, {**obj, "location": location}, reindex=False)
+
+    def describe(self, since: Optional[int] = None) -> Dict[str, Any]:
+        return self._root.describe(since)
+
+    def find(self, query: str, limit: Optional[int] = 50, fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """Entries whose names, types, materials or modifier types match ``query``.
+
+        Served from the token index: exact tokens rank first, then prefixes,
+        then (with ``fuzzy``) tokens one edit away. An empty query lists entries.
+        The index is shared with the writer, so a search that races a write is
+        retried and, after ``_SEARCH_RETRIES`` attempts, runs under the write
+        lock; hits are resolved against one root.
+        """
+        root = self._root
+        if not query.strip():
+            items = (item for kind in KINDS for item in getattr(root, kind).values())
+            return list(items) if limit is None else [item for _, item in zip(range(limit), items)]
+        for _ in range(_SEARCH_RETRIES):
+            try:
+                keys = self.index.search(query, limit=limit, fuzzy=fuzzy)
+                break
+            except (RuntimeError, KeyError):  # a dict changed size / a posting vanished mid-search
+                continue
+        else:
+            with self._lock:
+                root = self._root
+                keys = self.index.search(query, limit=limit, fuzzy=fuzzy)
+        hits = (getattr(root, kind).get(key) for kind, key in keys)
+        return [item for item in hits if item is not None]
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
-        return self.objects.get(key) or self.materials.get(key) or self.modifiers.get(key) or self.nodes.get(key)
+        return self._root.get(key)
 
 
 SCENEGRAPH = SceneGraphLiveV3()
-
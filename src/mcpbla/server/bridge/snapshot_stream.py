@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from mcpbla.server.bridge import scenegraph_live
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+SNAPSHOT_STREAM_PATH = "/bridge/snapshot/stream"
+
+
+class SnapshotStreamIngestor:
+    """Incrementally ingest an NDJSON snapshot stream (``header``/``page``/``end`` records).
+
+    Bytes can arrive in arbitrary chunks; only the trailing partial line is
+    buffered. Pages are indexed into a staging map as they arrive and the
+    snapshot is committed once the ``end`` record confirms the object count,
+    so readers never observe a half-ingested scene and a truncated stream
+    leaves the previous state intact. By default the commit goes through
+    ``scenegraph_live.ingest_snapshot`` like a posted snapshot: it is recorded
+    in the session history and published whole as ``scene.snapshot.completed``,
+    which the shared scenegraph applies from the bus. With an explicit
+    ``scenegraph`` the snapshot is installed into that graph only.
+    """
+
+    def __init__(self, scenegraph: Optional[SceneGraphLiveV3] = None) -> None:
+        self.scenegraph = scenegraph
+        self.revision: Optional[int] = None
+        self.session_id: Optional[str] = None
+        self.metadata: Dict[str, Any] = {}
+        self.objects: List[Dict[str, Any]] = []
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.pages = 0
+        self.committed = False
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> None:
+        data = self._tail + chunk
+        lines = data.split(b"\n")
+        self._tail = lines.pop()
+        for line in lines:
+            if line.strip():
+                self.feed_record(json.loads(line))
+
+    def feed_record(self, record: Dict[str, Any]) -> None:
+        kind = record.get("type")
+        if self.committed:
+            raise ValueError("Snapshot stream already ended")
+        if kind == "error":
+            raise ValueError(f"Snapshot stream failed: {record.get('error')}")
+        if kind == "header":
+            self.session_id = record.get("session_id") or "default"
+            self.metadata = record.get("metadata") or {}
+            return
+        if self.session_id is None:
+            raise ValueError("Snapshot stream must start with a header record")
+        if kind == "page":
+            for obj in record.get("objects") or []:
+                if isinstance(obj, dict) and "name" in obj:
+                    self.objects.append(obj)
+                    self.index[obj["name"]] = obj
+            self.pages += 1
+        elif kind == "end":
+            expected = record.get("count")
+            if expected is not None and expected != len(self.objects):
+                raise ValueError(f"Snapshot stream announced {expected} objects, received {len(self.objects)}")
+            self._commit()
+
+    def _commit(self) -> None:
+        if self.scenegraph is not None:
+            self.scenegraph.apply_indexed_snapshot(
+                {"session_id": self.session_id, "objects": self.objects, "metadata": self.metadata}, self.index
+            )
+        else:
+            snapshot = scenegraph_live.SceneSnapshot(session_id=self.session_id, objects=self.objects, metadata=self.metadata)
+            self.revision = scenegraph_live.ingest_snapshot(snapshot, full=True)["revision"]
+        self.committed = True
+
+    def close(self) -> Dict[str, Any]:
+        """Flush the final line and return a summary; raises if the stream was truncated."""
+        if self._tail.strip():
+            self.feed_record(json.loads(self._tail))
+        self._tail = b""
+        if not self.committed:
+            raise ValueError("Snapshot stream ended before its end record")
+        summary = {"session_id": self.session_id, "objects_count": len(self.objects), "pages": self.pages, "metadata": self.metadata}
+        if self.revision is not None:
+            summary["revision"] = self.revision
+        return summary
+
+
+def ingest_stream(chunks: Iterable[bytes], scenegraph: Optional[SceneGraphLiveV3] = None) -> Dict[str, Any]:
+    ingestor = SnapshotStreamIngestor(scenegraph)
+    for chunk in chunks:
+        ingestor.feed(chunk)
+    return ingestor.close()
+
+
+def encode_records(records: Iterable[Dict[str, Any]]) -> Iterable[bytes]:
+    for record in records:
+        yield json.dumps(record).encode("utf-8") + b"\n"
@@ -3,21 +3,33 @@ from __future__ import annotations
 from typing import Callable, Optional
 
 from mcpbla.server.bridge.bridge_pool import get_bridge_pool  # backward compat
-from mcpbla.server.bridge.env import resolve_bridge_enabled
+from mcpbla.server.bridge.coalescer import DEFAULT_MAX_BATCH
+from mcpbla.server.bridge.env import resolve_bridge_coalesce, resolve_bridge_enabled, resolve_bridge_transport
 from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
 from mcpbla.server.bridge.router_v2 import RouterV2
 from mcpbla.server.bridge.scenegraph_live_v3 import SCENEGRAPH
 from mcpbla.server.bridge.events import EVENT_BUS
 from mcpbla.server.bridge.http_bridge import get_http_handler_from_env
+from mcpbla.server.bridge.ws_bridge import get_ws_handler_from_env
 
 import os
 
+_SCENEGRAPH_SUBSCRIBED = False
+
+
+def subscribe_scenegraph() -> None:
+    """Feed bus events to the shared ``SCENEGRAPH``; repeated calls subscribe it only once."""
+    global _SCENEGRAPH_SUBSCRIBED
+    if not _SCENEGRAPH_SUBSCRIBED:
+        EVENT_BUS.subscribe_many("*", SCENEGRAPH.on_events)
+        _SCENEGRAPH_SUBSCRIBED = True
+
 
 def configure_bridge_pool(handler: Optional[Callable[[str, dict], dict]] = None):
     pool = get_bridge_pool_v2()
     if handler:
         pool.set_handler(handler)
-    EVENT_BUS.subscribe("*", SCENEGRAPH.on_event)
+    subscribe_scenegraph()
     return pool
 
 
@@ -33,18 +45,23 @@ def configure_bridge_from_env(enabled_override: Optional[bool] = None) -> bool:
 
     pool_v2 = get_bridge_pool_v2()
     if pool_v2.has_handler():
-        EVENT_BUS.subscribe("*", SCENEGRAPH.on_event)
+        subscribe_scenegraph()
         return True
 
-    handler = get_http_handler_from_env(force_enabled=enabled)
+    if resolve_bridge_transport() == "ws":
+        handler = get_ws_handler_from_env(force_enabled=enabled)
+    else:
+        handler = get_http_handler_from_env(force_enabled=enabled)
     if not handler:
         return False
 
     pool_v2.set_handler(handler)
+    if resolve_bridge_coalesce():
+        pool_v2.enable_coalescing(max_batch=int(os.getenv("BRIDGE_COALESCE_MAX_BATCH") or DEFAULT_MAX_BATCH))
 
     legacy_pool = get_bridge_pool()
     if not legacy_pool.has_handler():
         legacy_pool.set_router(handler)
 
-    EVENT_BUS.subscribe("*", SCENEGRAPH.on_event)
+    subscribe_scenegraph()
     return True
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from mcpbla.server.bridge import ws_frames
+from mcpbla.server.bridge.balancer import MultiEndpointHandler
+from mcpbla.server.bridge.events import EVENT_BUS
+from mcpbla.server.bridge.http_bridge import _resolve_bridge_urls_from_env, get_bridge_timeout_seconds
+from mcpbla.server.bridge.latency import RouteLatencyTracker
+from mcpbla.server.tools.tool_response import BRIDGE_BAD_RESPONSE, BRIDGE_TIMEOUT, BRIDGE_UNREACHABLE, err
+
+
+class WebSocketBridgeChannel:
+    """Persistent full-duplex bridge channel multiplexing many in-flight routes.
+
+    Requests are matched to responses by ``correlation_id`` so they may complete
+    out of order. Events pushed by the addon are published on ``EVENT_BUS`` and
+    every response is also published as an ``ack`` event, which is what
+    ``ActionEngineV3(wait_for_ack=True)`` listens for.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float | None = None,
+        event_sink: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+        emit_acks: bool = True,
+        latency: Optional[RouteLatencyTracker] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout if timeout is not None else get_bridge_timeout_seconds()
+        self.latency = latency or RouteLatencyTracker.from_env(self.timeout)
+        self.event_sink = event_sink or EVENT_BUS.emit
+        self.emit_acks = emit_acks
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[threading.Thread] = None
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def connect(self) -> None:
+        with self._lock:
+            if self._sock is not None:
+                return
+            parts = urlsplit(self.base_url)
+            host = parts.hostname or "127.0.0.1"
+            port = parts.port or 80
+            sock = socket.create_connection((host, port), timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            key = ws_frames.new_client_key()
+            handshake = (
+                f"GET {parts.path.rstrip('/')}{ws_frames.WS_PATH} HTTP/1.1\r\n"
+                f"Host: {host}:{port}\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n"
+            )
+            sock.sendall(handshake.encode("ascii"))
+            rfile = sock.makefile("rb")
+            status_line = rfile.readline().decode("latin-1")
+            headers: Dict[str, str] = {}
+            while True:
+                line = rfile.readline().decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if " 101 " not in status_line or headers.get("sec-websocket-accept") != ws_frames.accept_key(key):
+                sock.close()
+                raise ConnectionError(f"WebSocket handshake rejected: {status_line.strip()}")
+            sock.settimeout(None)
+            self._sock = sock
+            self._reader = threading.Thread(
+                target=self._read_loop, args=(sock, rfile), name="mcpbla-bridge-ws", daemon=True
+            )
+            self._reader.start()
+
+    def close(self) -> None:
+        with self._lock:
+            sock = self._sock
+            self._sock = None
+        if sock is not None:
+            try:
+                with self._send_lock:
+                    sock.sendall(ws_frames.encode_frame(ws_frames.OP_CLOSE, b"", mask=True))
+            except OSError:
+                pass
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        self._fail_pending("Bridge channel closed")
+
+    def _send(self, opcode: int, data: bytes) -> None:
+        sock = self._sock
+        if sock is None:
+            raise ConnectionError("Bridge channel not connected")
+        frame = ws_frames.encode_frame(opcode, data, mask=True)
+        with self._send_lock:
+            sock.sendall(frame)
+
+    def _submit(self, route: str, payload: Dict[str, Any]) -> tuple[str, Future]:
+        self.connect()
+        corr = payload.get("correlation_id") if isinstance(payload, dict) else None
+        future: Future = Future()
+        with self._lock:
+            if not corr or corr in self._pending:
+                corr = str(uuid.uuid4())
+            self._pending[corr] = future
+        frame = {"type": "request", "route": route, "payload": payload, "correlation_id": corr}
+        try:
+            self._send(ws_frames.OP_TEXT, json.dumps(frame).encode("utf-8"))
+        except Exception:
+            with self._lock:
+                self._pending.pop(corr, None)
+            self._drop(self._sock)
+            raise
+        return corr, future
+
+    def _forget(self, corr: str) -> None:
+        with self._lock:
+            self._pending.pop(corr, None)
+
+    def __call__(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        timeout = self.latency.timeout_for(route)
+        start = time.perf_counter()
+        try:
+            corr, future = self._submit(route, payload)
+        except OSError as exc:
+            return err(BRIDGE_UNREACHABLE, str(exc), {"exception": str(exc), "attempts": 1})
+        try:
+            resp = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._forget(corr)
+            self.latency.record(route, timeout)
+            return err(BRIDGE_TIMEOUT, "Bridge timeout", {"correlation_id": corr, "attempts": 1})
+        self.latency.record(route, time.perf_counter() - start)
+        return resp
+
+    async def acall(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        timeout = self.latency.timeout_for(route)
+        start = time.perf_counter()
+        try:
+            if not self.connected:
+                await asyncio.to_thread(self.connect)
+            corr, future = self._submit(route, payload)
+        except OSError as exc:
+            return err(BRIDGE_UNREACHABLE, str(exc), {"exception": str(exc), "attempts": 1})
+        try:
+            resp = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._forget(corr)
+            self.latency.record(route, timeout)
+            return err(BRIDGE_TIMEOUT, "Bridge timeout", {"correlation_id": corr, "attempts": 1})
+        self.latency.record(route, time.perf_counter() - start)
+        return resp
+
+    def _read_loop(self, sock: socket.socket, rfile) -> None:
+        try:
+            while True:
+                opcode, raw = ws_frames.read_message(rfile, on_ping=lambda data: self._send(ws_frames.OP_PONG, data))
+                if opcode != ws_frames.OP_TEXT:
+                    continue
+                try:
+                    message = json.loads(raw.decode("utf-8"))
+                except json.JSONDecodeError:
+                    continue
+                self._dispatch(message)
+        except Exception:  # noqa: BLE001
+            pass
+        self._drop(sock)
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        kind = message.get("type")
+        corr = message.get("correlation_id")
+        if kind == "response":
+            with self._lock:
+                future = self._pending.pop(corr, None)
+            if not isinstance(message.get("ok"), bool):
+                resp = err(BRIDGE_BAD_RESPONSE, "Invalid response frame", {"attempts": 1})
+            else:
+                resp = {
+                    "ok": message["ok"],
+                    "data": message.get("data"),
+                    "error": message.get("error"),
+                    "request_id": corr,
+                }
+            if self.emit_acks and corr:
+                self.event_sink(
+                    "ack",
+                    {
+                        "correlation_id": corr,
+                        "status": "success" if resp.get("ok") else "error",
+                        "data": resp.get("data"),
+                        "error": resp.get("error"),
+                    },
+                )
+                # batch.execute results carry each action's correlation id; ack those actions too.
+                for item in resp.get("data") if isinstance(resp.get("data"), list) else ():
+                    if isinstance(item, dict) and item.get("request_id"):
+                        self.event_sink(
+                            "ack",
+                            {
+                                "correlation_id": item["request_id"],
+                                "status": "success" if item.get("ok") else "error",
+                                "data": item.get("data"),
+                                "error": item.get("error"),
+                            },
+                        )
+            if future is not None and not future.done():
+                future.set_result(resp)
+        elif kind == "event" and message.get("event"):
+            self.event_sink(message["event"], message.get("data") or {})
+
+    def _drop(self, sock: Optional[socket.socket]) -> None:
+        with self._lock:
+            if sock is None or self._sock is not sock:
+                return
+            self._sock = None
+        try:
+            sock.close()
+        except OSError:
+            pass
+        self._fail_pending("Bridge channel closed")
+
+    def _fail_pending(self, message: str) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for corr, future in pending.items():
+            if not future.done():
+                future.set_result(err(BRIDGE_UNREACHABLE, message, {"correlation_id": corr, "attempts": 1}))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = len(self._pending)
+        return {"connected": self.connected, "in_flight": in_flight, "latency": self.latency.snapshot()}
+
+
+def get_ws_handler_from_env(force_enabled: bool = False):
+    """Return a WebSocket channel (or a balancer over several) if bridge env configuration is available."""
+    urls = _resolve_bridge_urls_from_env(force_enabled=force_enabled)
+    if not urls:
+        return None
+    timeout = get_bridge_timeout_seconds()
+    if len(urls) > 1:
+        return MultiEndpointHandler.from_urls(urls, lambda url: WebSocketBridgeChannel(url, timeout=timeout))
+    return WebSocketBridgeChannel(urls[0], timeout=timeout)
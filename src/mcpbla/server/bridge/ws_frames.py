@@ -0,0 +1,109 @@
+"""Minimal RFC 6455 framing shared by the server channel and the Blender addon listener.
+
+Stdlib only, so the addon can import it inside Blender's bundled Python.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import struct
+from typing import BinaryIO, Optional, Tuple
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_PATH = "/bridge/ws"
+
+OP_CONT = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class WebSocketClosed(ConnectionError):
+    """Raised when the peer closes the channel or the socket hits EOF."""
+
+
+def accept_key(client_key: str) -> str:
+    digest = hashlib.sha1((client_key + WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def new_client_key() -> str:
+    return base64.b64encode(os.urandom(16)).decode("ascii")
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool) -> bytes:
+    """Encode a single final frame; client-to-server frames must be masked."""
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if not mask:
+        return bytes(header) + payload
+    key = os.urandom(4)
+    return bytes(header) + key + _apply_mask(payload, key)
+
+
+def _apply_mask(payload: bytes, key: bytes) -> bytes:
+    if not payload:
+        return payload
+    repeated = (key * (len(payload) // 4 + 1))[: len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if data is None or len(data) < size:
+        raise WebSocketClosed("Connection closed")
+    return data
+
+
+def read_frame(stream: BinaryIO) -> Tuple[bool, int, bytes]:
+    """Read one frame and return ``(fin, opcode, unmasked_payload)``."""
+    b1, b2 = _read_exact(stream, 2)
+    fin = bool(b1 & 0x80)
+    opcode = b1 & 0x0F
+    length = b2 & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", _read_exact(stream, 2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", _read_exact(stream, 8))
+    key: Optional[bytes] = _read_exact(stream, 4) if b2 & 0x80 else None
+    payload = _read_exact(stream, length) if length else b""
+    if key:
+        payload = _apply_mask(payload, key)
+    return fin, opcode, payload
+
+
+def read_message(stream: BinaryIO, on_ping=None) -> Tuple[int, bytes]:
+    """Read a complete (possibly fragmented) data message, answering control frames inline.
+
+    Raises ``WebSocketClosed`` when the peer sends a close frame.
+    """
+    opcode = None
+    chunks = []
+    while True:
+        fin, op, payload = read_frame(stream)
+        if op == OP_CLOSE:
+            raise WebSocketClosed("Peer closed channel")
+        if op == OP_PING:
+            if on_ping is not None:
+                on_ping(payload)
+            continue
+        if op == OP_PONG:
+            continue
+        if op != OP_CONT:
+            opcode = op
+        chunks.append(payload)
+        if fin:
+            return opcode if opcode is not None else OP_TEXT, b"".join(chunks)
@@ -13,5 +13,12 @@ class ContractResult:
     def to_dict(self) -> Dict[str, Any]:
         return {"ok": self.ok, "data": self.data or {}, "error": self.error}
 
+    @classmethod
+    def from_response(cls, resp: Any) -> "ContractResult":
+        """Build a result from a bridge pool response dict."""
+        if isinstance(resp, dict) and resp.get("ok"):
+            return cls(ok=True, data=resp.get("data"))
+        return cls(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+
 
 Vector3 = List[float]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from mcpbla.server.core.contracts.common_types import ContractResult
+from mcpbla.server.core.contracts.common_types import ContractResult, Vector3
 
 
 @dataclass
@@ -20,3 +20,58 @@ class CreateCubeContract:
             return ContractResult(ok=False, error="Size must be numeric")
         return ContractResult(ok=True, data={"name": self.name, "size": float(self.size)})
 
+
+
+PRIMITIVE_SHAPES = ("cube",)
+
+
+def _flatten_vectors(field: str, vectors: Optional[List[Vector3]], count: int) -> Optional[List[float]]:
+    """Flatten ``[[x, y, z], ...]`` into the flat layout ``foreach_set`` expects."""
+    if vectors is None:
+        return None
+    if not isinstance(vectors, list) or len(vectors) != count:
+        raise ValueError(f"{field} must have one [x, y, z] entry per name")
+    flat: List[float] = []
+    for vec in vectors:
+        if not isinstance(vec, (list, tuple)) or len(vec) != 3:
+            raise ValueError(f"{field} entries must be [x, y, z]")
+        flat.extend(float(v) for v in vec)
+    return flat
+
+
+@dataclass
+class CreatePrimitivesContract:
+    names: List[str]
+    sizes: Any = 1.0
+    locations: Optional[List[Vector3]] = None
+    rotations: Optional[List[Vector3]] = None
+    scales: Optional[List[Vector3]] = None
+    shape: str = "cube"
+    collection: Optional[str] = None
+
+    def validate(self) -> ContractResult:
+        if not isinstance(self.names, list) or not self.names:
+            return ContractResult(ok=False, error="names must be a non-empty list")
+        if not all(isinstance(name, str) and name for name in self.names):
+            return ContractResult(ok=False, error="names must be non-empty strings")
+        if len(set(self.names)) != len(self.names):
+            return ContractResult(ok=False, error="names must be unique")
+        if self.shape not in PRIMITIVE_SHAPES:
+            return ContractResult(ok=False, error=f"shape must be one of {', '.join(PRIMITIVE_SHAPES)}")
+        count = len(self.names)
+        try:
+            if isinstance(self.sizes, list):
+                if len(self.sizes) != count:
+                    return ContractResult(ok=False, error="sizes must have one entry per name")
+                sizes = [float(size) for size in self.sizes]
+            else:
+                sizes = [float(self.sizes)] * count
+            transforms = {
+                field: _flatten_vectors(field, getattr(self, field), count) for field in ("locations", "rotations", "scales")
+            }
+        except (TypeError, ValueError) as exc:
+            return ContractResult(ok=False, error=f"Invalid sizes or transforms: {exc}")
+        return ContractResult(
+            ok=True,
+            data={"names": list(self.names), "sizes": sizes, **transforms, "shape": self.shape, "collection": self.collection},
+        )
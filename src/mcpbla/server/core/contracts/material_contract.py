@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 from mcpbla.server.core.contracts.common_types import ContractResult
 
+# Shader recipes the addon keeps prebuilt template materials for.
+MATERIAL_RECIPES = ("principled", "noise")
+
 
 @dataclass
 class AssignMaterialContract:
     object: str
     material: str
     color: List[float]
+    recipe: str = "principled"
+    settings: Dict[str, Any] = field(default_factory=dict)
 
     def validate(self) -> ContractResult:
         if not self.object:
@@ -19,5 +24,10 @@ class AssignMaterialContract:
             return ContractResult(ok=False, error="Material is required")
         if not isinstance(self.color, list) or len(self.color) < 3:
             return ContractResult(ok=False, error="Color must be an RGB array")
-        return ContractResult(ok=True, data={"object": self.object, "material": self.material, "color": self.color})
+        if self.recipe not in MATERIAL_RECIPES:
+            return ContractResult(ok=False, error=f"Recipe must be one of {', '.join(MATERIAL_RECIPES)}")
+        data: Dict[str, Any] = {"object": self.object, "material": self.material, "color": self.color, "recipe": self.recipe}
+        if self.settings:
+            data["settings"] = dict(self.settings)
+        return ContractResult(ok=True, data=data)
 
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from mcpbla.server.core.contracts.common_types import ContractResult
+
+# bpy.data collections that bulk writes may target.
+BULK_COLLECTIONS = (
+    "objects",
+    "meshes",
+    "materials",
+    "lights",
+    "cameras",
+    "collections",
+    "worlds",
+    "images",
+    "node_groups",
+    "scenes",
+)
+
+
+def _flatten(values: List[Any]) -> List[Any]:
+    if values and isinstance(values[0], (list, tuple)):
+        return [v for row in values for v in row]
+    return list(values)
+
+
+@dataclass
+class BulkPropertyWrite:
+    """One column of writes: ``path`` on each named datablock of ``collection``.
+
+    ``values`` is either flat (``[x0, y0, z0, x1, ...]``) or one row per name.
+    """
+
+    collection: str
+    names: List[str]
+    path: str
+    values: List[Any]
+
+    def validate(self) -> ContractResult:
+        if self.collection not in BULK_COLLECTIONS:
+            return ContractResult(ok=False, error=f"collection must be one of {', '.join(BULK_COLLECTIONS)}")
+        if not isinstance(self.names, list) or not self.names or not all(isinstance(n, str) and n for n in self.names):
+            return ContractResult(ok=False, error="names must be a non-empty list of strings")
+        if not isinstance(self.path, str) or not self.path or "__" in self.path:
+            return ContractResult(ok=False, error="path must be an RNA property path")
+        if not isinstance(self.values, list):
+            return ContractResult(ok=False, error="values must be a list")
+        flat = _flatten(self.values)
+        if not flat or len(flat) % len(self.names):
+            return ContractResult(ok=False, error="values must hold the same number of entries per name")
+        if not all(isinstance(v, (int, float)) for v in flat):
+            return ContractResult(ok=False, error="values must be numeric")
+        return ContractResult(
+            ok=True, data={"collection": self.collection, "names": list(self.names), "path": self.path, "values": flat}
+        )
+
+
+@dataclass
+class SetPropertiesContract:
+    writes: List[Dict[str, Any]]
+
+    def validate(self) -> ContractResult:
+        if not isinstance(self.writes, list) or not self.writes:
+            return ContractResult(ok=False, error="writes must be a non-empty list")
+        validated = []
+        for index, write in enumerate(self.writes):
+            if not isinstance(write, dict):
+                return ContractResult(ok=False, error=f"writes[{index}] must be an object")
+            result = BulkPropertyWrite(
+                collection=write.get("collection"), names=write.get("names"), path=write.get("path"), values=write.get("values")
+            ).validate()
+            if not result.ok:
+                return ContractResult(ok=False, error=f"writes[{index}]: {result.error}")
+            validated.append(result.data)
+        return ContractResult(ok=True, data={"writes": validated})
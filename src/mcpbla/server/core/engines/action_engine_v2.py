@@ -8,6 +8,31 @@ from mcpbla.server.core.contracts.action_contract import ActionRequestContract,
 from mcpbla.server.core.contracts.common_types import ContractResult
 
 
+def _execute_result(resp: Any) -> ContractResult:
+    if isinstance(resp, dict) and resp.get("ok"):
+        return ContractResult(ok=True, data=resp.get("data"))
+    if isinstance(resp, dict):
+        err_obj = resp.get("error")
+        code = resp.get("code")
+        if not isinstance(err_obj, dict) and code:
+            err_obj = {"code": code, "message": err_obj}
+        return ContractResult(ok=False, data=resp.get("data"), error=err_obj or resp.get("error") or resp)
+    return ContractResult(ok=False, error="Unknown error")
+
+
+def build_batch(actions: List[Dict[str, Any]], atomic: bool = False, undo: bool = True) -> ActionBatch | ContractResult:
+    """Validate ``{"action", "params"}`` dicts into an ActionBatch, or return the first failed contract."""
+    messages: List[ActionMessage] = []
+    for a in actions:
+        action = a.get("action")
+        params = a.get("params", {})
+        contract = ActionRequestContract(action=action, params=params).validate()
+        if not contract.ok:
+            return contract
+        messages.append(ActionMessage(route=f"{action}.v2", payload=contract.data))
+    return ActionBatch(actions=messages, atomic=atomic, undo=undo)
+
+
 class ActionEngineV2:
     """Action engine v2 with batching and contract validation."""
 
@@ -20,33 +45,34 @@ class ActionEngineV2:
             return contract
         msg = ActionMessage(route=f"{action}.v2", payload=contract.data)
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            if isinstance(resp, dict):
-                err_obj = resp.get("error")
-                code = resp.get("code")
-                if not isinstance(err_obj, dict) and code:
-                    err_obj = {"code": code, "message": err_obj}
-                return ContractResult(ok=False, data=resp.get("data"), error=err_obj or resp.get("error") or resp)
-            return ContractResult(ok=False, error="Unknown error")
+            return _execute_result(self.pool.send_action(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def execute_async(self, action: str, params: Dict[str, Any]) -> ContractResult:
+        contract = ActionRequestContract(action=action, params=params).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route=f"{action}.v2", payload=contract.data)
+        try:
+            return _execute_result(await self.pool.send_action_async(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
     def batch(self, actions: List[Dict[str, Any]], atomic: bool = False) -> ContractResult:
-        messages: List[ActionMessage] = []
-        for a in actions:
-            action = a.get("action")
-            params = a.get("params", {})
-            contract = ActionRequestContract(action=action, params=params).validate()
-            if not contract.ok:
-                return contract
-            messages.append(ActionMessage(route=f"{action}.v2", payload=contract.data))
-        batch = ActionBatch(actions=messages, atomic=atomic)
+        batch = build_batch(actions, atomic=atomic)
+        if isinstance(batch, ContractResult):
+            return batch
+        try:
+            return ContractResult.from_response(self.pool.send_batch(batch))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def batch_async(self, actions: List[Dict[str, Any]], atomic: bool = False) -> ContractResult:
+        batch = build_batch(actions, atomic=atomic)
+        if isinstance(batch, ContractResult):
+            return batch
         try:
-            resp = self.pool.send_batch(batch)
-            if isinstance(resp, dict) and resp.get("ok", False):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(await self.pool.send_batch_async(batch))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
 
 from mcpbla.server.bridge.events import EVENT_BUS
-from mcpbla.server.bridge.messages import ActionBatch, ActionMessage
+from mcpbla.server.bridge.messages import ActionMessage
 from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
 from mcpbla.server.core.contracts.action_contract import ActionRequestContract
 from mcpbla.server.core.contracts.common_types import ContractResult
+from mcpbla.server.core.engines.action_engine_v2 import build_batch
 
 
 class ActionEngineV3:
@@ -23,40 +25,97 @@ class ActionEngineV3:
         if corr:
             self._last_ack[corr] = data
 
+    def _result(self, msg: ActionMessage, resp: Any) -> ContractResult:
+        if self.wait_for_ack:
+            ack = self._last_ack.get(msg.correlation_id)
+            if not ack:
+                return ContractResult(ok=False, error="no ack")
+            status = ack.get("status", "error")
+            return ContractResult(ok=status == "success", data=ack.get("data"), error=ack.get("error"))
+        return ContractResult.from_response(resp)
+
     def execute(self, action: str, params: Dict[str, Any]) -> ContractResult:
         contract = ActionRequestContract(action=action, params=params).validate()
         if not contract.ok:
             return contract
         msg = ActionMessage(route=f"{action}.v2", payload=contract.data)
         try:
-            resp = self.pool.send_action(msg)
-            if self.wait_for_ack:
-                ack = self._last_ack.get(msg.correlation_id)
-                if not ack:
-                    return ContractResult(ok=False, error="no ack")
-                status = ack.get("status", "error")
-                return ContractResult(ok=status == "success", data=ack.get("data"), error=ack.get("error"))
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return self._result(msg, self.pool.send_action(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def execute_async(self, action: str, params: Dict[str, Any]) -> ContractResult:
+        contract = ActionRequestContract(action=action, params=params).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route=f"{action}.v2", payload=contract.data)
+        try:
+            return self._result(msg, await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    def batch(self, actions: List[Dict[str, Any]], atomic: bool = False, undo: bool = True) -> ContractResult:
+        batch = build_batch(actions, atomic=atomic, undo=undo)
+        if isinstance(batch, ContractResult):
+            return batch
+        try:
+            return ContractResult.from_response(self.pool.send_batch(batch))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def batch_async(self, actions: List[Dict[str, Any]], atomic: bool = False, undo: bool = True) -> ContractResult:
+        batch = build_batch(actions, atomic=atomic, undo=undo)
+        if isinstance(batch, ContractResult):
+            return batch
+        try:
+            return ContractResult.from_response(await self.pool.send_batch_async(batch))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
-    def batch(self, actions: List[Dict[str, Any]], atomic: bool = False) -> ContractResult:
-        messages: List[ActionMessage] = []
-        for a in actions:
-            action = a.get("action")
-            params = a.get("params", {})
-            contract = ActionRequestContract(action=action, params=params).validate()
-            if not contract.ok:
-                return contract
-            messages.append(ActionMessage(route=f"{action}.v2", payload=contract.data))
-        batch = ActionBatch(actions=messages, atomic=atomic)
+    def _transaction(self, op: str, **params: Any) -> ContractResult:
+        msg = ActionMessage(route="undo.transaction", payload={"op": op, **params})
         try:
-            resp = self.pool.send_batch(batch)
-            if isinstance(resp, dict) and resp.get("ok", False):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    def begin_transaction(self, label: str, fast: bool = False) -> ContractResult:
+        return self._transaction("begin", label=label, fast=fast)
+
+    def commit_transaction(self, txn_id: str) -> ContractResult:
+        return self._transaction("commit", id=txn_id)
+
+    def abort_transaction(self, txn_id: str) -> ContractResult:
+        return self._transaction("abort", id=txn_id)
+
+    @contextmanager
+    def transaction(self, label: str, fast: bool = False, atomic: bool = False) -> Iterator[Dict[str, Any]]:
+        """Group the actions sent inside the block into one Blender undo step.
+
+        Yields ``{"id", "failed", "error"}``; set ``failed`` (or raise) to mark
+        the task failed, which aborts (rolls back) the transaction when ``atomic``.
+        Blender has one remote transaction at a time, owned by whoever began it.
+        If another client holds it, ``error`` carries the ``TRANSACTION_OPEN``
+        refusal and the caller must not send actions, which would otherwise be
+        folded into (and rolled back with) the other client's task. Any other
+        failure to begin (stub or unreachable bridge) leaves ``error`` unset and
+        the block runs with per-action undo steps.
+        """
+        begun = self.begin_transaction(label, fast=fast)
+        refused = not begun.ok and isinstance(begun.error, dict) and begun.error.get("code") == "TRANSACTION_OPEN"
+        state: Dict[str, Any] = {
+            "id": (begun.data or {}).get("id") if begun.ok else None,
+            "failed": refused,
+            "error": begun.error if refused else None,
+        }
+        try:
+            yield state
+        except BaseException:
+            state["failed"] = True
+            raise
+        finally:
+            if state["id"]:
+                if atomic and state["failed"]:
+                    self.abort_transaction(state["id"])
+                else:
+                    self.commit_transaction(state["id"])
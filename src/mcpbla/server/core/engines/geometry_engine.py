@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from typing import Any, List
+
 from mcpbla.server.bridge.messages import ActionMessage
 from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
 from mcpbla.server.core.contracts.common_types import ContractResult
-from mcpbla.server.core.contracts.geometry_contract import CreateCubeContract
+from mcpbla.server.core.contracts.geometry_contract import CreateCubeContract, CreatePrimitivesContract
 
 
 class GeometryEngine:
@@ -16,10 +18,37 @@ class GeometryEngine:
             return contract
         msg = ActionMessage(route="create_cube.v2", payload=contract.data)
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def create_cube_async(self, name: str, size: float) -> ContractResult:
+        contract = CreateCubeContract(name=name, size=size).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="create_cube.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    def create_primitives(self, names: List[str], **params: Any) -> ContractResult:
+        """Create many primitives in one bridge call (``sizes``, ``locations``, ``rotations``, ``scales``, ``collection``)."""
+        contract = CreatePrimitivesContract(names=names, **params).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="create_primitives.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    async def create_primitives_async(self, names: List[str], **params: Any) -> ContractResult:
+        contract = CreatePrimitivesContract(names=names, **params).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="create_primitives.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
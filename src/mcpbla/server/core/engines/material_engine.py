@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcpbla.server.bridge.messages import ActionMessage
 from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
@@ -12,16 +12,30 @@ class MaterialEngine:
     def __init__(self) -> None:
         self.pool = get_bridge_pool_v2()
 
-    def assign(self, object_name: str, material: str, color: List[float]) -> ContractResult:
-        contract = AssignMaterialContract(object=object_name, material=material, color=color).validate()
+    def assign(
+        self, object_name: str, material: str, color: List[float], recipe: str = "principled", settings: Optional[Dict[str, Any]] = None
+    ) -> ContractResult:
+        contract = AssignMaterialContract(
+            object=object_name, material=material, color=color, recipe=recipe, settings=settings or {}
+        ).validate()
         if not contract.ok:
             return contract
         msg = ActionMessage(route="assign_material.v2", payload=contract.data)
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    async def assign_async(
+        self, object_name: str, material: str, color: List[float], recipe: str = "principled", settings: Optional[Dict[str, Any]] = None
+    ) -> ContractResult:
+        contract = AssignMaterialContract(
+            object=object_name, material=material, color=color, recipe=recipe, settings=settings or {}
+        ).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="assign_material.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
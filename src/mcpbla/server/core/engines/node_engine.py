@@ -16,10 +16,16 @@ class NodeEngine:
             return contract
         msg = ActionMessage(route="node.operation.v2", payload=contract.data)
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    async def operate_async(self, operation: str, params: dict) -> ContractResult:
+        contract = NodeOperationContract(operation=operation, params=params).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="node.operation.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
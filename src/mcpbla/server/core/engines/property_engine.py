@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from mcpbla.server.bridge.messages import ActionMessage
+from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
+from mcpbla.server.core.contracts.common_types import ContractResult
+from mcpbla.server.core.contracts.property_contract import SetPropertiesContract
+
+
+class PropertyEngine:
+    """Columnar RNA property writes: many datablocks and properties in one bridge call."""
+
+    def __init__(self) -> None:
+        self.pool = get_bridge_pool_v2()
+
+    @staticmethod
+    def column(collection: str, names: List[str], path: str, values: List[Any]) -> Dict[str, Any]:
+        return {"collection": collection, "names": names, "path": path, "values": values}
+
+    def set_bulk(self, writes: List[Dict[str, Any]]) -> ContractResult:
+        contract = SetPropertiesContract(writes=writes).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="properties.set_bulk.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(self.pool.send_action(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    async def set_bulk_async(self, writes: List[Dict[str, Any]]) -> ContractResult:
+        contract = SetPropertiesContract(writes=writes).validate()
+        if not contract.ok:
+            return contract
+        msg = ActionMessage(route="properties.set_bulk.v2", payload=contract.data)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    def set_column(self, collection: str, names: List[str], path: str, values: List[Any]) -> ContractResult:
+        return self.set_bulk([self.column(collection, names, path, values)])
+
+    async def set_column_async(self, collection: str, names: List[str], path: str, values: List[Any]) -> ContractResult:
+        return await self.set_bulk_async([self.column(collection, names, path, values)])
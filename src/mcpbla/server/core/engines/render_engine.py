@@ -12,10 +12,13 @@ class RenderEngine:
     def render_preview(self, settings: dict) -> ContractResult:
         msg = ActionMessage(route="render.preview.v2", payload=settings)
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    async def render_preview_async(self, settings: dict) -> ContractResult:
+        msg = ActionMessage(route="render.preview.v2", payload=settings)
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
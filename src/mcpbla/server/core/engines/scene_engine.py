@@ -4,20 +4,42 @@ from typing import Any, Dict
 
 from mcpbla.server.bridge.messages import ActionMessage
 from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
+from mcpbla.server.bridge.snapshot_stream import ingest_stream
 from mcpbla.server.core.contracts.common_types import ContractResult
 
 
+def _snapshot_payload(session_id: str | None, since_revision: int | None) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"session_id": session_id}
+    if since_revision is not None:
+        payload["since_revision"] = int(since_revision)
+    return payload
+
+
 class SceneEngine:
     def __init__(self) -> None:
         self.pool = get_bridge_pool_v2()
 
-    def snapshot(self, session_id: str | None = None) -> ContractResult:
-        msg = ActionMessage(route="scene.snapshot.v2", payload={"session_id": session_id})
+    def snapshot(self, session_id: str | None = None, since_revision: int | None = None) -> ContractResult:
+        """Full snapshot, or with ``since_revision`` only the objects added/changed/removed since then."""
+        msg = ActionMessage(route="scene.snapshot.v2", payload=_snapshot_payload(session_id, since_revision))
         try:
-            resp = self.pool.send_action(msg)
-            if isinstance(resp, dict) and resp.get("ok"):
-                return ContractResult(ok=True, data=resp.get("data"))
-            return ContractResult(ok=False, error=(resp.get("error") if isinstance(resp, dict) else "Unknown error"))
+            return ContractResult.from_response(self.pool.send_action(msg))
         except Exception as exc:  # noqa: BLE001
             return ContractResult(ok=False, error=str(exc))
 
+    async def snapshot_async(self, session_id: str | None = None, since_revision: int | None = None) -> ContractResult:
+        msg = ActionMessage(route="scene.snapshot.v2", payload=_snapshot_payload(session_id, since_revision))
+        try:
+            return ContractResult.from_response(await self.pool.send_action_async(msg))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
+
+    def snapshot_stream(self, session_id: str | None = None, page_size: int = 500) -> ContractResult:
+        """Pull a paged NDJSON snapshot and ingest it page by page into the live scenegraphs."""
+        handler = self.pool.router.handler
+        if handler is None or not hasattr(handler, "iter_snapshot_stream"):
+            return ContractResult(ok=False, error="Bridge handler does not support snapshot streaming")
+        try:
+            return ContractResult(ok=True, data=ingest_stream(handler.iter_snapshot_stream(session_id, page_size)))
+        except Exception as exc:  # noqa: BLE001
+            return ContractResult(ok=False, error=str(exc))
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import time
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, Dict, List
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
-from mcpbla.server.bridge.env import resolve_bridge_enabled, resolve_bridge_url
+from mcpbla.server.bridge.coalescer import coalesce_as
+from mcpbla.server.bridge.compression import DecompressRequestMiddleware
+from mcpbla.server.bridge.env import resolve_bridge_enabled, resolve_bridge_url, resolve_bridge_urls
 from mcpbla.server.bridge.http_bridge import HttpBridgeHandler, get_bridge_ping_timeout_seconds
 from mcpbla.server.bridge.messages import ActionMessage
 from mcpbla.server.bridge.events import EVENT_BUS
+from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
 from mcpbla.server.tools.base import Tool
 from mcpbla.server.tools.registry import build_tool_registry
 from mcpbla.server.utils.config import ServerConfig, load_config
@@ -41,16 +46,23 @@ class BridgeEventModel(BaseModel):
     correlation_id: str | None = None
 
 
-_SCENEGRAPH_SUBSCRIBED = False
 _PROCESS_START = time.time()
 
 
+def _caller_scope(request: Request) -> AbstractContextManager:
+    """Bridge actions of one MCP session may be coalesced together, never across sessions."""
+    session = request.headers.get("mcp-session-id")
+    return coalesce_as(f"session:{session}") if session else nullcontext()
+
+
 def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None = None) -> FastAPI:
     cfg = config or load_config()
     bridge_is_enabled = resolve_bridge_enabled(explicit=bridge_enabled)
     logger = setup_logging(cfg.log_level, __name__)
 
     app = FastAPI(title="MCP Blender Orchestrator", version="0.2.0")
+    # The addon compresses large snapshot uploads; decode them before validation.
+    app.add_middleware(DecompressRequestMiddleware)
 
     tools: Dict[str, Tool] = build_tool_registry(cfg.workspace_root, bridge_enabled=bridge_is_enabled)
 
@@ -58,16 +70,11 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
 
     if bridge_is_enabled:
         from mcpbla.server.bridge import scenegraph_live as bridge_scenegraph_live
-        from mcpbla.server.bridge.scenegraph import SCENEGRAPH
-        from mcpbla.server.bridge.startup import configure_bridge_from_env
+        from mcpbla.server.bridge.startup import configure_bridge_from_env, subscribe_scenegraph
 
         # Optionally wire real bridge handler if explicitly enabled via env.
         configure_bridge_from_env(enabled_override=bridge_is_enabled)
-
-        global _SCENEGRAPH_SUBSCRIBED
-        if not _SCENEGRAPH_SUBSCRIBED:
-            EVENT_BUS.subscribe("*", SCENEGRAPH.on_event)
-            _SCENEGRAPH_SUBSCRIBED = True
+        subscribe_scenegraph()
 
         scenegraph_live = bridge_scenegraph_live
     else:
@@ -85,19 +92,20 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
         ]
 
     @app.post("/tools/{tool_name}/invoke")
-    async def invoke_tool(tool_name: str, payload: ToolInvokeRequest) -> Dict[str, Any]:
+    async def invoke_tool(tool_name: str, payload: ToolInvokeRequest, request: Request) -> Dict[str, Any]:
         tool = tools.get(tool_name)
         if not tool:
             raise HTTPException(status_code=404, detail="Tool not found")
         try:
-            result = await tool.handler(payload.arguments)
+            with _caller_scope(request):
+                result = await tool.handler(payload.arguments)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Tool execution failed")
             raise HTTPException(status_code=500, detail=str(exc)) from exc
         return {"tool": tool_name, "result": result}
 
     @app.post("/tools/{tool_name}/invoke_v2")
-    async def invoke_tool_v2(tool_name: str, payload: ToolInvokeRequest) -> Dict[str, Any]:
+    async def invoke_tool_v2(tool_name: str, payload: ToolInvokeRequest, request: Request) -> Dict[str, Any]:
         tool = tools.get(tool_name)
         if not tool:
             return JSONResponse(
@@ -110,7 +118,8 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
                 },
             )
         try:
-            return await tool.handler(payload.arguments)
+            with _caller_scope(request):
+                return await tool.handler(payload.arguments)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Tool execution failed")
             return JSONResponse(
@@ -142,19 +151,57 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
         scene_snapshot = scenegraph_live.SceneSnapshot(
             session_id=snapshot.session_id, objects=snapshot.objects, metadata=snapshot.metadata
         )
-        scenegraph_live.store_snapshot(scene_snapshot)
+        # Subscribers (the live scenegraph) get the delta from the session's previous snapshot.
+        change = scenegraph_live.ingest_snapshot(scene_snapshot)
         return {
             "status": "stored",
             "session_id": snapshot.session_id,
             "objects_count": len(snapshot.objects),
             "metadata": snapshot.metadata,
+            **change,
         }
 
+    @app.post("/blender/scene_snapshot/stream")
+    async def ingest_scene_snapshot_stream(request: Request) -> Dict[str, Any]:
+        if not bridge_is_enabled or scenegraph_live is None:
+            raise HTTPException(status_code=503, detail="Bridge disabled")
+        from mcpbla.server.bridge.snapshot_stream import SnapshotStreamIngestor
+
+        # NDJSON pages are ingested as they arrive instead of validating one large body.
+        ingestor = SnapshotStreamIngestor()
+        try:
+            async for chunk in request.stream():
+                ingestor.feed(chunk)
+            summary = ingestor.close()
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return {"status": "stored", **summary}
+
     @app.post("/bridge/event")
     async def ingest_event(event: BridgeEventModel) -> Dict[str, Any]:
         EVENT_BUS.emit(event.event, event.data)
         return {"ok": True, "event": event.event, "correlation_id": event.correlation_id}
 
+    @app.post("/bridge/events")
+    async def ingest_events(request: Request) -> Dict[str, Any]:
+        # Hot path for batched addon events: light shape checks instead of a pydantic model per item.
+        try:
+            body = await request.json()
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array of events") from exc
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array of events")
+        events = []
+        rejected = []
+        for index, item in enumerate(body):
+            data = item.get("data", {}) if isinstance(item, dict) else None
+            if not isinstance(data, dict) or not isinstance(item.get("event"), str):
+                rejected.append(index)
+                continue
+            events.append((item["event"], data))
+        accepted = EVENT_BUS.emit_many(events)
+        return {"ok": not rejected, "accepted": accepted, "rejected": rejected}
+
     @app.get("/bridge/status")
     async def bridge_status() -> Dict[str, Any]:
         enabled = resolve_bridge_enabled()
@@ -181,28 +228,43 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
                 "last_error": "BRIDGE_URL is missing",
             }
 
-        try:
-            handler = HttpBridgeHandler(url, timeout=get_bridge_ping_timeout_seconds())
-            resp = handler("system.ping", ActionMessage(route="system.ping", payload={}).to_dict())
-            reachable = bool(isinstance(resp, dict) and resp.get("ok"))
-            if not reachable:
+        async def _ping(endpoint_url: str) -> Dict[str, Any]:
+            handler = HttpBridgeHandler(endpoint_url, timeout=get_bridge_ping_timeout_seconds())
+            try:
+                resp = await handler.acall("system.ping", ActionMessage(route="system.ping", payload={}).to_dict())
+            finally:
+                await handler.aclose()
+            ok = bool(isinstance(resp, dict) and resp.get("ok"))
+            error = None
+            if not ok:
                 err = resp.get("error") if isinstance(resp, dict) else None
                 if isinstance(err, dict):
-                    last_error = err.get("message") or err.get("error") or str(err)
+                    error = err.get("message") or err.get("error") or str(err)
                 elif err:
-                    last_error = str(err)
+                    error = str(err)
                 else:
-                    last_error = "Bridge unreachable"
+                    error = "Bridge unreachable"
+            return {"url": endpoint_url, "reachable": ok, "last_error": error}
+
+        endpoints: List[Dict[str, Any]] = []
+        try:
+            endpoints = list(await asyncio.gather(*(_ping(endpoint_url) for endpoint_url in resolve_bridge_urls())))
+            reachable = any(endpoint["reachable"] for endpoint in endpoints)
+            if not reachable:
+                last_error = next((e["last_error"] for e in endpoints if e["last_error"]), "Bridge unreachable")
         except Exception as exc:  # noqa: BLE001
             last_error = str(exc)
 
-        return {
+        status_info = {
             "enabled": True,
             "url": url,
             "configured": True,
             "reachable": reachable,
             "last_error": last_error,
         }
+        if len(endpoints) > 1:
+            status_info["endpoints"] = endpoints
+        return status_info
 
     def _git_sha() -> str | None:
         env_sha = os.getenv("MCPBLA_GIT_SHA")
@@ -237,7 +299,7 @@ def create_app(config: ServerConfig | None = None, bridge_enabled: bool | None =
                 "port": int(port) if str(port).isdigit() else port,
                 "uptime_seconds": int(time.time() - _PROCESS_START),
             },
-            "bridge": bridge_info,
+            "bridge": {**bridge_info, "circuit": get_bridge_pool_v2().breaker.snapshot()},
             "tools": {"count": tools_count},
             "version": {"git_sha": _git_sha()},
         }
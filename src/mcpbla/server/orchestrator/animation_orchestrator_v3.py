@@ -20,16 +20,20 @@ class AnimationOrchestratorV3:
             actions.append(KeyframeAction(operation="keyframe", params={"object": object_name, "frame": 1}))
         return AnimationPlanV3(instruction=instruction, object_name=object_name, actions=actions)
 
-    def execute(self, plan: AnimationPlanV3) -> Tuple[bool, List[Dict[str, Any]]]:
+    def execute(self, plan: AnimationPlanV3, atomic: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
         results: List[Dict[str, Any]] = []
         ok_all = True
-        for action in plan.actions:
-            params = {"object": plan.object_name, "operation": action.operation, **action.params}
-            res = self.engine.execute("animation.operation", params)
-            results.append({"operation": action.operation, "ok": res.ok, "data": res.data, "error": res.error})
-            if not res.ok:
-                ok_all = False
-                break
+        with self.engine.transaction(f"plan: {plan.instruction}", atomic=atomic) as txn:
+            if txn["error"]:
+                return False, [{"operation": "transaction", "ok": False, "data": None, "error": txn["error"]}]
+            for action in plan.actions:
+                params = {"object": plan.object_name, "operation": action.operation, **action.params}
+                res = self.engine.execute("animation.operation", params)
+                results.append({"operation": action.operation, "ok": res.ok, "data": res.data, "error": res.error})
+                if not res.ok:
+                    ok_all = False
+                    txn["failed"] = True
+                    break
         return ok_all, results
 
     def verify(self, plan: AnimationPlanV3) -> Dict[str, Any]:
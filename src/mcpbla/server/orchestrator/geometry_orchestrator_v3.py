@@ -20,16 +20,20 @@ class GeometryOrchestratorV3:
             nodes.append(GeoNodeAction(node_type="GeometryNodeSetPosition", params={"object": object_name}))
         return GeometryPlanV3(instruction=instruction, object_name=object_name, nodes=nodes)
 
-    def execute(self, plan: GeometryPlanV3) -> Tuple[bool, List[Dict[str, Any]]]:
+    def execute(self, plan: GeometryPlanV3, atomic: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
         results: List[Dict[str, Any]] = []
         ok_all = True
-        for node in plan.nodes:
-            params = {"object": plan.object_name, "operation": node.node_type, **node.params}
-            res = self.engine.execute("node.operation", params)
-            results.append({"node": node.node_type, "ok": res.ok, "data": res.data, "error": res.error})
-            if not res.ok:
-                ok_all = False
-                break
+        with self.engine.transaction(f"plan: {plan.instruction}", atomic=atomic) as txn:
+            if txn["error"]:
+                return False, [{"node": "transaction", "ok": False, "data": None, "error": txn["error"]}]
+            for node in plan.nodes:
+                params = {"object": plan.object_name, "operation": node.node_type, **node.params}
+                res = self.engine.execute("node.operation", params)
+                results.append({"node": node.node_type, "ok": res.ok, "data": res.data, "error": res.error})
+                if not res.ok:
+                    ok_all = False
+                    txn["failed"] = True
+                    break
         return ok_all, results
 
     def verify(self, plan: GeometryPlanV3) -> Dict[str, Any]:
@@ -24,15 +24,19 @@ class OrchestratorV3:
             actions.append(TaskAction(name="noop", params={}))
         return TaskPlan(instruction=instruction, actions=actions)
 
-    def execute(self, plan: TaskPlan) -> Tuple[bool, List[Dict[str, Any]]]:
+    def execute(self, plan: TaskPlan, atomic: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
         results: List[Dict[str, Any]] = []
         overall_ok = True
-        for action in plan.actions:
-            res = self.engine.execute(action.name, action.params)
-            results.append({"action": action.name, "ok": res.ok, "data": res.data, "error": res.error})
-            if not res.ok:
-                overall_ok = False
-                break
+        with self.engine.transaction(f"plan: {plan.instruction}", atomic=atomic) as txn:
+            if txn["error"]:
+                return False, [{"action": "transaction", "ok": False, "data": None, "error": txn["error"]}]
+            for action in plan.actions:
+                res = self.engine.execute(action.name, action.params)
+                results.append({"action": action.name, "ok": res.ok, "data": res.data, "error": res.error})
+                if not res.ok:
+                    overall_ok = False
+                    txn["failed"] = True
+                    break
         return overall_ok, results
 
     def verify(self, plan: TaskPlan, result: List[Dict[str, Any]]) -> Dict[str, Any]:
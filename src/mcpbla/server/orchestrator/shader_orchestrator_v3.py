@@ -20,16 +20,20 @@ class ShaderOrchestratorV3:
             nodes.append(ShaderNodeAction(node_type="ShaderNodeTexMusgrave", params={"material": material}))
         return ShaderPlanV3(instruction=instruction, material=material, nodes=nodes)
 
-    def execute(self, plan: ShaderPlanV3) -> Tuple[bool, List[Dict[str, Any]]]:
+    def execute(self, plan: ShaderPlanV3, atomic: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
         results: List[Dict[str, Any]] = []
         ok_all = True
-        for node in plan.nodes:
-            params = {"material": plan.material, "operation": node.node_type, **node.params}
-            res = self.engine.execute("node.operation", params)
-            results.append({"node": node.node_type, "ok": res.ok, "data": res.data, "error": res.error})
-            if not res.ok:
-                ok_all = False
-                break
+        with self.engine.transaction(f"plan: {plan.instruction}", atomic=atomic) as txn:
+            if txn["error"]:
+                return False, [{"node": "transaction", "ok": False, "data": None, "error": txn["error"]}]
+            for node in plan.nodes:
+                params = {"material": plan.material, "operation": node.node_type, **node.params}
+                res = self.engine.execute("node.operation", params)
+                results.append({"node": node.node_type, "ok": res.ok, "data": res.data, "error": res.error})
+                if not res.ok:
+                    ok_all = False
+                    txn["failed"] = True
+                    break
         return ok_all, results
 
     def verify(self, plan: ShaderPlanV3) -> Dict[str, Any]:
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from mcpbla.server.agents.action_engine import ActionEngine
+from mcpbla.server.agents.action_engine import ActionEngine, ActionResult
+from mcpbla.server.core.contracts.material_contract import MATERIAL_RECIPES
+from mcpbla.server.core.contracts.geometry_contract import CreatePrimitivesContract
+from mcpbla.server.core.engines.geometry_engine import GeometryEngine
+from mcpbla.server.core.engines.material_engine import MaterialEngine
 from mcpbla.server.tools.base import Tool
 from mcpbla.server.tools.tool_response import (
     BRIDGE_UNREACHABLE,
@@ -17,12 +21,7 @@ from mcpbla.server.tools.tool_response import (
 )
 
 
-def _async_wrapper(func):
-    """Wrap sync handlers for async MCP tool compatibility."""
-    async def wrapped(arguments: Dict[str, Any]) -> Any:
-        return func(arguments)
-
-    return wrapped
+_VECTOR3_SCHEMA = {"type": "array", "items": {"type": "number"}, "minItems": 3, "maxItems": 3}
 
 
 def _create_engine() -> ActionEngine:
@@ -30,6 +29,10 @@ def _create_engine() -> ActionEngine:
     return ActionEngine()
 
 
+def _create_material_engine() -> MaterialEngine:
+    return MaterialEngine()
+
+
 def _format_error(err_code: str, err_msg: str, error_obj: Any, result_data: Any) -> Dict[str, Any]:
     details = {"error": error_obj, "data": result_data}
     if err_code in {BRIDGE_UNREACHABLE, BRIDGE_TIMEOUT}:
@@ -46,17 +49,7 @@ def _format_error(err_code: str, err_msg: str, error_obj: Any, result_data: Any)
     return err(err_code, err_msg, details)
 
 
-def _create_cube_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a cube through the action engine."""
-    engine = _create_engine()
-    name = arguments.get("name")
-    if not name:
-        return err(MISSING_ARG, "name is required")
-    size = float(arguments.get("size", 1.0))
-    try:
-        result = engine.execute("create_cube", {"name": name, "size": size})
-    except Exception as exc:  # noqa: BLE001
-        return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
+def _result_response(result: ActionResult) -> Dict[str, Any]:
     if result.ok:
         return ok(result.data)
     error_obj = result.error
@@ -78,7 +71,21 @@ def _create_cube_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
     return _format_error(err_code, err_msg, error_obj, result.data)
 
 
-def _move_object_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def _create_cube_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a cube through the action engine."""
+    engine = _create_engine()
+    name = arguments.get("name")
+    if not name:
+        return err(MISSING_ARG, "name is required")
+    size = float(arguments.get("size", 1.0))
+    try:
+        result = await engine.execute_async("create_cube", {"name": name, "size": size})
+    except Exception as exc:  # noqa: BLE001
+        return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
+    return _result_response(result)
+
+
+async def _move_object_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Move an object using the action engine translation op."""
     engine = _create_engine()
     name = arguments.get("name")
@@ -91,31 +98,13 @@ def _move_object_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
         if axis not in translation:
             return err(MISSING_ARG, f"translation.{axis} is required")
     try:
-        result = engine.execute("move_object", {"name": name, "translation": translation})
+        result = await engine.execute_async("move_object", {"name": name, "translation": translation})
     except Exception as exc:  # noqa: BLE001
         return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
-    if result.ok:
-        return ok(result.data)
-    error_obj = result.error
-    err_code = INTERNAL_ERROR
-    err_msg = "Action failed"
-    if isinstance(error_obj, dict):
-        err_code = error_obj.get("code", err_code)
-        err_msg = error_obj.get("message") or error_obj.get("error") or err_msg
-    elif isinstance(error_obj, str):
-        if error_obj.startswith("BRIDGE_"):
-            err_code = error_obj
-        err_msg = error_obj
-    elif isinstance(result.data, dict):
-        nested_err = result.data.get("error") if isinstance(result.data.get("error"), dict) else {}
-        err_code = nested_err.get("code", err_code)
-        err_msg = nested_err.get("message") or err_msg
-    if err_code == INTERNAL_ERROR and error_obj is not None and not isinstance(error_obj, dict):
-        err_code = BRIDGE_UNREACHABLE
-    return _format_error(err_code, err_msg, error_obj, result.data)
+    return _result_response(result)
 
 
-def _assign_material_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def _assign_material_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Assign a material with color to a given object."""
     engine = _create_engine()
     obj = arguments.get("object")
@@ -127,32 +116,28 @@ def _assign_material_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
         return err(MISSING_ARG, "material is required")
     if not isinstance(color, list) or len(color) != 3:
         return err(INVALID_ARG, "color must be a length-3 array")
+    params = {"object": obj, "material": material, "color": color}
+    recipe = arguments.get("recipe")
+    if recipe is not None:
+        if recipe not in MATERIAL_RECIPES:
+            return err(INVALID_ARG, f"recipe must be one of {', '.join(MATERIAL_RECIPES)}")
+        params["recipe"] = recipe
+    if arguments.get("noise_scale") is not None:
+        params["settings"] = {"scale": arguments["noise_scale"]}
+    materials = _create_material_engine()
     try:
-        result = engine.execute("assign_material", {"object": obj, "material": material, "color": color})
+        if materials.pool.has_handler():
+            # assign_material.v2 runs the data-first assign (recipe templates, settings); action.execute ignores both.
+            contract = await materials.assign_async(obj, material, color, params.get("recipe", "principled"), params.get("settings"))
+            result = ActionEngine._from_contract(contract)
+        else:
+            result = await engine.execute_async("assign_material", params)
     except Exception as exc:  # noqa: BLE001
         return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
-    if result.ok:
-        return ok(result.data)
-    error_obj = result.error
-    err_code = INTERNAL_ERROR
-    err_msg = "Action failed"
-    if isinstance(error_obj, dict):
-        err_code = error_obj.get("code", err_code)
-        err_msg = error_obj.get("message") or error_obj.get("error") or err_msg
-    elif isinstance(error_obj, str):
-        if error_obj.startswith("BRIDGE_"):
-            err_code = error_obj
-        err_msg = error_obj
-    elif isinstance(result.data, dict):
-        nested_err = result.data.get("error") if isinstance(result.data.get("error"), dict) else {}
-        err_code = nested_err.get("code", err_code)
-        err_msg = nested_err.get("message") or err_msg
-    if err_code == INTERNAL_ERROR and error_obj is not None and not isinstance(error_obj, dict):
-        err_code = BRIDGE_UNREACHABLE
-    return _format_error(err_code, err_msg, error_obj, result.data)
+    return _result_response(result)
 
 
-def _apply_modifier_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def _apply_modifier_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Apply a modifier with provided settings to an object."""
     engine = _create_engine()
     obj = arguments.get("object")
@@ -165,28 +150,26 @@ def _apply_modifier_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(settings, dict):
         return err(INVALID_ARG, "settings must be an object")
     try:
-        result = engine.execute("apply_modifier", {"object": obj, "type": mod_type, "settings": settings})
+        result = await engine.execute_async("apply_modifier", {"object": obj, "type": mod_type, "settings": settings})
     except Exception as exc:  # noqa: BLE001
         return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
-    if result.ok:
-        return ok(result.data)
-    error_obj = result.error
-    err_code = INTERNAL_ERROR
-    err_msg = "Action failed"
-    if isinstance(error_obj, dict):
-        err_code = error_obj.get("code", err_code)
-        err_msg = error_obj.get("message") or error_obj.get("error") or err_msg
-    elif isinstance(error_obj, str):
-        if error_obj.startswith("BRIDGE_"):
-            err_code = error_obj
-        err_msg = error_obj
-    elif isinstance(result.data, dict):
-        nested_err = result.data.get("error") if isinstance(result.data.get("error"), dict) else {}
-        err_code = nested_err.get("code", err_code)
-        err_msg = nested_err.get("message") or err_msg
-    if err_code == INTERNAL_ERROR and error_obj is not None and not isinstance(error_obj, dict):
-        err_code = BRIDGE_UNREACHABLE
-    return _format_error(err_code, err_msg, error_obj, result.data)
+    return _result_response(result)
+
+
+async def _create_primitives_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Create many cubes in one bridge round trip, sharing meshes between equal sizes."""
+    names = arguments.get("names")
+    if not names:
+        return err(MISSING_ARG, "names is required")
+    params = {key: arguments[key] for key in ("sizes", "locations", "rotations", "scales", "collection") if key in arguments}
+    contract = CreatePrimitivesContract(names=names, **params).validate()
+    if not contract.ok:
+        return err(INVALID_ARG, contract.error or "Invalid arguments")
+    try:
+        result = await GeometryEngine().create_primitives_async(names, **params)
+    except Exception as exc:  # noqa: BLE001
+        return err(BRIDGE_UNREACHABLE, "Bridge unreachable", {"error": str(exc)})
+    return _result_response(ActionResult(ok=result.ok, data=result.data, error=result.error))
 
 
 def get_tools() -> List[Tool]:
@@ -203,7 +186,26 @@ def get_tools() -> List[Tool]:
                 },
                 "required": ["name"],
             },
-            handler=_async_wrapper(_create_cube_handler),
+            handler=_create_cube_handler,
+        ),
+        Tool(
+            name="create_primitives",
+            description="Create many cubes in one call; equal sizes share a mesh and transforms are set in bulk.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "names": {"type": "array", "items": {"type": "string"}, "minItems": 1},
+                    "sizes": {
+                        "oneOf": [{"type": "number"}, {"type": "array", "items": {"type": "number"}}],
+                    },
+                    "locations": {"type": "array", "items": _VECTOR3_SCHEMA},
+                    "rotations": {"type": "array", "items": _VECTOR3_SCHEMA},
+                    "scales": {"type": "array", "items": _VECTOR3_SCHEMA},
+                    "collection": {"type": "string"},
+                },
+                "required": ["names"],
+            },
+            handler=_create_primitives_handler,
         ),
         Tool(
             name="move_object",
@@ -224,11 +226,11 @@ def get_tools() -> List[Tool]:
                 },
                 "required": ["name", "translation"],
             },
-            handler=_async_wrapper(_move_object_handler),
+            handler=_move_object_handler,
         ),
         Tool(
             name="assign_material",
-            description="Assign a material with color to an object via the action engine.",
+            description="Assign a material with color to an object via the action engine; new materials are copied from a recipe template.",
             input_schema={
                 "type": "object",
                 "properties": {
@@ -240,10 +242,12 @@ def get_tools() -> List[Tool]:
                         "minItems": 3,
                         "maxItems": 3,
                     },
+                    "recipe": {"type": "string", "enum": list(MATERIAL_RECIPES)},
+                    "noise_scale": {"type": "number"},
                 },
                 "required": ["object", "material", "color"],
             },
-            handler=_async_wrapper(_assign_material_handler),
+            handler=_assign_material_handler,
         ),
         Tool(
             name="apply_modifier",
@@ -257,6 +261,6 @@ def get_tools() -> List[Tool]:
                 },
                 "required": ["object", "type", "settings"],
             },
-            handler=_async_wrapper(_apply_modifier_handler),
+            handler=_apply_modifier_handler,
         ),
     ]
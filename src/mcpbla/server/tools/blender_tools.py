@@ -30,8 +30,20 @@ def _list_workspace_files_handler(workspace_root: Path) -> Dict[str, Any]:
 
 
 def _get_last_scene_snapshot_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Fetch the last live scene snapshot for a session if available."""
+    """Fetch the last live scene snapshot for a session (or its state at ``revision``) if available."""
     session_id = arguments.get("session_id")
+    revision = arguments.get("revision")
+    if revision is not None:
+        if not session_id:
+            return err(MISSING_ARG, "session_id is required with revision")
+        if isinstance(revision, bool) or not isinstance(revision, int):
+            return err(INVALID_ARG, "revision must be an integer")
+        snapshot = scenegraph_live.get_snapshot_at(session_id, revision)
+        if snapshot is None:
+            kept = scenegraph_live.get_history_range(session_id)
+            detail = f"kept revisions {kept[0]}..{kept[1]}" if kept else "no history"
+            return err(INVALID_ARG, f"Revision {revision} of session_id '{session_id}' is not available ({detail})")
+        return ok({**scenegraph_live.ScenegraphLive.serialize_snapshot(snapshot), "revision": revision})
     snapshot = scenegraph_live.get_snapshot(session_id) if session_id else None
     if snapshot is None:
         snapshot = scenegraph_live.get_last_snapshot()
@@ -118,10 +130,10 @@ def get_tools(workspace_root) -> List[Tool]:
         ),
         Tool(
             name="get_last_scene_snapshot",
-            description="Retrieve the latest scene snapshot for a session.",
+            description="Retrieve the latest scene snapshot for a session, or its state at an earlier revision.",
             input_schema={
                 "type": "object",
-                "properties": {"session_id": {"type": "string"}},
+                "properties": {"session_id": {"type": "string"}, "revision": {"type": "integer", "minimum": 1}},
             },
             handler=_async_wrapper(_get_last_scene_snapshot_handler),
         ),
@@ -10,20 +10,17 @@ from mcpbla.server.bridge.pool_v2 import get_bridge_pool_v2
 from mcpbla.server.tools.base import Tool
 
 
-def _async_wrapper(func):
-    async def wrapped(arguments: Dict[str, Any]) -> Any:
-        return func(arguments)
-
-    return wrapped
-
-
-def _bridge_probe_handler(_: Dict[str, Any]) -> Dict[str, Any]:
+async def _bridge_probe_handler(_: Dict[str, Any]) -> Dict[str, Any]:
     pool = get_bridge_pool_v2()
     configured = pool.has_handler()
     handler_info: Optional[Dict[str, Any]] = None
     handler = getattr(pool, "router", None) and getattr(pool.router, "handler", None)
     if handler and getattr(handler, "__class__", None).__name__ == "HttpBridgeHandler":
-        handler_info = {"type": "http", "base_url": getattr(handler, "base_url", None)}
+        handler_info = {"type": "http", "base_url": getattr(handler, "base_url", None), **handler.stats()}
+    elif handler and getattr(handler, "__class__", None).__name__ == "MultiEndpointHandler":
+        handler_info = {"type": "multi", **handler.stats()}
+    elif handler and getattr(handler, "__class__", None).__name__ == "WebSocketBridgeChannel":
+        handler_info = {"type": "ws", "base_url": getattr(handler, "base_url", None), **handler.stats()}
     reachable = False
     last_error: Optional[Dict[str, Any]] = None
     lifecycle.set_configured(configured)
@@ -33,7 +30,7 @@ def _bridge_probe_handler(_: Dict[str, Any]) -> Dict[str, Any]:
         lifecycle.record_error(last_error["code"], last_error["message"])
     else:
         try:
-            resp = pool.send_action(ActionMessage(route="system.ping", payload={}))
+            resp = await pool.send_action_async(ActionMessage(route="system.ping", payload={}))
             if isinstance(resp, dict) and resp.get("ok"):
                 reachable = True
                 lifecycle.record_success()
@@ -58,6 +55,8 @@ def _bridge_probe_handler(_: Dict[str, Any]) -> Dict[str, Any]:
             "last_seen": state.get("last_seen"),
             "last_error": state.get("last_error") if state.get("last_error") else last_error,
             "handler": handler_info,
+            "coalescing": pool.coalescer.stats() if pool.coalescer is not None else None,
+            "circuit": pool.breaker.snapshot(),
         },
     }
 
@@ -68,6 +67,6 @@ def get_tools() -> List[Tool]:
             name="bridge_probe",
             description="Report bridge handler status and reachability.",
             input_schema={"type": "object", "properties": {}},
-            handler=_async_wrapper(_bridge_probe_handler),
+            handler=_bridge_probe_handler,
         )
     ]
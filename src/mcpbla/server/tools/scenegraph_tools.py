@@ -17,14 +17,14 @@ def _async_wrapper(func):
 
 
 def _describe_handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a serialized description of the live scenegraph."""
-    return SCENEGRAPH.describe()
+    """Return a serialized description of the live scenegraph (only what changed after ``since`` when given)."""
+    return SCENEGRAPH.describe(since=arguments.get("since"))
 
 
 def _search_handler(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Search the scenegraph using a simple query string."""
+    """Search the scenegraph by name, type, material or modifier type (prefix and fuzzy matches)."""
     query = arguments.get("query", "")
-    return SCENEGRAPH.find(query)
+    return SCENEGRAPH.find(query, limit=arguments.get("limit", 50), fuzzy=arguments.get("fuzzy", True))
 
 
 def _get_handler(arguments: Dict[str, Any]) -> Dict[str, Any] | None:
@@ -38,16 +38,20 @@ def get_tools() -> List[Tool]:
     return [
         Tool(
             name="scenegraph_describe",
-            description="Describe the current SceneGraphLiveV3 state.",
-            input_schema={"type": "object", "properties": {}},
+            description="Describe the current SceneGraphLiveV3 state, or what changed since a revision.",
+            input_schema={"type": "object", "properties": {"since": {"type": "integer", "minimum": 0}}},
             handler=_async_wrapper(_describe_handler),
         ),
         Tool(
             name="scenegraph_search",
-            description="Search SceneGraphLiveV3 entries.",
+            description="Search SceneGraphLiveV3 entries by name, type, material or modifier type.",
             input_schema={
                 "type": "object",
-                "properties": {"query": {"type": "string"}},
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer", "minimum": 1, "default": 50},
+                    "fuzzy": {"type": "boolean", "default": True},
+                },
                 "required": ["query"],
             },
             handler=_async_wrapper(_search_handler),
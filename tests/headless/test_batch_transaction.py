@@ -0,0 +1,128 @@
+import sys
+import types
+
+from mcpbla.blender.addon.ares_runtime.helpers import undo_utils
+from mcpbla.blender.addon.bridge import event_emitter, handlers_v2
+from mcpbla.server.bridge.events import EventBus
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+class _FakeBpy:
+    def __init__(self):
+        self.undo_pushes = []
+        self.undos = 0
+        self.ops = types.SimpleNamespace(
+            ed=types.SimpleNamespace(undo_push=lambda message: self.undo_pushes.append(message), undo=self._undo)
+        )
+
+    def _undo(self):
+        self.undos += 1
+
+
+class _Recorder:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, name, data):
+        self.events.append((name, data))
+
+
+def _fake_runtime(fail_on=None):
+    def create_cube(name, size):
+        if name == fail_on:
+            return {"ok": False, "error": f"cannot create {name}"}
+        undo_utils.push_undo_step("create_cube")
+        event_emitter.emit_event("object.created", {"name": name})
+        return {"ok": True, "data": {"name": name, "size": size}}
+
+    return types.SimpleNamespace(create_cube=create_cube)
+
+
+def _batch(n, atomic=False):
+    return {"atomic": atomic, "actions": [{"route": "create_cube.v2", "payload": {"name": f"C{i}", "size": 1}} for i in range(n)]}
+
+
+def test_batch_pushes_one_undo_step_and_one_event(monkeypatch):
+    bpy = _FakeBpy()
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime())
+    recorder = _Recorder()
+
+    resp = handlers_v2.handle_route("batch.execute", _batch(500), emitter=recorder)
+
+    assert resp["ok"] and len(resp["data"]) == 500
+    assert bpy.undo_pushes == ["batch.execute (500 actions)"]
+    assert [name for name, _ in recorder.events] == ["batch.completed"]
+    summary = recorder.events[0][1]
+    assert summary["succeeded"] == 500 and summary["rolled_back"] is False
+    # Each action's runtime event is folded into the summary, once.
+    assert len(summary["events"]) == 500
+
+
+def test_atomic_batch_rolls_back_on_failure(monkeypatch):
+    bpy = _FakeBpy()
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime(fail_on="C2"))
+    recorder = _Recorder()
+
+    resp = handlers_v2.handle_route("batch.execute", _batch(5, atomic=True), emitter=recorder)
+
+    assert resp["ok"] is False
+    assert resp["error"]["code"] == "BATCH_ROLLED_BACK" and resp["error"]["index"] == 2
+    errors = [r["error"] for r in resp["data"]]
+    assert errors[2] == "cannot create C2"
+    assert [e["code"] for e in errors[:2] + errors[3:]] == ["BATCH_ROLLED_BACK"] * 2 + ["BATCH_ABORTED"] * 2
+    assert bpy.undos == 1 and len(bpy.undo_pushes) == 2
+    summary = recorder.events[0][1]
+    assert summary["rolled_back"] is True and summary["events"] == []
+
+
+def test_non_atomic_batch_keeps_going_and_undo_is_restored(monkeypatch):
+    bpy = _FakeBpy()
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime(fail_on="C1"))
+
+    resp = handlers_v2.handle_route("batch.execute", _batch(3), emitter=_Recorder())
+
+    assert resp["ok"] is False and "error" not in resp
+    assert [r["ok"] for r in resp["data"]] == [True, False, True]
+    assert bpy.undos == 0
+    undo_utils.push_undo_step("after")
+    assert bpy.undo_pushes[-1] == "after"
+
+
+def test_batch_results_carry_each_items_request_id(monkeypatch):
+    monkeypatch.setitem(sys.modules, "bpy", _FakeBpy())
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime(fail_on="C1"))
+    batch = _batch(3, atomic=True)
+    for i, action in enumerate(batch["actions"]):
+        action["correlation_id"] = f"req-{i}"
+    resp = handlers_v2.handle_route("batch.execute", batch)
+    assert [r["request_id"] for r in resp["data"]] == ["req-0", "req-1", "req-2"]
+    assert [r["error"]["code"] for r in (resp["data"][0], resp["data"][2])] == ["BATCH_ROLLED_BACK", "BATCH_ABORTED"]
+
+
+def test_batch_summary_reaches_the_live_scenegraph(monkeypatch):
+    monkeypatch.setitem(sys.modules, "bpy", _FakeBpy())
+    bus, graph = EventBus(), SceneGraphLiveV3()
+    bus.subscribe_many("*", graph.on_events)
+    emitter = types.SimpleNamespace(emit=bus.emit)
+
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime())
+    assert handlers_v2.handle_route("batch.execute", _batch(3), emitter=emitter)["ok"]
+    assert sorted(graph.objects) == ["C0", "C1", "C2"]
+
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime(fail_on="X1"))
+    batch = {"atomic": True, "actions": [{"route": "create_cube.v2", "payload": {"name": f"X{i}", "size": 1}} for i in range(2)]}
+    assert handlers_v2.handle_route("batch.execute", batch, emitter=emitter)["error"]["code"] == "BATCH_ROLLED_BACK"
+    assert sorted(graph.objects) == ["C0", "C1", "C2"]
+
+
+def test_one_create_sends_one_created_event(monkeypatch):
+    monkeypatch.setitem(sys.modules, "bpy", _FakeBpy())
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", _fake_runtime())
+    sent = []
+    monkeypatch.setattr(event_emitter.SENDER, "enqueue", lambda name, data: sent.append(name))
+    recorder = _Recorder()
+    assert handlers_v2.handle_route("create_cube.v2", {"payload": {"name": "Solo", "size": 1}}, emitter=recorder)["ok"]
+    assert sent + [name for name, _ in recorder.events] == ["object.created"]
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+from mcpbla.server.bridge.messages import ActionMessage
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+from mcpbla.server.core.engines.geometry_engine import GeometryEngine
+
+
+def _slow_handler(route, payload):
+    time.sleep(0.2)
+    return {"ok": True, "data": {"route": route}}
+
+
+def test_route_async_overlaps_sync_handlers():
+    pool = BridgePoolV2()
+    pool.set_handler(_slow_handler)
+
+    async def run():
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(pool.send_action_async(ActionMessage(route="system.ping", payload={})) for _ in range(5))
+        )
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run())
+    assert all(r["ok"] for r in results)
+    assert elapsed < 0.6
+
+
+def test_route_async_without_handler():
+    resp = asyncio.run(BridgePoolV2().route_async("system.ping", {}))
+    assert resp["error"]["code"] == "BRIDGE_NOT_CONFIGURED"
+
+
+def test_engine_async_uses_pool():
+    pool = BridgePoolV2()
+    pool.set_handler(lambda route, payload: {"ok": True, "data": {"route": route}})
+    engine = GeometryEngine()
+    engine.pool = pool
+    res = asyncio.run(engine.create_cube_async("Cube", 1.0))
+    assert res.ok is True
+    assert res.data == {"route": "create_cube.v2"}
+
+
+def test_http_handler_acall_roundtrip():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BridgeRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+
+    async def run():
+        try:
+            return await asyncio.gather(*(pool.route_async("system.ping", {}) for _ in range(3)))
+        finally:
+            await handler.aclose()
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert all(r["ok"] for r in results)
+    assert all(r["request_id"] for r in results)
+
+
+def test_http_handler_closes_the_client_of_a_previous_loop():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BridgeRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+
+    async def call():
+        assert (await handler.acall("system.ping", {}))["ok"] is True
+        return handler._async_client
+
+    # A loop living in another thread keeps running after the handler moves on.
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(call(), other).result(timeout=5)
+        second = asyncio.run(call())
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(timeout=5)
+        assert first.is_closed and second is not first
+        # asyncio.run closes the client of the loop it shuts down.
+        assert second.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join(timeout=5)
+        other.close()
+        handler.close()
+        server.shutdown()
+        server.server_close()
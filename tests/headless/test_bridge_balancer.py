@@ -0,0 +1,85 @@
+import threading
+import time
+
+from mcpbla.server.bridge.balancer import MultiEndpointHandler
+from mcpbla.server.bridge.http_bridge import get_http_handler_from_env
+
+
+class _Endpoint:
+    def __init__(self, name, gate=None, down=False):
+        self.name = name
+        self.gate = gate
+        self.down = down
+        self.routes = []
+
+    def __call__(self, route, payload):
+        if self.down:
+            raise ConnectionRefusedError(f"{self.name} refused")
+        self.routes.append(route)
+        if self.gate is not None:
+            self.gate.wait(2)
+        return {"ok": True, "data": {"endpoint": self.name}}
+
+
+def _served_by(resp):
+    return resp["data"]["endpoint"]
+
+
+def test_reads_use_least_outstanding_endpoint():
+    gate = threading.Event()
+    a, b = _Endpoint("a", gate=gate), _Endpoint("b")
+    balancer = MultiEndpointHandler([("a", a), ("b", b)])
+    slow = threading.Thread(target=balancer, args=("render.preview.v2", {}))
+    slow.start()
+    time.sleep(0.05)
+    assert [_served_by(balancer("system.ping", {})) for _ in range(3)] == ["b", "b", "b"]
+    gate.set()
+    slow.join()
+    assert balancer.stats()["endpoints"][0]["outstanding"] == 0
+
+
+def test_mutating_routes_stick_to_session_endpoint():
+    balancer = MultiEndpointHandler([("a", _Endpoint("a")), ("b", _Endpoint("b"))])
+    first = _served_by(balancer("create_cube.v2", {"payload": {"session_id": "s1"}}))
+    second = _served_by(balancer("create_cube.v2", {"payload": {"session_id": "s2"}}))
+    assert first != second
+    for _ in range(3):
+        assert _served_by(balancer("move_object.v2", {"payload": {"session_id": "s1"}})) == first
+        assert _served_by(balancer("scene.snapshot.v2", {"session_id": "s2"})) == second
+    batch = {"actions": [{"route": "create_cube.v2", "payload": {"session_id": "s2"}}]}
+    assert _served_by(balancer("batch.execute", batch)) == second
+    assert balancer.stats()["sessions"] == {"s1": first, "s2": second}
+
+
+def test_reads_fail_over_and_unhealthy_endpoint_is_skipped():
+    a, b = _Endpoint("a", down=True), _Endpoint("b")
+    balancer = MultiEndpointHandler([("a", a), ("b", b)], failure_threshold=2, retry_after=60)
+    assert _served_by(balancer("system.ping", {})) == "b"
+    # A pinned session moves once its endpoint is marked down.
+    balancer.sessions["s1"] = balancer.endpoints[0]
+    assert balancer("create_cube.v2", {"session_id": "s1"})["code"] == "BRIDGE_UNREACHABLE"
+    assert balancer.stats()["endpoints"][0]["healthy"] is False
+    assert _served_by(balancer("create_cube.v2", {"session_id": "s1"})) == "b"
+    assert balancer.stats()["sessions"]["s1"] == "b"
+
+
+def test_drain_waits_for_in_flight_requests():
+    gate = threading.Event()
+    a, b = _Endpoint("a", gate=gate), _Endpoint("b")
+    balancer = MultiEndpointHandler([("a", a), ("b", b)])
+    worker = threading.Thread(target=balancer, args=("system.ping", {}))
+    worker.start()
+    time.sleep(0.05)
+    assert balancer.drain("a", timeout=0.05) is False
+    assert _served_by(balancer("create_cube.v2", {"session_id": "new"})) == "b"
+    gate.set()
+    assert balancer.remove("a", timeout=1) is True
+    worker.join()
+    assert [ep["url"] for ep in balancer.stats()["endpoints"]] == ["b"]
+
+
+def test_comma_separated_bridge_url_builds_balancer(monkeypatch):
+    monkeypatch.setenv("BRIDGE_URL", "http://127.0.0.1:9876, http://127.0.0.1:9877")
+    handler = get_http_handler_from_env()
+    assert isinstance(handler, MultiEndpointHandler)
+    assert [ep.url for ep in handler.endpoints] == ["http://127.0.0.1:9876", "http://127.0.0.1:9877"]
@@ -0,0 +1,68 @@
+import time
+
+from mcpbla.server.bridge.lifecycle import CIRCUIT_CLOSED, CIRCUIT_OPEN, CircuitBreaker
+from mcpbla.server.bridge.messages import ActionMessage
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+
+
+class _FlakyHandler:
+    def __init__(self):
+        self.up = False
+        self.calls = []
+
+    def __call__(self, route, payload):
+        self.calls.append(route)
+        if not self.up:
+            raise ConnectionRefusedError("connection refused")
+        return {"ok": True, "data": {"route": route}}
+
+
+def _pool(handler, **options):
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+    pool.breaker = CircuitBreaker(probe=pool._ping, **options)
+    return pool
+
+
+def test_breaker_opens_after_consecutive_failures_and_fast_fails():
+    handler = _FlakyHandler()
+    pool = _pool(handler, failure_threshold=3, cooldown=60)
+    for _ in range(3):
+        resp = pool.send_action(ActionMessage(route="create_cube.v2", payload={}))
+        assert resp["error"]["code"] == "BRIDGE_UNREACHABLE"
+    assert pool.breaker.state == CIRCUIT_OPEN
+    calls = len(handler.calls)
+
+    resp = pool.send_action(ActionMessage(route="create_cube.v2", payload={}))
+    assert resp["error"] == {"code": "BRIDGE_UNREACHABLE", "message": "Bridge circuit open", "circuit": "open"}
+    assert len(handler.calls) == calls
+    assert pool.breaker.snapshot()["fast_failed"] == 1
+    pool.breaker.reset()
+
+
+def test_breaker_trips_on_error_rate_but_not_on_route_errors():
+    breaker = CircuitBreaker(failure_threshold=100, error_rate=0.5, window=4, min_calls=4, cooldown=60)
+    for code in ("UNKNOWN_ROUTE", "UNKNOWN_ROUTE", "UNKNOWN_ROUTE", None):
+        breaker.record(code)
+    assert breaker.state == CIRCUIT_CLOSED
+    for code in ("BRIDGE_TIMEOUT", None, "BRIDGE_UNREACHABLE"):
+        breaker.record(code)
+    assert breaker.state == CIRCUIT_OPEN
+    breaker.reset()
+
+
+def test_half_open_probe_closes_circuit():
+    handler = _FlakyHandler()
+    pool = _pool(handler, failure_threshold=1, cooldown=0.05)
+    pool.send_action(ActionMessage(route="create_cube.v2", payload={}))
+    assert pool.breaker.state == CIRCUIT_OPEN
+
+    time.sleep(0.15)  # first probe fails while the bridge is still down
+    assert pool.breaker.state == CIRCUIT_OPEN
+    handler.up = True
+    deadline = time.time() + 2
+    while pool.breaker.state != CIRCUIT_CLOSED and time.time() < deadline:
+        time.sleep(0.02)
+    assert pool.breaker.state == CIRCUIT_CLOSED
+    assert "system.ping" in handler.calls
+    assert pool.send_action(ActionMessage(route="create_cube.v2", payload={}))["ok"] is True
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+from mcpbla.server.bridge.coalescer import coalesce_as
+from mcpbla.server.bridge.messages import ActionMessage
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+
+
+class _BatchHandler:
+    def __init__(self, rtt=0.05):
+        self.rtt = rtt
+        self.calls = []
+
+    def __call__(self, route, payload):
+        self.calls.append(route)
+        time.sleep(self.rtt)
+        if route != "batch.execute":
+            return {"ok": True, "data": {"route": route}}
+        items = [
+            {"ok": True, "data": {"name": a["payload"]["name"]}, "error": None, "request_id": a["correlation_id"]}
+            for a in payload["actions"]
+        ]
+        # Results are matched back by request_id, not by position.
+        return {"ok": True, "data": items[::-1]}
+
+
+def test_concurrent_send_action_is_coalesced():
+    handler = _BatchHandler()
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+    pool.enable_coalescing(max_batch=8, min_window=0.01)
+    results = {}
+
+    def call(i):
+        with coalesce_as("build"):
+            results[i] = pool.send_action(ActionMessage(route="create_cube.v2", payload={"name": f"Cube{i}"}))
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    pool.disable_coalescing()
+
+    assert all(results[i]["data"]["name"] == f"Cube{i}" for i in range(16))
+    assert 2 <= len(handler.calls) < 16
+    assert set(handler.calls) == {"batch.execute"}
+
+
+def test_coalescing_async_and_window_tuning():
+    handler = _BatchHandler(rtt=0.02)
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+    coalescer = pool.enable_coalescing(max_batch=64, min_window=0.001, max_window=0.05)
+
+    async def run():
+        with coalesce_as("move"):
+            return await asyncio.gather(
+                *(pool.send_action_async(ActionMessage(route="move_object.v2", payload={"name": f"O{i}"})) for i in range(10))
+            )
+
+    results = asyncio.run(run())
+    assert [r["data"]["name"] for r in results] == [f"O{i}" for i in range(10)]
+    assert coalescer.stats()["items"] == 10
+    assert coalescer.window > coalescer.min_window
+    pool.disable_coalescing()
+
+
+def test_coalescing_skips_ping_and_propagates_batch_errors():
+    pool = BridgePoolV2()
+    pool.set_handler(lambda route, payload: {"ok": False, "error": {"code": "BRIDGE_TIMEOUT", "message": route}})
+    pool.enable_coalescing()
+    with coalesce_as("one"):
+        resp = pool.send_action(ActionMessage(route="create_cube.v2", payload={"name": "A"}))
+    assert resp["error"] == {"code": "BRIDGE_TIMEOUT", "message": "batch.execute"}
+    ping = pool.send_action(ActionMessage(route="system.ping", payload={}))
+    assert ping["error"]["message"] == "system.ping"
+    pool.disable_coalescing()
+
+
+def test_only_calls_of_one_caller_share_a_batch():
+    handler = _BatchHandler(rtt=0.01)
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+    coalescer = pool.enable_coalescing(max_batch=64, min_window=0.02)
+
+    async def caller(key, count):
+        with coalesce_as(key):
+            return await asyncio.gather(
+                *(pool.send_action_async(ActionMessage(route="create_cube.v2", payload={"name": f"{key}{i}"})) for i in range(count))
+            )
+
+    async def run():
+        alone = pool.send_action_async(ActionMessage(route="create_cube.v2", payload={"name": "alone"}))
+        return await asyncio.gather(caller("a", 3), caller("b", 2), alone)
+
+    a, b, alone = asyncio.run(run())
+    pool.disable_coalescing()
+    assert [r["data"]["name"] for r in a + b] == ["a0", "a1", "a2", "b0", "b1"]
+    assert alone["data"] == {"route": "create_cube.v2"}
+    assert sorted(handler.calls) == ["batch.execute", "batch.execute", "create_cube.v2"]
+    assert coalescer.stats()["batches"] == 2
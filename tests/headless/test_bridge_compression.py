@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+import json
+import threading
+import zlib
+from http.server import ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge import compression
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+from mcpbla.server.mcp_server import create_app
+
+_OBJECTS = [{"name": f"Cube.{i:05d}", "type": "MESH", "location": [i, 0.0, 0.0]} for i in range(2000)]
+
+
+class _SnapshotHandler(_BridgeRequestHandler):
+    request_encodings = []
+
+    @staticmethod
+    def route_handler(route, payload):
+        if route == "scene.snapshot.v2":
+            return {"ok": True, "data": {"objects": _OBJECTS}}
+        return {"ok": True, "data": {"received": len(payload.get("actions", []))}}
+
+    def do_POST(self):  # noqa: N802
+        _SnapshotHandler.request_encodings.append(self.headers.get("Content-Encoding"))
+        super().do_POST()
+
+
+@pytest.fixture()
+def listener():
+    _SnapshotHandler.request_encodings = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SnapshotHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_large_bridge_payloads_are_compressed_both_ways(listener):
+    handler = HttpBridgeHandler(listener, timeout=2.0)
+    assert handler("system.ping", {})["ok"] is True
+    snapshot = handler("scene.snapshot.v2", {})
+    assert snapshot["data"]["objects"] == _OBJECTS
+    big_batch = {"actions": [{"route": "create_cube.v2", "payload": {"name": f"C{i}"}} for i in range(2000)]}
+    assert handler("batch.execute", big_batch)["data"] == {"received": 2000}
+    # Small requests stay plain; the large batch goes out gzip once the listener advertised support.
+    assert _SnapshotHandler.request_encodings == [None, None, "gzip"]
+
+    conn = handler.pool.acquire()[0]
+    body = json.dumps({"route": "scene.snapshot.v2", "payload": {}}).encode()
+    conn.request("POST", "/bridge/route", body=body, headers={"Accept-Encoding": "deflate"})
+    resp = conn.getresponse()
+    raw = resp.read()
+    assert resp.getheader("Content-Encoding") == "deflate"
+    assert len(raw) < len(json.dumps(_OBJECTS)) / 4
+    assert json.loads(zlib.decompress(raw))["data"]["objects"] == _OBJECTS
+    conn.close()
+    handler.close()
+
+
+def test_async_bridge_call_decodes_compressed_response(listener):
+    handler = HttpBridgeHandler(listener, timeout=2.0)
+
+    async def run():
+        try:
+            return await handler.acall("scene.snapshot.v2", {})
+        finally:
+            await handler.aclose()
+
+    assert asyncio.run(run())["data"]["objects"] == _OBJECTS
+
+
+def test_server_accepts_gzip_snapshot_upload():
+    client = TestClient(create_app(bridge_enabled=False))
+    snapshot = {"session_id": "gz", "objects": _OBJECTS, "metadata": {}}
+    resp = client.post(
+        "/blender/scene_snapshot",
+        content=gzip.compress(json.dumps(snapshot).encode()),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["Accept-Encoding"] == compression.ACCEPT_ENCODING
+    assert client.post("/blender/scene_snapshot", content=b"x", headers={"Content-Encoding": "br"}).status_code == 415
+
+
+def test_stream_decoder_enforces_size_limit():
+    bomb = gzip.compress(b"\0" * 1_000_000)
+    decoder = compression.StreamDecoder("gzip", max_size=10_000)
+    with pytest.raises(ValueError):
+        decoder.feed(bomb)
+    assert compression.encode_body(b"{}", "gzip") == (b"{}", None)
+    assert compression.parse_accept_encoding("br, deflate;q=0.5, gzip") == ["gzip", "deflate"]
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+from mcpbla.server.bridge.latency import LatencyHistogram, RouteLatencyTracker
+
+
+class _SlowFirstHandler(_BridgeRequestHandler):
+    calls = 0
+    lock = threading.Lock()
+
+    @staticmethod
+    def route_handler(route, payload):
+        with _SlowFirstHandler.lock:
+            _SlowFirstHandler.calls += 1
+            first = _SlowFirstHandler.calls == 1
+        if route == "sleepy.v2" or first:
+            time.sleep(0.6)
+        return {"ok": True, "data": {"route": route}}
+
+
+class _QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        pass  # the client hangs up on timed-out and losing hedged requests
+
+
+def _start_listener(handler_cls):
+    server = _QuietServer(("127.0.0.1", 0), handler_cls)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _primed(route, seconds, **options):
+    tracker = RouteLatencyTracker(2.0, min_samples=5, **options)
+    for _ in range(5):
+        tracker.record(route, seconds)
+    return tracker
+
+
+def test_histogram_percentiles_and_adaptive_deadline():
+    hist = LatencyHistogram()
+    for ms in range(1, 1001):
+        hist.record(ms / 1000)
+    assert abs(hist.percentile(50) - 0.5) < 0.5 * 0.07
+    assert abs(hist.percentile(99) - 0.99) < 0.99 * 0.07
+
+    tracker = RouteLatencyTracker(5.0, factor=3.0, floor=0.1, ceiling=10.0, min_samples=5)
+    assert tracker.timeout_for("system.ping") == 5.0
+    for _ in range(5):
+        tracker.record("system.ping", 0.002)
+        tracker.record("render.preview.v2", 8.0)
+    assert tracker.timeout_for("system.ping") == 0.1
+    assert tracker.timeout_for("render.preview.v2") == 10.0
+
+
+def test_fast_route_fails_fast_on_adaptive_deadline():
+    server = _start_listener(_SlowFirstHandler)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        handler = HttpBridgeHandler(base, timeout=5.0, max_attempts=1, latency=_primed("sleepy.v2", 0.001, floor=0.05))
+        start = time.perf_counter()
+        resp = handler("sleepy.v2", {})
+        assert resp["code"] == "BRIDGE_TIMEOUT"
+        assert time.perf_counter() - start < 0.4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_hedged_read_returns_first_reply():
+    _SlowFirstHandler.calls = 0
+    server = _start_listener(_SlowFirstHandler)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        handler = HttpBridgeHandler(base, timeout=5.0, hedge=True, latency=_primed("scene.snapshot.v2", 0.01))
+        start = time.perf_counter()
+        assert handler("scene.snapshot.v2", {})["ok"] is True
+        assert time.perf_counter() - start < 0.4
+        assert (handler.hedged, handler.hedge_wins) == (1, 1)
+        # Mutating routes are never duplicated.
+        assert handler("move_object.v2", {})["ok"] is True
+        assert handler.hedged == 1
+
+        _SlowFirstHandler.calls = 0
+        resp = asyncio.run(handler.acall("scene.snapshot.v2", {}))
+        assert resp["ok"] is True
+        assert (handler.hedged, handler.hedge_wins) == (2, 2)
+        handler.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,128 @@
+import types
+
+from mcpbla.blender.addon.ares_runtime.datafirst import properties_datafirst
+from mcpbla.server.bridge import pool_v2
+from mcpbla.server.core.engines.property_engine import PropertyEngine
+
+
+class _Block:
+    def __init__(self, name):
+        self.name = name
+        self.location = [0.0, 0.0, 0.0]
+        self.hide_render = False
+        self.data = types.SimpleNamespace(energy=10.0)
+
+    def path_resolve(self, path):
+        obj = self
+        for part in path.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+
+class _BlockCollection:
+    """Mimics ``bpy_prop_collection`` column access (float properties only)."""
+
+    def __init__(self, names):
+        self.items = {name: _Block(name) for name in names}
+        self.column_writes = 0
+
+    def keys(self):
+        return list(self.items)
+
+    def get(self, name):
+        return self.items.get(name)
+
+    def _check(self, attr):
+        if not isinstance(getattr(next(iter(self.items.values())), attr), list):
+            raise TypeError(f"foreach only supports float arrays, not '{attr}'")
+
+    def foreach_get(self, attr, out):
+        self._check(attr)
+        flat = [v for block in self.items.values() for v in getattr(block, attr)]
+        out[:] = flat
+
+    def foreach_set(self, attr, values):
+        self._check(attr)
+        self.column_writes += 1
+        width = len(values) // len(self.items)
+        for i, block in enumerate(self.items.values()):
+            setattr(block, attr, list(values[i * width : (i + 1) * width]))
+
+
+def _fake_bpy(monkeypatch, names):
+    objects = _BlockCollection(names)
+    updates = []
+    bpy = types.SimpleNamespace(
+        data=types.SimpleNamespace(objects=objects),
+        context=types.SimpleNamespace(view_layer=types.SimpleNamespace(update=lambda: updates.append(1))),
+    )
+    monkeypatch.setattr(properties_datafirst, "bpy", bpy)
+    return objects, updates
+
+
+def test_plain_attributes_use_one_foreach_set_and_keep_other_items(monkeypatch):
+    objects, updates = _fake_bpy(monkeypatch, [f"O{i}" for i in range(100)])
+    names = [f"O{i}" for i in range(0, 100, 2)] + ["Missing"]
+    values = [float(v) for i in range(len(names)) for v in (i, 0, 1)]
+
+    resp = properties_datafirst.set_properties_bulk([{"collection": "objects", "names": names, "path": "location", "values": values}])
+
+    write = resp["data"]["writes"][0]
+    assert write["mode"] == "foreach" and write["count"] == 50 and write["missing"] == ["Missing"]
+    assert objects.column_writes == 1 and updates == [1]
+    assert objects.get("O2").location == [1.0, 0.0, 1.0]
+    assert objects.get("O1").location == [0.0, 0.0, 0.0]
+
+
+def test_nested_and_unsupported_paths_fall_back_to_a_loop(monkeypatch):
+    objects, updates = _fake_bpy(monkeypatch, ["A", "B"])
+    resp = properties_datafirst.set_properties_bulk(
+        [
+            {"collection": "objects", "names": ["A", "B"], "path": "data.energy", "values": [100.0, 200.0]},
+            {"collection": "objects", "names": ["B"], "path": "hide_render", "values": [1]},
+        ]
+    )
+    assert [w["mode"] for w in resp["data"]["writes"]] == ["loop", "loop"]
+    assert objects.get("B").data.energy == 200.0 and objects.get("B").hide_render == 1
+    assert objects.column_writes == 0 and updates == []
+
+
+def test_engine_validates_and_flattens_columns(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    sent = []
+    pool_v2.get_bridge_pool_v2().set_handler(lambda route, payload: sent.append((route, payload)) or {"ok": True, "data": {}})
+    engine = PropertyEngine()
+
+    assert engine.set_column("objects", ["A", "B"], "scale", [[1, 1, 1], [2, 2, 2]]).ok
+    route, payload = sent[0]
+    assert route == "properties.set_bulk.v2"
+    assert payload["payload"]["writes"][0]["values"] == [1, 1, 1, 2, 2, 2]
+
+    assert engine.set_column("objects", ["A", "B"], "scale", [1, 2, 3]).ok is False
+    assert engine.set_column("window_managers", ["A"], "scale", [1]).ok is False
+    assert len(sent) == 1
+
+
+def test_bad_write_is_rejected_before_any_write_is_applied(monkeypatch):
+    objects, updates = _fake_bpy(monkeypatch, ["A", "B"])
+    good = {"collection": "objects", "names": ["A"], "path": "location", "values": [5.0, 0.0, 0.0]}
+    for bad in (
+        {"collection": "nope", "names": ["A"], "path": "location", "values": [1.0]},
+        {"collection": "objects", "names": [], "path": "location", "values": []},
+        {"collection": "objects", "names": ["A", "B"], "path": "location", "values": [1.0, 2.0, 3.0]},
+    ):
+        assert properties_datafirst.set_properties_bulk([good, bad])["ok"] is False
+    assert objects.get("A").location == [0.0, 0.0, 0.0] and objects.column_writes == 0 and updates == []
+
+
+def test_failure_midway_reports_the_writes_already_applied(monkeypatch):
+    objects, updates = _fake_bpy(monkeypatch, ["A", "B"])
+    resp = properties_datafirst.set_properties_bulk(
+        [
+            {"collection": "objects", "names": ["A"], "path": "location", "values": [5.0, 0.0, 0.0]},
+            {"collection": "objects", "names": ["A"], "path": "data.missing.energy", "values": [1.0]},
+        ]
+    )
+    assert resp["ok"] is False and "data.missing.energy" in resp["error"]
+    assert [w["path"] for w in resp["data"]["writes"]] == ["location"]
+    assert objects.get("A").location == [5.0, 0.0, 0.0] and updates == [1]
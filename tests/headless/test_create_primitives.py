@@ -0,0 +1,111 @@
+import asyncio
+import types
+
+from mcpbla.blender.addon.ares_runtime.datafirst import actions_datafirst
+from mcpbla.blender.addon.ares_runtime.helpers import object_utils
+from mcpbla.server.bridge import pool_v2
+from mcpbla.server.core.contracts.geometry_contract import CreatePrimitivesContract
+from mcpbla.server.tools.action_tools import get_tools
+
+
+class _Objects(list):
+    def link(self, obj):
+        self.append(obj)
+
+    def foreach_set(self, attr, values):
+        assert len(values) == 3 * len(self)
+        for i, obj in enumerate(self):
+            setattr(obj, attr, list(values[3 * i : 3 * i + 3]))
+
+
+class _Collection:
+    def __init__(self, name):
+        self.name = name
+        self.objects = _Objects()
+        self.children = _Objects()
+
+
+class _FakeBpy:
+    """Just enough of ``bpy.data``/``bpy.context`` for bulk object creation."""
+
+    def __init__(self):
+        self.meshes, self.collections = [], {}
+        self.data = types.SimpleNamespace(
+            meshes=types.SimpleNamespace(new=self._new_mesh),
+            objects=types.SimpleNamespace(new=lambda name, mesh: types.SimpleNamespace(name=name, data=mesh)),
+            collections=types.SimpleNamespace(
+                get=self.collections.get,
+                new=lambda name: self.collections.setdefault(name, _Collection(name)),
+                remove=lambda coll: self.collections.pop(coll.name),
+            ),
+        )
+        self.context = types.SimpleNamespace(scene=types.SimpleNamespace(collection=_Collection("Scene")))
+
+    def _new_mesh(self, name):
+        mesh = types.SimpleNamespace(name=name, from_pydata=lambda *args: None, update=lambda: None)
+        self.meshes.append(mesh)
+        return mesh
+
+
+def test_bulk_cubes_share_meshes_and_get_bulk_transforms(monkeypatch):
+    bpy = _FakeBpy()
+    monkeypatch.setattr(actions_datafirst, "bpy", bpy)
+    monkeypatch.setattr(object_utils, "bpy", bpy)
+    contract = CreatePrimitivesContract(
+        names=[f"Crowd{i}" for i in range(1000)],
+        sizes=[1.0 if i % 2 else 2.0 for i in range(1000)],
+        locations=[[i, 0, 0] for i in range(1000)],
+        collection="Crowd",
+    ).validate()
+
+    data = contract.data
+    resp = actions_datafirst.create_primitives(
+        data["names"], data["sizes"], locations=data["locations"], collection=data["collection"]
+    )
+
+    assert resp["ok"] and resp["data"]["count"] == 1000 and resp["data"]["meshes"] == 2
+    assert len(bpy.meshes) == 2
+    crowd = bpy.collections["Crowd"]
+    assert bpy.context.scene.collection.children == [crowd]
+    assert [obj.location for obj in crowd.objects[:2]] == [[0, 0, 0], [1, 0, 0]]
+    assert crowd.objects[0].data is crowd.objects[2].data
+    assert "mcpbla_bulk_staging" not in bpy.collections
+
+
+def test_contract_rejects_mismatched_arrays():
+    assert CreatePrimitivesContract(names=["A", "B"], sizes=[1.0]).validate().ok is False
+    assert CreatePrimitivesContract(names=["A", "A"]).validate().ok is False
+    assert CreatePrimitivesContract(names=["A"], locations=[[0, 0]]).validate().ok is False
+    flat = CreatePrimitivesContract(names=["A", "B"], scales=[[1, 1, 1], [2, 2, 2]]).validate()
+    assert flat.data["scales"] == [1.0, 1.0, 1.0, 2.0, 2.0, 2.0] and flat.data["sizes"] == [1.0, 1.0]
+
+
+def test_create_primitives_tool_sends_one_bridge_call(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    calls = []
+
+    def handler(route, payload):
+        calls.append((route, payload))
+        return {"ok": True, "data": {"count": len(payload["payload"]["names"])}}
+
+    pool_v2.get_bridge_pool_v2().set_handler(handler)
+    tool = next(t for t in get_tools() if t.name == "create_primitives")
+
+    resp = asyncio.run(tool.handler({"names": ["A", "B", "C"], "sizes": 0.5, "locations": [[0, 0, 0]] * 3}))
+    assert resp["ok"] and resp["result"] == {"count": 3}
+    assert [route for route, _ in calls] == ["create_primitives.v2"]
+    assert calls[0][1]["payload"]["locations"] == [0.0] * 9
+
+    bad = asyncio.run(tool.handler({"names": ["A"], "sizes": [1, 2]}))
+    assert bad["code"] == "INVALID_ARG"
+
+
+def test_addon_rejects_bad_transform_arrays_before_creating(monkeypatch):
+    bpy = _FakeBpy()
+    created = []
+    bpy.data.objects.new = lambda name, mesh: created.append(name)
+    monkeypatch.setattr(actions_datafirst, "bpy", bpy)
+    monkeypatch.setattr(object_utils, "bpy", bpy)
+    resp = actions_datafirst.create_primitives(["A", "B"], [1.0, 1.0], locations=[0, 0, 0, 1, 0, 0], scales=[1, 1, 1])
+    assert resp["ok"] is False and "scales" in resp["error"]
+    assert created == [] and bpy.meshes == []
@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+
+from mcpbla.server import mcp_server
+from mcpbla.server.bridge.events import EventBus
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+from mcpbla.server.mcp_server import create_app
+
+
+def test_emit_many_hands_each_batch_subscriber_one_call():
+    bus = EventBus()
+    batches, named, singles = [], [], []
+    bus.subscribe_many("*", batches.append)
+    bus.subscribe_many("object.created", named.append)
+    bus.subscribe("*", lambda name, data: singles.append(name))
+
+    events = [("object.created", {"name": "A"}), ("object.transformed", {"name": "A"}), ("object.created", {"name": "B"})]
+    assert bus.emit_many(events) == 3
+
+    assert batches == [events]
+    assert named == [[events[0], events[2]]]
+    assert singles == ["object.created", "object.transformed", "object.created"]
+
+    bus.emit("object.created", {"name": "C"})
+    assert batches[-1] == [("object.created", {"name": "C"})]
+
+
+def test_scenegraph_batch_matches_event_by_event_application():
+    events = [("object.created", {"name": "Cube"})]
+    events += [("object.transformed", {"name": "Cube", "location": [i, 0, 0]}) for i in range(1000)]
+    events += [("object.transformed", {"name": "Ghost", "location": [1, 1, 1]}), ("object.created", {"name": "Ghost"})]
+    events += [("object.transformed", {"name": "Ghost", "location": [2, 2, 2]})]
+
+    batched, sequential = SceneGraphLiveV3(), SceneGraphLiveV3()
+    batched.on_events(events)
+    for name, data in events:
+        sequential.on_event(name, data)
+
+    # A folded run of transforms is one revision, so only the entries are compared.
+    batched_state, sequential_state = batched.describe(), sequential.describe()
+    assert batched_state.pop("revision") < sequential_state.pop("revision")
+    assert batched_state == sequential_state
+    assert batched.get("Cube")["location"] == [999, 0, 0]
+    assert batched.get("Ghost")["location"] == [2, 2, 2]
+
+
+def test_bridge_events_endpoint_publishes_one_batch(monkeypatch):
+    bus = EventBus()
+    received = []
+    bus.subscribe_many("*", received.append)
+    monkeypatch.setattr(mcp_server, "EVENT_BUS", bus)
+    client = TestClient(create_app(bridge_enabled=False))
+
+    body = [{"type": "event", "event": "object.transformed", "data": {"name": f"O{i}"}} for i in range(100)]
+    resp = client.post("/bridge/events", json=body + [{"data": {}}])
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": False, "accepted": 100, "rejected": [100]}
+    assert len(received) == 1 and len(received[0]) == 100
+
+    assert client.post("/bridge/events", json={"event": "x"}).status_code == 400
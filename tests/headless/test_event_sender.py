@@ -0,0 +1,111 @@
+import threading
+import time
+from urllib import error
+
+from mcpbla.blender.addon.bridge.event_emitter import EventSender
+
+
+class _SlowClient:
+    """Fake BridgeClient whose requests take ``delay`` seconds."""
+
+    def __init__(self, delay=0.0, batch_route=True):
+        self.delay = delay
+        self.batch_route = batch_route
+        self.batches = []
+        self.singles = []
+        self.lock = threading.Lock()
+
+    def send_events(self, messages):
+        time.sleep(self.delay)
+        if not self.batch_route:
+            raise RuntimeError("HTTP error 404") from error.HTTPError("u", 404, "Not Found", None, None)
+        with self.lock:
+            self.batches.append(messages)
+        return {"ok": True}
+
+    def send_event(self, event_name, data, correlation_id=None):
+        with self.lock:
+            self.singles.append(event_name)
+        return {"ok": True}
+
+
+def _sender(client, **kwargs):
+    return EventSender(client_factory=lambda: client, broadcast=lambda message: False, **kwargs)
+
+
+def test_enqueue_does_not_wait_for_a_slow_server_and_batches_by_size():
+    client = _SlowClient(delay=0.2)
+    sender = _sender(client, batch_size=10, flush_interval=5.0)
+
+    start = time.perf_counter()
+    for i in range(30):
+        assert sender.enqueue("object.created", {"name": f"Cube{i}"})
+    assert time.perf_counter() - start < 0.05
+
+    assert sender.flush(timeout=5)
+    sender.close()
+    assert [len(b) for b in client.batches] == [10, 10, 10]
+    assert sender.stats()["sent"] == 30
+
+
+def test_flushes_on_time_and_collapses_same_subject_events():
+    client = _SlowClient()
+    sender = _sender(client, batch_size=100, flush_interval=0.05)
+    for i in range(50):
+        sender.enqueue("object.transformed", {"name": "Cube", "location": [i, 0, 0]})
+    sender.enqueue("object.transformed", {"name": "Sphere", "location": [1, 1, 1]})
+
+    deadline = time.time() + 2
+    while not client.batches and time.time() < deadline:
+        time.sleep(0.01)
+    sender.close()
+
+    (batch,) = client.batches
+    assert [m["data"]["name"] for m in batch] == ["Cube", "Sphere"]
+    assert batch[0]["data"]["location"] == [49, 0, 0]
+    assert sender.stats()["deduped"] == 49
+
+
+def test_overflow_drops_and_counts_without_blocking():
+    client = _SlowClient(delay=0.3)
+    sender = _sender(client, max_queue=5, batch_size=5, flush_interval=5.0)
+    accepted = [sender.enqueue("log", {"i": i}) for i in range(20)]
+    # At most five events wait while the sender is stuck on a slow request; the rest are dropped.
+    assert accepted.count(False) == sender.stats()["dropped"] > 0
+    sender.close()
+
+
+def test_falls_back_to_single_posts_without_batch_route():
+    client = _SlowClient(batch_route=False)
+    sender = _sender(client, batch_size=2, flush_interval=0.01)
+    for i in range(4):
+        sender.enqueue("log", {"i": i})
+    assert sender.flush(timeout=5)
+    sender.close()
+    assert client.singles == ["log"] * 4
+    assert sender.stats()["batch_endpoint"] is False
+
+
+def test_distinct_subjects_are_kept_and_collapsed_state_moves_last():
+    client = _SlowClient()
+    sender = _sender(client, batch_size=100, flush_interval=5.0)
+    sender.enqueue("object.transformed", {"name": "Cube", "location": [1, 0, 0]})
+    sender.enqueue("material.updated", {"object": "Cube", "material": "M1"})
+    sender.enqueue("material.updated", {"object": "Cube", "material": "M2"})
+    sender.enqueue("node.created", {"material": "M1", "type": "ShaderNodeBsdfPrincipled"})
+    sender.enqueue("node.created", {"material": "M1", "type": "ShaderNodeTexNoise"})
+    sender.enqueue("modifier.applied", {"object": "Cube", "modifier": "Bevel"})
+    sender.enqueue("modifier.applied", {"object": "Cube", "modifier": "Array"})
+    sender.enqueue("object.deleted", {"name": "Cube"})
+    sender.enqueue("object.created", {"name": "Cube"})
+    sender.enqueue("object.transformed", {"name": "Cube", "location": [2, 0, 0]})
+    assert sender.flush(timeout=5)
+    sender.close()
+
+    events = [(m["event"], m["data"]) for batch in client.batches for m in batch]
+    assert len(events) == 9 and sender.stats()["deduped"] == 1
+    assert events[-3:] == [
+        ("object.deleted", {"name": "Cube"}),
+        ("object.created", {"name": "Cube"}),
+        ("object.transformed", {"name": "Cube", "location": [2, 0, 0]}),
+    ]
@@ -0,0 +1,117 @@
+import socket
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+
+
+class _ShortIdleHandler(_BridgeRequestHandler):
+    timeout = 0.1
+
+
+def _start_listener(handler_cls=_BridgeRequestHandler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_http_bridge_reuses_keepalive_connection():
+    server = _start_listener()
+    try:
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+        for _ in range(5):
+            resp = handler("system.ping", {})
+            assert resp.get("ok") is True
+        stats = handler.pool.stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 4
+        handler.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_bridge_reconnects_after_stale_socket():
+    server = _start_listener(_ShortIdleHandler)
+    try:
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0, max_attempts=1)
+        assert handler("system.ping", {}).get("ok") is True
+        # The listener drops the idle keep-alive socket before it is reused.
+        time.sleep(0.3)
+        assert handler("system.ping", {}).get("ok") is True
+        assert handler.pool.stats()["created"] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_bridge_pool_evicts_idle_connections():
+    server = _start_listener()
+    try:
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0, idle_timeout=0.0)
+        handler("system.ping", {})
+        handler("system.ping", {})
+        stats = handler.pool.stats()
+        assert stats["evicted"] == 1
+        assert stats["created"] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_bridge_unreachable_returns_code():
+    handler = HttpBridgeHandler("http://127.0.0.1:1", timeout=0.2)
+    resp = handler("system.ping", {})
+    assert resp["ok"] is False
+    assert resp["code"] == "BRIDGE_UNREACHABLE"
+    assert resp["details"]["attempts"] == 2
+
+
+def _start_dropping_listener(received):
+    """Answer the first request on each connection, then read the next one and hang up without a reply."""
+    sock = socket.create_server(("127.0.0.1", 0))
+
+    def serve(conn):
+        with conn, conn.makefile("rb") as reader:
+            for index in range(2):
+                headers = []
+                while True:
+                    line = reader.readline()
+                    if not line:
+                        return
+                    if line == b"\r\n":
+                        break
+                    headers.append(line)
+                length = next(int(h.split(b":")[1]) for h in headers if h.lower().startswith(b"content-length"))
+                received.append(reader.read(length))
+                if index:
+                    return
+                body = b'{"ok": true, "data": {}}'
+                conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+
+    def accept():
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    return sock
+
+
+def test_http_bridge_does_not_replay_a_sent_mutating_request():
+    received = []
+    sock = _start_dropping_listener(received)
+    try:
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{sock.getsockname()[1]}", timeout=2.0)
+        assert handler("object.create", {}).get("ok") is True
+        resp = handler("object.create", {})
+        assert resp["ok"] is False and resp["details"]["attempts"] == 1
+        assert len(received) == 2
+        handler.close()
+    finally:
+        sock.close()
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from mcpbla.blender.addon.bridge import main_thread
+from mcpbla.blender.addon.bridge.main_thread import MainThreadDispatcher
+
+
+class _FakeTimers:
+    """Stand-in for ``bpy.app.timers`` with a pump standing in for Blender's event loop."""
+
+    def __init__(self):
+        self.due = {}
+
+    def register(self, fn, first_interval=0.0, persistent=False):
+        self.due[fn] = time.perf_counter() + first_interval
+
+    def unregister(self, fn):
+        self.due.pop(fn, None)
+
+    def is_registered(self, fn):
+        return fn in self.due
+
+    def pump(self, until):
+        while not until():
+            for fn, due in list(self.due.items()):
+                if time.perf_counter() >= due:
+                    interval = fn()
+                    if interval is None:
+                        self.unregister(fn)
+                    else:
+                        self.due[fn] = time.perf_counter() + interval
+            time.sleep(0.0005)
+
+
+class _FakeClock:
+    """Dispatcher clock that only moves when a job says it took time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            return self.now
+
+    def advance(self, seconds):
+        with self._lock:
+            self.now += seconds
+
+
+def _bpy_op(i):
+    assert threading.current_thread() is threading.main_thread()
+    time.sleep(0.001)
+    return {"ok": True, "data": i}
+
+
+def test_worker_requests_run_on_main_thread_within_tick_budget():
+    timers, clock = _FakeTimers(), _FakeClock()
+    dispatcher = MainThreadDispatcher(timers=timers, budget=0.005, idle_interval=0.002, clock=clock)
+    assert dispatcher.start() is True
+    results = {}
+
+    def op(i):
+        clock.advance(0.001)
+        return _bpy_op(i)
+
+    def worker(offset):
+        for i in range(offset, offset + 25):
+            results[i] = dispatcher.call(op, i, timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(n * 25,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    timers.pump(until=lambda: len(results) == 200)
+    for t in threads:
+        t.join()
+    dispatcher.stop()
+
+    assert [results[i]["data"] for i in range(200)] == list(range(200))
+    stats = dispatcher.stats()
+    assert stats["processed"] == 200
+    assert stats["ticks"] < 200  # several items per tick
+    # UI responsiveness: on the dispatcher's own clock a tick stops once the
+    # budget is spent, so it runs at most one item past it.
+    assert stats["tick_max_ms"] <= 5.0 + 1.0
+
+
+def test_tick_stops_when_its_budget_is_spent():
+    clock = _FakeClock()
+    dispatcher = MainThreadDispatcher(timers=_FakeTimers(), budget=0.005, clock=clock)
+    dispatcher.start()
+    worker = threading.Thread(target=lambda: [dispatcher.submit(clock.advance, 0.001) for _ in range(12)])
+    worker.start()
+    worker.join()
+    done = []
+    for _ in range(3):
+        dispatcher._tick()
+        done.append(dispatcher.stats()["processed"])
+    dispatcher.stop()
+    assert done == [5, 10, 12]
+
+
+def test_runs_inline_when_stopped_or_already_on_main_thread():
+    dispatcher = MainThreadDispatcher(timers=_FakeTimers())
+    assert dispatcher.call(_bpy_op, 1)["data"] == 1
+    dispatcher.start()
+    assert dispatcher.call(_bpy_op, 2)["data"] == 2  # the test itself runs on the main thread
+    assert dispatcher.stats()["queue_depth"] == 0
+    dispatcher.stop()
+
+
+def test_stalled_main_thread_times_out_and_stop_fails_pending(monkeypatch):
+    timers = _FakeTimers()
+    dispatcher = MainThreadDispatcher(timers=timers, call_timeout=0.05)
+    dispatcher.start()
+    monkeypatch.setattr(main_thread, "DISPATCHER", dispatcher)
+    out = {}
+
+    def worker():
+        out["routed"] = main_thread.dispatch_route(lambda route, payload: {"ok": True}, "create_cube.v2", {})
+        out["pending"] = dispatcher.submit(_bpy_op, 2)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert out["routed"]["error"]["code"] == "MAIN_THREAD_TIMEOUT"
+    assert dispatcher.stats()["queue_depth"] == 2  # the timed-out item stays queued but cancelled
+    dispatcher.stop()
+    with pytest.raises(RuntimeError):
+        out["pending"].result(timeout=1)
@@ -0,0 +1,155 @@
+import asyncio
+import copy
+import types
+
+from mcpbla.blender.addon.ares_runtime.datafirst import materials_datafirst
+from mcpbla.blender.addon.ares_runtime.helpers import material_utils
+from mcpbla.blender.addon.bridge import event_emitter, handlers_v2
+from mcpbla.server.bridge import pool_v2
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+from mcpbla.server.tools.action_tools import _assign_material_handler
+
+_NODE_TYPES = {
+    "ShaderNodeBsdfPrincipled": ("BSDF_PRINCIPLED", ["Base Color"], ["BSDF"]),
+    "ShaderNodeOutputMaterial": ("OUTPUT_MATERIAL", ["Surface"], []),
+    "ShaderNodeTexNoise": ("TEX_NOISE", ["Scale"], ["Fac"]),
+    "ShaderNodeValToRGB": ("VALTORGB", ["Fac"], ["Color"]),
+}
+
+
+class _Nodes(list):
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+
+    def __iter__(self):
+        self.tree.scans += 1
+        return super().__iter__()
+
+    def new(self, type):
+        kind, inputs, outputs = _NODE_TYPES[type]
+        node = types.SimpleNamespace(
+            type=kind,
+            inputs={name: types.SimpleNamespace(default_value=None) for name in inputs},
+            outputs={name: object() for name in outputs},
+        )
+        if kind == "VALTORGB":
+            node.color_ramp = types.SimpleNamespace(elements=[types.SimpleNamespace(color=None) for _ in range(2)])
+        self.tree.created += 1
+        self.append(node)
+        return node
+
+
+class _Material:
+    def __init__(self, registry, name):
+        self.registry, self._name = registry, name
+        self.use_nodes = self.use_fake_user = False
+        self.node_tree = types.SimpleNamespace(nodes=None, links=types.SimpleNamespace(new=lambda a, b: None), scans=0, created=0)
+        self.node_tree.nodes = _Nodes(self.node_tree)
+        self.node_tree.nodes.new("ShaderNodeBsdfPrincipled")
+        self.node_tree.nodes.new("ShaderNodeOutputMaterial")
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self.registry.pop(self._name, None)
+        self.registry[value] = self
+        self._name = value
+
+    def copy(self):
+        dup = copy.deepcopy(self)
+        dup.registry = self.registry
+        dup.node_tree.scans = dup.node_tree.created = 0
+        self.registry.copies += 1
+        self.registry.add(dup, self.name + ".001")
+        return dup
+
+
+class _Materials(dict):
+    copies = 0
+
+    def add(self, mat, name):
+        mat._name = name
+        self[name] = mat
+
+    def new(self, name):
+        mat = _Material(self, name)
+        self[name] = mat
+        return mat
+
+
+def _fake_bpy(monkeypatch, n_objects):
+    materials = _Materials()
+    objects = {f"O{i}": types.SimpleNamespace(name=f"O{i}", data=types.SimpleNamespace(materials=[])) for i in range(n_objects)}
+    bpy = types.SimpleNamespace(data=types.SimpleNamespace(materials=materials, objects=objects))
+    for module in (materials_datafirst, material_utils):
+        monkeypatch.setattr(module, "bpy", bpy)
+    monkeypatch.setattr(material_utils, "_TEMPLATES", {})
+    monkeypatch.setattr(material_utils, "_NODE_INDEX", {})
+    return materials, objects
+
+
+def test_new_materials_are_copied_from_one_template(monkeypatch):
+    materials, objects = _fake_bpy(monkeypatch, 500)
+    for i in range(500):
+        recipe = "noise" if i % 2 else "principled"
+        resp = materials_datafirst.assign_material(f"O{i}", f"M{i}", [i / 500, 0.5, 2.0], recipe, {"scale": 9})
+        assert resp["ok"] and resp["data"]["material"] == f"M{i}"
+
+    assert materials.copies == 500
+    assert sorted(material_utils._TEMPLATES) == ["noise", "principled"]
+    m1, m2 = materials["M1"], materials["M2"]
+    assert m1.node_tree.created == 0 and not m1.use_fake_user
+    ramp = next(n for n in m1.node_tree.nodes if n.type == "VALTORGB")
+    assert ramp.color_ramp.elements[-1].color == (1 / 500, 0.5, 1.0, 1.0)
+    assert next(n for n in m1.node_tree.nodes if n.type == "TEX_NOISE").inputs["Scale"].default_value == 9.0
+    assert m2.node_tree.nodes[0].inputs["Base Color"].default_value == (2 / 500, 0.5, 1.0, 1.0)
+    assert objects["O2"].data.materials == [m2]
+
+    assert materials_datafirst.assign_material("O0", "M0", [1, 0, 0], "marble")["ok"] is False
+
+
+def test_existing_material_lookups_use_the_node_index_until_invalidated(monkeypatch):
+    materials, _ = _fake_bpy(monkeypatch, 1)
+    materials_datafirst.assign_material("O0", "Red", [1, 0, 0])
+    tree = materials["Red"].node_tree
+    scans, created = tree.scans, tree.created
+    for _ in range(10):
+        materials_datafirst.assign_material("O0", "Red", [0, 1, 0])
+    assert tree.scans == scans and tree.created == created
+    assert tree.nodes[0].inputs["Base Color"].default_value == (0.0, 1.0, 0.0, 1.0)
+
+    monkeypatch.setattr(material_utils.bpy, "types", types.SimpleNamespace(Material=_Material), raising=False)
+    depsgraph = types.SimpleNamespace(updates=[types.SimpleNamespace(id=materials["Red"])])
+    material_utils._on_depsgraph_update(None, depsgraph)
+    assert "Red" not in material_utils._NODE_INDEX
+    materials_datafirst.assign_material("O0", "Red", [0, 0, 1])
+    assert tree.scans == scans + 1
+
+
+def test_assign_material_tool_reaches_the_template_cache_through_the_bridge(monkeypatch):
+    materials, objects = _fake_bpy(monkeypatch, 1)
+    # Outside Blender the addon route module cannot import its runtime; hand it the data-first module.
+    monkeypatch.setattr(handlers_v2, "materials_datafirst", materials_datafirst)
+    routes, events = [], []
+    emitter = types.SimpleNamespace(emit=lambda name, data: events.append(name))
+    monkeypatch.setattr(event_emitter.SENDER, "enqueue", lambda name, data: events.append(name))
+
+    def handler(route, payload):
+        routes.append(route)
+        return handlers_v2.handle_route(route, payload, emitter)
+
+    pool = BridgePoolV2()
+    pool.set_handler(handler)
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", pool)
+    args = {"object": "O0", "material": "Stone", "color": [0.2, 0.4, 0.6], "recipe": "noise", "noise_scale": 7}
+    resp = asyncio.run(_assign_material_handler(args))
+
+    assert resp["ok"] is True and routes == ["assign_material.v2"] and events == ["material.updated"]
+    assert list(material_utils._TEMPLATES) == ["noise"] and materials.copies == 1
+    stone = materials["Stone"]
+    assert next(n for n in stone.node_tree.nodes if n.type == "TEX_NOISE").inputs["Scale"].default_value == 7.0
+    assert objects["O0"].data.materials == [stone]
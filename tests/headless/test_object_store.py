@@ -0,0 +1,66 @@
+from mcpbla.server.bridge.object_store import ColumnarMap, ObjectChunk
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _obj(i, **extra):
+    return {"name": f"Obj.{i:03d}", "type": "MESH", "location": [float(i), 0.0, 0.0], "rotation_euler": [0.0, 0.0, 0.0], "scale": [1.0, 1.0, 1.0], **extra}
+
+
+def test_records_round_trip_through_columns():
+    odd = [
+        {"name": "Empty"},
+        {"name": "Cam", "type": "CAMERA", "location": None, "lens": 50},
+        {"name": "Alias", "type": 7, "scale": [1, 2]},
+        _obj(1, material="Rust"),
+    ]
+    store = ColumnarMap.from_dict({("Renamed" if r["name"] == "Alias" else r["name"]): r for r in odd})
+    assert list(store.values()) == odd
+    assert store["Renamed"] == {"name": "Alias", "type": 7, "scale": [1, 2]}
+
+    record = store["Obj.001"]
+    record["location"][0] = 99.0
+    assert store["Obj.001"]["location"] == [1.0, 0.0, 0.0]  # fresh dict per access
+    row = store.row("Obj.001")
+    assert (row.name, row.type, row.vector("location"), row.vector("scale")) == ("Obj.001", "MESH", (1.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+    assert store.row("Empty").vector("location") is None and store.row("Missing") is None
+
+
+def test_chunk_reuses_freed_slots_and_copies_independently():
+    chunk = ObjectChunk((f"Obj.{i:03d}", _obj(i)) for i in range(4))
+    clone = chunk.copy()
+    assert chunk.pop("Obj.001")["name"] == "Obj.001"
+    chunk["New"] = {"name": "New", "location": [5, 5, 5]}
+    assert chunk.slots["New"] == 1 and list(chunk) == ["Obj.000", "Obj.002", "Obj.003", "New"]
+    assert clone["Obj.001"] == _obj(1) and "New" not in clone
+
+
+def test_columns_scan_without_building_records():
+    store = ColumnarMap.from_dict({f"Obj.{i:03d}": _obj(i) for i in range(200)})
+    evolver = store.evolver()
+    evolver.discard("Obj.000")
+    evolver["Obj.001"] = _obj(1, location=[7, 7, 7])
+    names, column = evolver.persistent().column("location")
+    assert names[0] == "Obj.001" and list(column[:3]) == [7.0, 7.0, 7.0] and len(column) == 3 * 199
+    assert store["Obj.001"]["location"] == [1.0, 0.0, 0.0]
+
+
+def test_scenegraph_switches_store_by_scene_size(monkeypatch):
+    monkeypatch.setenv("MCP_SCENEGRAPH_COLUMNAR_MIN", "50")
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot({"objects": [_obj(i) for i in range(10)]})
+    assert sg.store == "dict"
+
+    sg.apply_snapshot({"objects": [_obj(i) for i in range(100)]})
+    rev = sg.revision
+    sg.on_events([("object.transformed", {"name": "Obj.005", "location": [1, 2, 3]}), ("object.created", {"name": "Lamp"})])
+    assert sg.store == "columnar" and sg.last_snapshot["objects"] is None and sg.last_snapshot["objects_count"] == 100
+    assert sg.get("Obj.005")["location"] == [1.0, 2.0, 3.0] and sg.get("Lamp") == {"name": "Lamp", "event": "created"}
+    delta = sg.describe(since=rev)
+    assert [o["name"] for o in delta["changed"]["objects"]] == ["Obj.005"]
+    assert [o["name"] for o in delta["added"]["objects"]] == ["Lamp"]
+    assert [o["name"] for o in sg.find("obj 042")] == ["Obj.042"]
+    assert len(sg.describe()["objects"]) == 101
+
+    monkeypatch.setenv("MCP_SCENEGRAPH_STORE", "dict")
+    sg.apply_snapshot({"objects": [_obj(i) for i in range(100)]})
+    assert sg.store == "dict"
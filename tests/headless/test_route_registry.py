@@ -0,0 +1,38 @@
+import pytest
+
+from mcpbla.blender.addon.bridge import handlers_v2
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(handlers_v2, "_ROUTES", dict(handlers_v2._ROUTES))
+    monkeypatch.setattr(handlers_v2, "_ROUTE_STATS", {})
+    return handlers_v2
+
+
+def test_decorated_routes_dispatch_and_are_counted(registry):
+    seen = []
+
+    @registry.register_route("animation.keyframe.v2")
+    def _keyframe(route, payload, emitter):
+        seen.append((route, payload["frame"], emitter))
+        return {"ok": payload["frame"] > 0}
+
+    emitter = object()
+    assert registry.handle_route("animation.keyframe.v2", {"frame": 3}, emitter=emitter) == {"ok": True}
+    assert registry.handle_route("animation.keyframe.v2", {"frame": 0})["ok"] is False
+    assert seen[0] == ("animation.keyframe.v2", 3, emitter)
+
+    stats = registry.handle_route("bridge.stats", {})["data"]["routes"]
+    assert stats["animation.keyframe.v2"]["calls"] == 2
+    assert stats["animation.keyframe.v2"]["errors"] == 1
+    assert "dispatcher" in registry.handle_route("bridge.stats", {})["data"]
+
+    with pytest.raises(ValueError):
+        registry.register_route("animation.keyframe.v2")(_keyframe)
+
+
+def test_unknown_route_is_reported_without_touching_stats(registry):
+    resp = registry.handle_route("nope.v2", {})
+    assert resp["error"]["code"] == "UNKNOWN_ROUTE"
+    assert "nope.v2" not in registry.route_stats()
@@ -0,0 +1,74 @@
+import pytest
+
+from mcpbla.server.bridge import scene_delta
+from mcpbla.server.bridge.scene_delta import SnapshotDiffer, compute_delta, fingerprint
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _obj(name, x=0.0, **extra):
+    return {"name": name, "type": "MESH", "location": [x, 0.0, 0.0], "scale": [1.0, 1.0, 1.0], **extra}
+
+
+def test_fingerprint_treats_lists_as_tuples_and_canonicalizes_nested_dicts():
+    a = {"name": "A", "location": [1.0, 2.0, 3.0], "props": {"x": 1, "y": [2]}}
+    b = {"name": "A", "location": (1.0, 2.0, 3.0), "props": {"y": (2,), "x": 1}}
+    assert fingerprint(a) == fingerprint(b)
+    assert fingerprint(a) != fingerprint({**a, "location": [1.0, 2.0, 3.5]})
+
+
+def test_fingerprint_mode_sees_changes_between_equal_python_hashes():
+    assert hash(-1) == hash(-2)
+    differ = SnapshotDiffer(fingerprints=True)
+    differ.diff({"objects": [_obj("A", x=-1.0), _obj("B", tag=-1)]})
+    delta = differ.diff({"objects": [_obj("A", x=-2.0), _obj("B", tag=-2)]})
+    assert delta["objects_changed"] == [
+        {"name": "A", "set": {"location": [-2.0, 0.0, 0.0]}},
+        {"name": "B", "set": {"tag": -2}},
+    ]
+
+
+@pytest.mark.parametrize("fingerprints", [False, True])
+def test_diff_reports_field_level_patches(fingerprints):
+    differ = SnapshotDiffer(fingerprints=fingerprints)
+    assert differ.diff({"objects": [_obj("A"), _obj("B"), _obj("C", material="Old")]})["objects_added"][0]["name"] == "A"
+
+    # Same content with another key order is not a change.
+    reordered = dict(reversed(list(_obj("A").items())))
+    delta = differ.diff({"objects": [reordered, _obj("B", x=2.0, material="Rust"), _obj("C"), _obj("D")]})
+    assert delta["objects_added"] == [_obj("D")]
+    assert delta["objects_removed"] == []
+    assert delta["objects_changed"] == [
+        {"name": "B", "set": {"location": [2.0, 0.0, 0.0], "material": "Rust"}},
+        {"name": "C", "set": {}, "unset": ["material"]},
+    ]
+    assert differ.diff({"objects": [_obj("A")]})["objects_removed"] == ["B", "C", "D"]
+    if fingerprints:
+        keys, hashes = differ.objects["A"]
+        assert keys == tuple(_obj("A")) and len(hashes) == len(keys)
+
+
+def test_compute_delta_keeps_no_state_between_calls():
+    s1 = {"objects": [_obj(f"O{i}") for i in range(100)]}
+    s2 = {"objects": [_obj(f"O{i}", x=float(i == 7)) for i in range(100)]}
+    s3 = {"objects": [_obj(f"O{i}", x=float(i == 7)) for i in range(99)]}
+    assert compute_delta(s1, s2)["objects_changed"] == [{"name": "O7", "set": {"location": [1.0, 0.0, 0.0]}}]
+    assert compute_delta(s2, s3) == {"objects_added": [], "objects_removed": ["O99"], "objects_changed": []}
+    assert compute_delta(s1, s2)["objects_changed"] == [{"name": "O7", "set": {"location": [1.0, 0.0, 0.0]}}]
+    assert not hasattr(scene_delta, "_LAST")
+
+
+def test_apply_delta_patches_stored_records():
+    sg = SceneGraphLiveV3()
+    old = {"objects": [_obj("A"), _obj("B", material="Rust")]}
+    new = {"objects": [_obj("A", x=5.0), _obj("B"), _obj("C")]}
+    sg.apply_snapshot(old)
+    rev = sg.revision
+
+    sg.apply_delta(compute_delta(old, new))
+    assert sg.get("A") == _obj("A", x=5.0) and sg.get("B") == _obj("B") and sg.get("C") == _obj("C")
+    assert sg.find("rust") == [] and old["objects"][0]["location"] == [0.0, 0.0, 0.0]
+    changes = sg.describe(since=rev)
+    assert [o["name"] for o in changes["changed"]["objects"]] == ["A", "B"]
+
+    sg.apply_delta({"objects_changed": [{"name": "Ghost", "set": {"location": [1, 1, 1]}}]})
+    assert sg.get("Ghost") is None
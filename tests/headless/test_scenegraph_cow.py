@@ -0,0 +1,98 @@
+import threading
+
+from mcpbla.server.bridge import persistent_map
+from mcpbla.server.bridge.persistent_map import PersistentMap
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def test_persistent_map_shares_untouched_chunks_and_keeps_order():
+    base = PersistentMap.from_dict({f"k{i}": i for i in range(1000)})
+    evolver = base.evolver()
+    evolver["k5"] = -5
+    evolver.discard("k999")
+    evolver["new"] = 1
+    nxt = evolver.persistent()
+
+    assert base["k5"] == 5 and "k999" in base and len(base) == 1000
+    assert nxt["k5"] == -5 and "k999" not in nxt and len(nxt) == 1000
+    assert list(nxt)[:3] == ["k0", "k1", "k2"] and list(nxt)[-1] == "new"
+    shared = sum(a is b for a, b in zip(base._chunks, nxt._chunks))
+    assert shared == len(base._chunks) - 2  # only the chunk of k5 and the last one were copied
+    assert nxt == {**{f"k{i}": i for i in range(999)}, "k5": -5, "new": 1}
+
+
+def test_persistent_map_repacks_after_mass_removal():
+    base = PersistentMap.from_dict({i: i for i in range(5000)})
+    evolver = base.evolver()
+    for i in range(0, 5000, 5):
+        evolver[i] = -i
+    for i in range(4500):
+        evolver.discard(i)
+    small = evolver.persistent()
+    assert len(small) == 500 and len(small._chunks) <= 500 // persistent_map.CHUNK + 1
+    assert list(small.values())[:2] == [-4500, 4501] and small[4995] == -4995
+
+
+def test_views_are_stable_while_the_graph_moves_on():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot({"objects": [{"name": f"O{i}", "location": [0, 0, 0]} for i in range(200)]})
+    before = sg.view()
+    record = before.objects["O7"]
+
+    sg.on_events([("object.transformed", {"name": "O7", "location": [1, 1, 1]}), ("object.created", {"name": "New"})])
+    sg.apply_delta({"objects_removed": ["O8"]})
+
+    assert record["location"] == [0, 0, 0] and before.objects["O7"] is record
+    assert len(before.describe()["objects"]) == 200 and before.get("New") is None
+    assert sg.get("O7")["location"] == [1, 1, 1] and sg.get("O8") is None
+    assert sg.view().objects._chunks[-1] is not before.objects._chunks[-1]
+    assert sg.view().objects._chunks[1] is before.objects._chunks[1]
+
+
+def test_concurrent_readers_see_whole_revisions():
+    sg = SceneGraphLiveV3()
+    names = [f"Crate.{i:04d}" for i in range(2000)]
+    sg.apply_snapshot({"objects": [{"name": n, "type": "MESH", "location": [0, 0, 0]} for n in names]})
+    errors = []
+    stop = threading.Event()
+
+    def writer():
+        for step in range(1, 60):
+            # Every object moves in one batch, so a consistent view never mixes two steps.
+            sg.on_events([("object.transformed", {"name": n, "location": [step, 0, 0]}) for n in names])
+            sg.on_event("object.created", {"name": f"Barrel.{step}"})
+        stop.set()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                view = sg.view()
+                xs = {obj["location"][0] for obj in view.objects.values() if obj["name"].startswith("Crate")}
+                assert len(xs) == 1, xs
+                assert view.describe(since=max(0, view.revision - 3))["revision"] == view.revision
+                sg.find("barrel", limit=5)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+            stop.set()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)] + [threading.Thread(target=writer)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sg.get("Crate.0001")["location"] == [59, 0, 0] and sg.find("barrel 59")[0]["name"] == "Barrel.59"
+
+
+def test_searches_leave_the_shared_vocabulary_to_the_writer():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot({"objects": [{"name": f"Crate.{i}", "type": "MESH"} for i in range(100)]})
+    sg.on_event("object.created", {"name": "Barrel"})
+    # The write already merged its token; readers find nothing to maintain.
+    words = sg.index.words
+    assert "barrel" in words and words == sorted(words)
+    for query in ("bar", "cra", "mesh 5", "barrle"):
+        sg.find(query)
+    assert sg.index.words is words
+    sg.on_event("object.created", {"name": "Anvil"})
+    assert sg.index.words is not words and "anvil" not in words and sg.find("anv")[0]["name"] == "Anvil"
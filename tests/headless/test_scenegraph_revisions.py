@@ -0,0 +1,60 @@
+from mcpbla.server.bridge import scenegraph_live_v3
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _snapshot(names, **extra):
+    return {"objects": [{"name": n, "type": "MESH", **extra.get(n, {})} for n in names]}
+
+
+def test_every_mutation_path_bumps_the_revision():
+    sg = SceneGraphLiveV3()
+    assert sg.describe()["revision"] == 0
+    sg.apply_snapshot(_snapshot(["A", "B"]))
+    sg.apply_delta({"objects_added": [{"name": "C"}]})
+    sg.on_event("object.created", {"name": "D"})
+    sg.on_event("unrelated.event", {})
+    sg.on_events([("object.transformed", {"name": "A", "location": [1, 0, 0]})] * 3)
+    assert sg.revision == 4
+
+
+def test_describe_since_returns_only_added_changed_and_removed_entries():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot(_snapshot(["A", "B", "C"]))
+    rev = sg.revision
+
+    sg.apply_snapshot(_snapshot(["A", "B", "D"], B={"location": [1, 2, 3]}))
+    sg.on_event("material.updated", {"material": "Red"})
+    delta = sg.describe(since=rev)
+    assert delta["full"] is False and delta["revision"] == rev + 2
+    assert [o["name"] for o in delta["added"]["objects"]] == ["D"]
+    assert [o["name"] for o in delta["changed"]["objects"]] == ["B"]
+    assert delta["removed"]["objects"] == ["C"]
+    assert [m["name"] for m in delta["added"]["materials"]] == ["Red"]
+    assert delta["last_snapshot"]["objects"][-1]["name"] == "D"
+
+    rev = sg.revision
+    sg.on_event("object.transformed", {"name": "A", "location": [5, 5, 5]})
+    delta = sg.describe(since=rev)
+    assert delta["changed"]["objects"] == [sg.get("A")] and "last_snapshot" not in delta
+    assert sg.describe(since=sg.revision)["changed"]["objects"] == []
+
+    # An entry removed and re-created after ``since`` is reported as added only.
+    rev = sg.revision
+    sg.apply_delta({"objects_removed": ["B"]})
+    sg.apply_delta({"objects_added": [{"name": "B"}]})
+    delta = sg.describe(since=rev)
+    assert [o["name"] for o in delta["added"]["objects"]] == ["B"] and delta["removed"]["objects"] == []
+
+
+def test_since_beyond_the_tombstone_history_falls_back_to_full(monkeypatch):
+    monkeypatch.setattr(scenegraph_live_v3, "MAX_TOMBSTONES", 4)
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot(_snapshot([f"O{i}" for i in range(10)]))
+    for i in range(6):
+        sg.apply_delta({"objects_removed": [f"O{i}"]})
+
+    old = sg.describe(since=1)
+    assert old["full"] is True and len(old["objects"]) == 4
+    recent = sg.describe(since=sg.revision - 2)
+    assert recent["full"] is False and recent["removed"]["objects"] == ["O4", "O5"]
+    assert sg.describe(since=sg.revision + 5)["full"] is True
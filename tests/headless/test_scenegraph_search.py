@@ -0,0 +1,59 @@
+import time
+
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+
+
+def _scene(n):
+    return {
+        "objects": [{"name": f"Crate.{i:06d}", "type": "MESH", "location": [i, 0, 0]} for i in range(n)]
+        + [{"name": "KeyLight", "type": "LIGHT"}, {"name": "MainCamera", "type": "CAMERA"}],
+        "materials": [{"name": "RustyMetal"}, {"name": "Glass"}],
+        "modifiers": [{"id": "Crate.000001:Bevel", "object": "Crate.000001", "type": "BEVEL"}],
+    }
+
+
+def test_exact_prefix_fuzzy_and_limit():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot(_scene(1000))
+
+    assert [o["name"] for o in sg.find("keylight")] == ["KeyLight"]
+    assert [o["name"] for o in sg.find("main")] == ["MainCamera"]
+    assert [m["name"] for m in sg.find("rustymetl")] == ["RustyMetal"]
+    assert sg.find("rustymetl", fuzzy=False) == []
+    assert len(sg.find("crate", limit=10)) == 10
+    assert len(sg.find("mesh", limit=None)) == 1000
+    assert [m.get("type") for m in sg.find("bevel")] == ["BEVEL"]
+    assert [o["name"] for o in sg.find("crate 000042")] == ["Crate.000042"]
+    # Locations are not indexed, so numbers only match names.
+    assert sg.find("1.0", limit=None) == []
+
+
+def test_index_follows_deltas_and_events():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot(_scene(3))
+    sg.apply_delta({"objects_added": [{"name": "Barrel", "type": "MESH"}], "objects_removed": ["KeyLight"]})
+    sg.on_event("material.updated", {"material": "Chrome"})
+    sg.on_event("node.added", {"material": "Chrome", "type": "ShaderNodeTexNoise", "node": "Noise"})
+
+    assert [o["name"] for o in sg.find("barrel")] == ["Barrel"]
+    assert sg.find("keylight") == []
+    assert [m.get("name") for m in sg.find("chrome")] == ["Chrome", None]
+    assert sg.find("shadernodetexnoise")[0]["node"] == "Noise"
+
+    # An object-only snapshot replaces objects and keeps what events built.
+    sg.apply_snapshot({"objects": [{"name": "Only"}]})
+    assert sg.find("barrel") == [] and [o["name"] for o in sg.find("only")] == ["Only"]
+    assert [m.get("name") for m in sg.find("chrome")] == ["Chrome", None]
+    sg.apply_snapshot({"objects": [{"name": "Only"}], "materials": [], "modifiers": [], "nodes": []})
+    assert len(sg.index) == 1
+
+
+def test_search_on_100k_entries_stays_fast():
+    sg = SceneGraphLiveV3()
+    sg.apply_snapshot(_scene(100_000))
+    sg.find("warmup")  # merge the vocabulary once
+    start = time.perf_counter()
+    for query in ("keylight", "crate.0999", "crate 0999", "maincamra", "mesh", "glass") * 25:
+        sg.find(query, limit=20)
+    per_query = (time.perf_counter() - start) / 150
+    assert per_query < 0.002
@@ -0,0 +1,127 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from mcpbla.server.bridge import bridge_pool, pool_v2, scenegraph_live
+from mcpbla.server.bridge.events import EventBus
+from mcpbla.server.bridge.scenegraph_live import SceneSnapshot
+from mcpbla.server.bridge.scenegraph_live_v3 import SCENEGRAPH, SceneGraphLiveV3
+from mcpbla.server.bridge.snapshot_stream import encode_records
+from mcpbla.server.mcp_server import create_app
+from mcpbla.server.tools.blender_tools import _get_last_scene_snapshot_handler
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    scenegraph_live.clear_registry()
+    yield
+    scenegraph_live.clear_registry()
+
+
+def _snapshot(session_id, xs, scene="Scene"):
+    objects = [{"name": f"Obj.{i}", "type": "MESH", "location": [x, 0.0, 0.0]} for i, x in enumerate(xs)]
+    return SceneSnapshot(session_id=session_id, objects=objects, metadata={"scene": scene})
+
+
+def _bus_with_graph():
+    bus, graph, seen = EventBus(), SceneGraphLiveV3(), []
+    bus.subscribe_many("*", graph.on_events)
+    bus.subscribe("*", lambda name, data: seen.append((name, data)))
+    return bus, graph, seen
+
+
+def test_ingest_emits_full_then_deltas_the_graph_can_apply():
+    bus, graph, seen = _bus_with_graph()
+    first = scenegraph_live.ingest_snapshot(_snapshot("a", [0.0, 0.0, 0.0]), bus)
+    assert (first["revision"], first["full"]) == (1, True)
+    second = scenegraph_live.ingest_snapshot(_snapshot("a", [0.0, 5.0]), bus)
+    assert second == {"revision": 2, "full": False, "added": 0, "removed": 1, "changed": 1}
+    assert [name for name, _ in seen] == ["scene.snapshot.completed", "scene.snapshot.delta"]
+    assert seen[1][1]["delta"]["objects_changed"] == [{"name": "Obj.1", "set": {"location": [5.0, 0.0, 0.0]}}]
+    assert sorted(graph.objects) == ["Obj.0", "Obj.1"]
+    assert graph.objects["Obj.1"]["location"] == [5.0, 0.0, 0.0]
+
+    # Another session replaces the single live scene, so it is sent whole.
+    assert scenegraph_live.ingest_snapshot(_snapshot("b", [1.0]), bus)["full"] is True
+    assert scenegraph_live.ingest_snapshot(_snapshot("a", [0.0, 6.0]), bus)["full"] is True
+    assert graph.objects["Obj.1"]["location"] == [6.0, 0.0, 0.0]
+
+
+def test_time_travel_within_the_kept_ring(monkeypatch):
+    monkeypatch.setenv("MCP_SNAPSHOT_HISTORY", "3")
+    bus = EventBus()
+    for step in range(6):
+        scenegraph_live.ingest_snapshot(_snapshot("t", [float(step)] * (step + 1), scene=f"S{step}"), bus)
+    assert scenegraph_live.get_history_range("t") == (3, 6)
+    for revision in range(3, 7):
+        state = scenegraph_live.get_snapshot_at("t", revision)
+        assert len(state.objects) == revision
+        assert {obj["location"][0] for obj in state.objects} == {float(revision - 1)}
+        assert state.metadata == {"scene": f"S{revision - 1}"}
+    assert scenegraph_live.get_snapshot_at("t", 2) is None
+    assert scenegraph_live.get_snapshot_at("t", 7) is None
+    assert len(scenegraph_live._HISTORY["t"].deltas) == 3
+
+
+def test_history_is_capped_by_delta_entries(monkeypatch):
+    monkeypatch.setenv("MCP_SNAPSHOT_HISTORY_OBJECTS", "10")
+    bus = EventBus()
+    for step in range(5):
+        scenegraph_live.ingest_snapshot(_snapshot("c", [float(step)] * 4), bus)
+    history = scenegraph_live._HISTORY["c"]
+    assert sum(len(delta["objects_changed"]) for _, delta, _ in history.deltas) <= 10
+    assert scenegraph_live.get_history_range("c") == (3, 5)
+    assert {obj["location"][0] for obj in scenegraph_live.get_snapshot_at("c", 3).objects} == {2.0}
+
+
+def test_tool_serves_revisions():
+    bus = EventBus()
+    for xs in ([0.0], [1.0], [2.0]):
+        scenegraph_live.ingest_snapshot(_snapshot("tool", xs), bus)
+    result = _get_last_scene_snapshot_handler({"session_id": "tool", "revision": 2})
+    assert result["ok"] is True
+    assert (result["result"]["revision"], result["result"]["objects"][0]["location"][0]) == (2, 1.0)
+    missing = _get_last_scene_snapshot_handler({"session_id": "tool", "revision": 9})
+    assert missing["ok"] is False and "1..3" in missing["error"]
+    assert _get_last_scene_snapshot_handler({"revision": 1})["ok"] is False
+
+
+def test_endpoint_emits_delta_to_live_scenegraph(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    monkeypatch.setattr(bridge_pool, "_DEFAULT_POOL", None)
+    client = TestClient(create_app(bridge_enabled=True))
+    body = {"session_id": "live", "objects": [{"name": "Cube", "location": [0, 0, 0]}], "metadata": {}}
+    assert client.post("/blender/scene_snapshot", json=body).json()["full"] is True
+    body["objects"] = [{"name": "Cube", "location": [1, 0, 0]}, {"name": "Lamp"}]
+    resp = client.post("/blender/scene_snapshot", json=body).json()
+    assert (resp["revision"], resp["full"], resp["added"], resp["changed"]) == (2, False, 1, 1)
+    assert SCENEGRAPH.objects["Cube"]["location"] == [1, 0, 0]
+    assert SCENEGRAPH.objects["Lamp"] == {"name": "Lamp"}
+
+
+def test_streamed_snapshot_is_published_before_later_deltas(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    monkeypatch.setattr(bridge_pool, "_DEFAULT_POOL", None)
+    client = TestClient(create_app(bridge_enabled=True))
+    records = [
+        {"type": "header", "session_id": "mixed", "metadata": {}},
+        {"type": "page", "objects": [{"name": "A", "location": [0, 0, 0]}, {"name": "B", "location": [0, 0, 0]}]},
+        {"type": "end", "count": 2},
+    ]
+    streamed = client.post("/blender/scene_snapshot/stream", content=encode_records(records)).json()
+    assert streamed["revision"] == 1
+    body = {"session_id": "mixed", "objects": [{"name": "A", "location": [3, 0, 0]}, {"name": "B", "location": [0, 0, 0]}], "metadata": {}}
+    resp = client.post("/blender/scene_snapshot", json=body).json()
+    assert (resp["revision"], resp["full"], resp["changed"]) == (2, False, 1)
+    assert SCENEGRAPH.objects["A"]["location"] == [3, 0, 0]
+    assert "B" in SCENEGRAPH.objects
+
+
+def test_object_only_snapshots_keep_entries_built_from_events():
+    bus, graph, _ = _bus_with_graph()
+    bus.emit("material.updated", {"object": "Obj.0", "material": "Stone"})
+    bus.emit("modifier.added", {"object": "Obj.0", "modifier": "BEVEL"})
+    scenegraph_live.ingest_snapshot(_snapshot("m", [0.0]), bus)
+    scenegraph_live.ingest_snapshot(_snapshot("other", [1.0]), bus, full=True)
+    assert "Stone" in graph.materials and len(graph.modifiers) == 1
+    graph.apply_snapshot({"objects": [], "materials": []})
+    assert graph.materials == {} and len(graph.modifiers) == 1
@@ -0,0 +1,67 @@
+import types
+
+from mcpbla.blender.addon.ares_runtime.datafirst import scene_datafirst
+
+
+class _Object:
+    def __init__(self, name, x=0.0):
+        self.name, self.type = name, "MESH"
+        self.location, self.rotation_euler, self.scale = [x, 0.0, 0.0], [0.0] * 3, [1.0] * 3
+
+
+class _Objects(dict):
+    def __iter__(self):
+        return iter(self.values())
+
+
+def _install(monkeypatch, n):
+    scene = types.SimpleNamespace(name="Scene", frame_current=1, objects=_Objects((f"O{i}", _Object(f"O{i}", i)) for i in range(n)))
+    handlers = types.SimpleNamespace(depsgraph_update_post=[], frame_change_post=[], load_post=[])
+    bpy = types.SimpleNamespace(
+        context=types.SimpleNamespace(scene=scene),
+        types=types.SimpleNamespace(Object=_Object, Scene=types.SimpleNamespace, Collection=_Objects),
+        app=types.SimpleNamespace(handlers=handlers),
+    )
+    monkeypatch.setattr(scene_datafirst, "bpy", bpy)
+    monkeypatch.setattr(scene_datafirst, "TRACKER", scene_datafirst._DirtyTracker())
+    scene_datafirst.register_handlers()
+    return scene, handlers
+
+
+def _update(handlers, scene, *blocks):
+    depsgraph = types.SimpleNamespace(updates=[types.SimpleNamespace(id=block) for block in blocks])
+    for fn in handlers.depsgraph_update_post:
+        fn(scene, depsgraph)
+
+
+def test_since_revision_returns_only_added_changed_and_removed(monkeypatch):
+    scene, handlers = _install(monkeypatch, 1000)
+    base = scene_datafirst.snapshot("s")["data"]
+    assert len(base["objects"]) == 1000
+
+    scene.objects["O5"].location[0] = 50.0
+    _update(handlers, scene, scene.objects["O5"])
+    del scene.objects["O7"]
+    scene.objects["New"] = _Object("New")
+    _update(handlers, scene, scene, scene.objects["New"])
+
+    delta = scene_datafirst.snapshot("s", since_revision=base["revision"])["data"]
+    assert delta["full"] is False and delta["revision"] == base["revision"] + 2
+    assert [o["name"] for o in delta["added"]] == ["New"]
+    assert [(o["name"], o["location"][0]) for o in delta["changed"]] == [("O5", 50.0)]
+    assert delta["removed"] == ["O7"] and "objects" not in delta
+
+    assert scene_datafirst.snapshot("s", since_revision=delta["revision"])["data"]["changed"] == []
+
+
+def test_stale_or_untracked_revisions_fall_back_to_a_full_snapshot(monkeypatch):
+    scene, handlers = _install(monkeypatch, 3)
+    rev = scene_datafirst.TRACKER.revision
+    for fn in handlers.frame_change_post:
+        fn(scene, None)
+    stale = scene_datafirst.snapshot("s", since_revision=rev)["data"]
+    assert stale["full"] is True and len(stale["objects"]) == 3
+
+    scene_datafirst.unregister_handlers()
+    assert handlers.depsgraph_update_post == []
+    assert scene_datafirst.snapshot("s", since_revision=stale["revision"])["data"]["full"] is True
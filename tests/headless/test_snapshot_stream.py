@@ -0,0 +1,101 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.server.bridge import bridge_pool, pool_v2, scenegraph_live
+from mcpbla.server.bridge.http_bridge import HttpBridgeHandler
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+from mcpbla.server.bridge.scenegraph_live_v3 import SceneGraphLiveV3
+from mcpbla.server.bridge.snapshot_stream import SnapshotStreamIngestor, encode_records
+from mcpbla.server.core.engines.scene_engine import SceneEngine
+from mcpbla.server.mcp_server import create_app
+
+
+def _records(session_id, count, page_size=100):
+    yield {"type": "header", "session_id": session_id or "default", "metadata": {"scene": "Scene"}}
+    for start in range(0, count, page_size):
+        yield {"type": "page", "objects": [{"name": f"Obj.{i}", "type": "MESH"} for i in range(start, min(count, start + page_size))]}
+    yield {"type": "end", "count": count}
+
+
+class _StreamingListener(_BridgeRequestHandler):
+    snapshot_records = staticmethod(lambda session_id, page_size: _records(session_id, 1050, page_size))
+
+
+def test_engine_pulls_paged_snapshot_from_listener():
+    scenegraph_live.clear_registry()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamingListener)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        handler = HttpBridgeHandler(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+        engine = SceneEngine()
+        engine.pool = BridgePoolV2()
+        engine.pool.set_handler(handler)
+        result = engine.snapshot_stream("farm", page_size=200)
+        assert result.ok is True
+        assert (result.data["objects_count"], result.data["pages"]) == (1050, 6)
+        assert len(scenegraph_live.get_snapshot("farm").objects) == 1050
+        # The streamed connection went back to the pool once fully read.
+        assert handler.pool.stats()["idle"] == 1
+        handler.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        scenegraph_live.clear_registry()
+
+
+def test_ingestor_handles_split_lines_and_keeps_state_on_truncation():
+    graph = SceneGraphLiveV3()
+    payload = b"".join(encode_records(_records("s", 30, page_size=7)))
+    ingestor = SnapshotStreamIngestor(graph)
+    for i in range(0, len(payload), 5):
+        ingestor.feed(payload[i : i + 5])
+    assert ingestor.close()["objects_count"] == 30
+    assert len(graph.objects) == 30 and "Obj.29" in graph.objects
+
+    truncated = SnapshotStreamIngestor(graph)
+    truncated.feed(b"".join(encode_records(list(_records("s", 50))[:-1])))
+    with pytest.raises(ValueError):
+        truncated.close()
+    assert len(graph.objects) == 30
+
+    mismatch = SnapshotStreamIngestor(graph)
+    with pytest.raises(ValueError):
+        mismatch.feed(b"".join(encode_records([*list(_records("s", 3))[:-1], {"type": "end", "count": 4}])))
+
+
+def test_server_ingests_streamed_upload(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    monkeypatch.setattr(bridge_pool, "_DEFAULT_POOL", None)
+    scenegraph_live.clear_registry()
+    client = TestClient(create_app(bridge_enabled=True))
+    resp = client.post(
+        "/blender/scene_snapshot/stream",
+        content=encode_records(_records("upload", 500)),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["objects_count"] == 500
+    assert len(scenegraph_live.get_snapshot("upload").objects) == 500
+    bad = client.post("/blender/scene_snapshot/stream", content=b'{"type": "page", "objects": []}\n')
+    assert bad.status_code == 400
+    scenegraph_live.clear_registry()
+
+
+def test_streamed_upload_reaches_the_tool_facing_scenegraph(monkeypatch):
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    monkeypatch.setattr(bridge_pool, "_DEFAULT_POOL", None)
+    scenegraph_live.clear_registry()
+    client = TestClient(create_app(bridge_enabled=True))
+    records = [
+        {"type": "header", "session_id": "tools", "metadata": {}},
+        {"type": "page", "objects": [{"name": "A", "type": "MESH"}, {"name": "B", "type": "LIGHT"}]},
+        {"type": "end", "count": 2},
+    ]
+    assert client.post("/blender/scene_snapshot/stream", content=encode_records(records)).status_code == 200
+    described = client.post("/tools/scenegraph_describe/invoke", json={"arguments": {}}).json()["result"]
+    assert {"A", "B"} <= {obj["name"] for obj in described["objects"]}
+    scenegraph_live.clear_registry()
@@ -0,0 +1,129 @@
+import sys
+import types
+
+from mcpbla.blender.addon.ares_runtime.helpers import undo_utils
+from mcpbla.blender.addon.bridge import handlers_v2
+from mcpbla.server.bridge import pool_v2
+from mcpbla.server.core.engines.action_engine_v3 import ActionEngineV3
+from mcpbla.server.orchestrator.orchestrator_v3 import OrchestratorV3
+from mcpbla.server.orchestrator.plan_v3 import TaskAction, TaskPlan
+
+
+class _FakeBpy:
+    def __init__(self):
+        self.undo_pushes = []
+        self.undos = 0
+        self.ops = types.SimpleNamespace(
+            ed=types.SimpleNamespace(undo_push=lambda message: self.undo_pushes.append(message), undo=self._undo)
+        )
+        edit = types.SimpleNamespace(use_global_undo=True, undo_steps=32, undo_memory_limit=0)
+        self.context = types.SimpleNamespace(preferences=types.SimpleNamespace(edit=edit))
+
+    def _undo(self):
+        self.undos += 1
+
+
+def _install(monkeypatch, fail_on=None):
+    bpy = _FakeBpy()
+    monkeypatch.setitem(sys.modules, "bpy", bpy)
+    monkeypatch.setattr(handlers_v2, "_REMOTE_TXN", None)
+
+    def create_cube(name, size):
+        if name == fail_on:
+            return {"ok": False, "error": f"cannot create {name}"}
+        bpy.global_undo_seen = bpy.context.preferences.edit.use_global_undo
+        undo_utils.push_undo_step("create_cube")
+        return {"ok": True, "data": {"name": name}}
+
+    monkeypatch.setattr(handlers_v2, "actions_datafirst", types.SimpleNamespace(create_cube=create_cube))
+    return bpy
+
+
+def _txn(op, **params):
+    return handlers_v2.handle_route("undo.transaction", {"payload": {"op": op, **params}})
+
+
+def _cube(name):
+    return handlers_v2.handle_route("create_cube.v2", {"payload": {"name": name, "size": 1}})
+
+
+def test_remote_transaction_records_one_step_and_aborts_back(monkeypatch):
+    bpy = _install(monkeypatch)
+    txn = _txn("begin", label="build street")["data"]
+    assert _txn("begin")["error"]["code"] == "TRANSACTION_OPEN"
+    for i in range(3):
+        assert _cube(f"C{i}")["ok"]
+    assert _txn("commit", id=txn["id"])["data"]["state"] == "committed"
+    assert bpy.undo_pushes == ["build street"]
+
+    txn = _txn("begin", label="try")["data"]
+    _cube("X")
+    resp = _txn("abort", id=txn["id"])
+    assert resp["data"]["rolled_back"] is True and bpy.undos == 1
+    assert _txn("commit")["error"]["code"] == "NO_TRANSACTION"
+    assert undo_utils.current_transaction() is None
+
+
+def test_failed_atomic_batch_inside_transaction_rolls_back_the_whole_task(monkeypatch):
+    bpy = _install(monkeypatch, fail_on="C1")
+    txn = _txn("begin", label="task")["data"]
+    batch = {"atomic": True, "actions": [{"route": "create_cube.v2", "payload": {"name": f"C{i}", "size": 1}} for i in range(3)]}
+    resp = handlers_v2.handle_route("batch.execute", batch)
+    assert resp["error"]["code"] == "BATCH_FAILED" and bpy.undos == 0
+
+    assert _txn("commit", id=txn["id"])["data"]["state"] == "aborted"
+    assert bpy.undos == 1 and bpy.undo_pushes == ["task", "task (aborted)"]
+
+
+def test_fast_batch_skips_undo_and_restores_the_preference(monkeypatch):
+    bpy = _install(monkeypatch)
+    batch = {"undo": False, "actions": [{"route": "create_cube.v2", "payload": {"name": f"C{i}", "size": 1}} for i in range(4)]}
+    assert handlers_v2.handle_route("batch.execute", batch)["ok"]
+    assert bpy.undo_pushes == [] and bpy.global_undo_seen is False
+    assert bpy.context.preferences.edit.use_global_undo is True
+
+    undo = handlers_v2.handle_route("system.ping", {})["data"]["undo"]
+    assert undo["fast"] >= 1 and undo["undo_steps"] == 32 and undo["open"] == []
+    assert "process_peak_rss_mb" in undo
+
+
+def test_orchestrator_plan_is_one_undo_step(monkeypatch):
+    bpy = _install(monkeypatch, fail_on="B")
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+
+    def handler(route, message):
+        body = message["payload"]
+        return handlers_v2.handle_route(route, body.get("params", body))
+
+    pool_v2.get_bridge_pool_v2().set_handler(handler)
+    orch = OrchestratorV3(engine=ActionEngineV3())
+
+    plan = TaskPlan(instruction="two cubes", actions=[TaskAction("create_cube", {"name": n, "size": 1}) for n in "AC"])
+    ok, _ = orch.execute(plan)
+    assert ok and bpy.undo_pushes == ["plan: two cubes"]
+
+    plan = TaskPlan(instruction="bad", actions=[TaskAction("create_cube", {"name": n, "size": 1}) for n in "AB"])
+    ok, _ = orch.execute(plan, atomic=True)
+    assert not ok and bpy.undos == 1 and undo_utils.current_transaction() is None
+
+
+def test_plan_fails_instead_of_joining_another_clients_transaction(monkeypatch):
+    bpy = _install(monkeypatch)
+    monkeypatch.setattr(pool_v2, "_DEFAULT_POOL_V2", None)
+    sent = []
+
+    def handler(route, message):
+        sent.append(route)
+        body = message["payload"]
+        return handlers_v2.handle_route(route, body.get("params", body))
+
+    pool_v2.get_bridge_pool_v2().set_handler(handler)
+    other = _txn("begin", label="other client")["data"]
+    assert _txn("abort")["error"]["code"] == "NO_TRANSACTION"
+
+    plan = TaskPlan(instruction="mine", actions=[TaskAction("create_cube", {"name": "A", "size": 1})])
+    ok, results = OrchestratorV3(engine=ActionEngineV3()).execute(plan, atomic=True)
+    assert not ok and results[0]["error"]["code"] == "TRANSACTION_OPEN"
+    assert sent == ["undo.transaction"]
+    assert _txn("commit", id=other["id"])["data"]["state"] == "committed"
+    assert bpy.undo_pushes == ["other client"] and bpy.undos == 0
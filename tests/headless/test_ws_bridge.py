@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+from mcpbla.blender.addon.bridge.http_server import _BridgeRequestHandler
+from mcpbla.blender.addon.bridge.ws_channel import broadcast_event
+from mcpbla.server.bridge.coalescer import coalesce_as
+from mcpbla.server.bridge.pool_v2 import BridgePoolV2
+from mcpbla.server.bridge.ws_bridge import WebSocketBridgeChannel
+from mcpbla.server.core.engines.action_engine_v3 import ActionEngineV3
+
+
+def _stand_in_route(route, payload):
+    if route == "batch.execute":
+        items = [{"ok": True, "data": {"route": a["route"]}, "request_id": a["correlation_id"]} for a in payload["actions"]]
+        return {"ok": True, "data": items}
+    params = payload.get("payload") or {}
+    time.sleep(params.get("delay", 0))
+    if route == "emit.v2":
+        broadcast_event({"type": "event", "event": "test.ws", "data": {"value": params.get("value")}})
+    return {"ok": True, "data": {"route": route, "tag": params.get("tag")}}
+
+
+class _StandInPeer(_BridgeRequestHandler):
+    route_handler = staticmethod(_stand_in_route)
+
+
+def _start_peer():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInPeer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_ws_channel_out_of_order_completion():
+    server = _start_peer()
+    channel = WebSocketBridgeChannel(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0, emit_acks=False)
+    done = []
+
+    def call(tag, delay):
+        resp = channel("tag.v2", {"payload": {"tag": tag, "delay": delay}})
+        done.append(resp["data"]["tag"])
+
+    try:
+        slow = threading.Thread(target=call, args=("slow", 0.3))
+        slow.start()
+        time.sleep(0.05)
+        call("fast", 0)
+        slow.join()
+        assert done == ["fast", "slow"]
+        stats = channel.stats()
+        assert (stats["connected"], stats["in_flight"]) == (True, 0)
+        assert stats["latency"]["tag.v2"]["count"] == 2
+    finally:
+        channel.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_ws_channel_events_and_async_calls():
+    server = _start_peer()
+    received = []
+    channel = WebSocketBridgeChannel(
+        f"http://127.0.0.1:{server.server_address[1]}",
+        timeout=2.0,
+        event_sink=lambda name, data: received.append((name, data)),
+    )
+
+    async def run():
+        return await asyncio.gather(*(channel.acall("emit.v2", {"payload": {"value": i}}) for i in range(3)))
+
+    try:
+        results = asyncio.run(run())
+        assert all(r["ok"] for r in results)
+        events = sorted(d["value"] for name, d in received if name == "test.ws")
+        assert events == [0, 1, 2]
+        assert sum(1 for name, _ in received if name == "ack") == 3
+    finally:
+        channel.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_ws_channel_acks_feed_action_engine_v3():
+    server = _start_peer()
+    channel = WebSocketBridgeChannel(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+    pool = BridgePoolV2()
+    pool.set_handler(channel)
+    engine = ActionEngineV3(wait_for_ack=True)
+    engine.pool = pool
+    try:
+        res = engine.execute("create_cube", {"name": "Cube"})
+        assert res.ok is True
+        assert res.data["route"] == "create_cube.v2"
+    finally:
+        channel.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_coalesced_actions_are_acked_one_by_one():
+    server = _start_peer()
+    channel = WebSocketBridgeChannel(f"http://127.0.0.1:{server.server_address[1]}", timeout=2.0)
+    pool = BridgePoolV2()
+    pool.set_handler(channel)
+    coalescer = pool.enable_coalescing(min_window=0.05)
+    engine = ActionEngineV3(wait_for_ack=True)
+    engine.pool = pool
+    results = []
+
+    def call(name):
+        with coalesce_as("session"):
+            results.append(engine.execute("create_cube", {"name": name}))
+
+    try:
+        threads = [threading.Thread(target=call, args=(n,)) for n in ("A", "B", "C")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert coalescer.stats()["batches"] == 1
+        assert [r.ok for r in results] == [True] * 3
+        assert all(r.data == {"route": "create_cube.v2"} for r in results)
+    finally:
+        pool.disable_coalescing()
+        channel.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_ws_channel_unreachable():
+    channel = WebSocketBridgeChannel("http://127.0.0.1:1", timeout=0.2)
+    resp = channel("system.ping", {})
+    assert resp["ok"] is False
+    assert resp["code"] == "BRIDGE_UNREACHABLE"